@@ -52,12 +52,13 @@ cdef inline int int_max(int a, int b): return a if a >= b else b
 cdef inline int int_min(int a, int b): return a if a <= b else b
 
 
-cdef extern from "src/headers/math.h":
+cdef extern from "src/headers/math.h" nogil:
     double sqrt(double x)
     double fabs(double)
     int signbit(double)
 
 from pandas import lib
+from pandas.tslib import _run_chunked
 
 include "skiplist.pyx"
 
@@ -779,14 +780,185 @@ def min_subseq(ndarray[double_t] arr):
 
     return (s, e, -m)
 
+#-------------------------------------------------------------------------------
+# Time based windows
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def roll_window_start(ndarray[int64_t] index, int64_t width):
+    """
+    Position of the first observation in the window (index[i] - width,
+    index[i]] ending at each observation of a monotonic i8 index, for the
+    rolling kernels' start argument
+    """
+    cdef:
+        Py_ssize_t i, j = 0
+        Py_ssize_t N = len(index)
+        ndarray[int64_t] start = np.empty(N, dtype=np.int64)
+
+    if width <= 0:
+        raise ValueError('window must be a positive duration')
+
+    # an observation is always in its own window, which bounds j
+    for i from 0 <= i < N:
+        while j < i and index[j] <= index[i] - width:
+            j += 1
+        start[i] = j
+
+    return start
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _roll_sum_variable(ndarray[double_t] input,
+                                ndarray[int64_t] start, int minp, bint avg):
+    cdef:
+        double val, result, sum_x = 0
+        Py_ssize_t i, j = 0, nobs = 0, neg_ct = 0
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp(N, minp, N)
+
+    for i from 0 <= i < N:
+        val = input[i]
+
+        if val == val:
+            nobs += 1
+            sum_x += val
+            if signbit(val):
+                neg_ct += 1
+
+        # drop what fell out of the window
+        while j < start[i]:
+            val = input[j]
+            if val == val:
+                nobs -= 1
+                sum_x -= val
+                if signbit(val):
+                    neg_ct -= 1
+            j += 1
+
+        if nobs < minp:
+            output[i] = NaN
+        elif not avg:
+            output[i] = sum_x
+        else:
+            result = sum_x / nobs
+            if neg_ct == 0 and result < 0:
+                # all positive
+                output[i] = 0
+            elif neg_ct == nobs and result > 0:
+                # all negative
+                output[i] = 0
+            else:
+                output[i] = result
+
+    return output
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _roll_var_variable(ndarray[double_t] input,
+                                ndarray[int64_t] start, int minp, int ddof):
+    cdef:
+        double val, sum_x = 0, sum_xx = 0, nobs = 0
+        Py_ssize_t i, j = 0
+        Py_ssize_t N = len(input)
+        ndarray[double_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp(N, minp, N)
+
+    for i from 0 <= i < N:
+        val = input[i]
+
+        if val == val:
+            nobs += 1
+            sum_x += val
+            sum_xx += val * val
+
+        while j < start[i]:
+            val = input[j]
+            if val == val:
+                nobs -= 1
+                sum_x -= val
+                sum_xx -= val * val
+            j += 1
+
+        if nobs >= minp:
+            # pathological case
+            if nobs == 1:
+                output[i] = 0
+                continue
+
+            val = (nobs * sum_xx - sum_x * sum_x) / (nobs * (nobs - ddof))
+            if val < 0:
+                val = 0
+
+            output[i] = val
+        else:
+            output[i] = NaN
+
+    return output
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _roll_max_variable(ndarray[float64_t] input,
+                                ndarray[int64_t] start, int minp,
+                                bint is_max):
+    """
+    Moving max (min) keeping the positions of the candidates in a
+    monotonic queue, so every observation is pushed and popped once
+    """
+    cdef:
+        float64_t val, prev
+        Py_ssize_t i, j = 0, head = 0, tail = 0, nobs = 0
+        Py_ssize_t N = len(input)
+        ndarray[int64_t] queue = np.empty(N, dtype=np.int64)
+        ndarray[float64_t] output = np.empty(N, dtype=float)
+
+    minp = _check_minp(N, minp, N)
+
+    for i from 0 <= i < N:
+        val = input[i]
+
+        if val == val:
+            nobs += 1
+
+            # candidates the new value beats can never be the answer again
+            while tail > head:
+                prev = input[queue[tail - 1]]
+                if (prev > val) if is_max else (prev < val):
+                    break
+                tail -= 1
+            queue[tail] = i
+            tail += 1
+
+        while j < start[i]:
+            if input[j] == input[j]:
+                nobs -= 1
+            j += 1
+
+        while head < tail and queue[head] < start[i]:
+            head += 1
+
+        if nobs >= minp:
+            output[i] = input[queue[head]]
+        else:
+            output[i] = NaN
+
+    return output
+
 #-------------------------------------------------------------------------------
 # Rolling sum
 
-def roll_sum(ndarray[double_t] input, int win, int minp):
+def roll_sum(ndarray[double_t] input, int win, int minp,
+             ndarray[int64_t] start=None):
     cdef double val, prev, sum_x = 0
     cdef int nobs = 0, i
     cdef int N = len(input)
 
+    if start is not None:
+        return _roll_sum_variable(input, start, minp, False)
+
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
 
     minp = _check_minp(win, minp, N)
@@ -825,12 +997,15 @@ def roll_sum(ndarray[double_t] input, int win, int minp):
 # Rolling mean
 
 def roll_mean(ndarray[double_t] input,
-               int win, int minp):
+               int win, int minp, ndarray[int64_t] start=None):
     cdef:
         double val, prev, result, sum_x = 0
         Py_ssize_t nobs = 0, i, neg_ct = 0
         Py_ssize_t N = len(input)
 
+    if start is not None:
+        return _roll_sum_variable(input, start, minp, True)
+
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
     minp = _check_minp(win, minp, N)
 
@@ -938,6 +1113,277 @@ def ewma(ndarray[double_t] input, double_t com, int adjust):
 
     return output
 
+#----------------------------------------------------------------------
+# 2D rolling kernels
+#
+# These walk each column of a (rows x columns) block in place through its
+# strides, so C- and F-ordered blocks need no per-column copies, and run
+# without the GIL, optionally on several threads across the columns. The
+# fixed windows are expressed as window start positions, which are shared
+# with the time based windows.
+
+cdef enum:
+    ROLL_SUM
+    ROLL_MEAN
+    ROLL_VAR
+    ROLL_MAX
+    ROLL_MIN
+    ROLL_EWMA
+
+def roll_sum_2d(ndarray[float64_t, ndim=2] values, int win, int minp,
+                ndarray[int64_t] start=None, int nthreads=1):
+    "Moving sum down each column of a 2D float64 array ignoring NaNs."
+    return _roll_2d(ROLL_SUM, values, win, minp, start, 1, 0, False,
+                    nthreads)
+
+def roll_mean_2d(ndarray[float64_t, ndim=2] values, int win, int minp,
+                 ndarray[int64_t] start=None, int nthreads=1):
+    "Moving mean down each column of a 2D float64 array ignoring NaNs."
+    return _roll_2d(ROLL_MEAN, values, win, minp, start, 1, 0, False,
+                    nthreads)
+
+def roll_var_2d(ndarray[float64_t, ndim=2] values, int win, int minp,
+                int ddof=1, ndarray[int64_t] start=None, int nthreads=1):
+    "Moving variance down each column of a 2D float64 array ignoring NaNs."
+    return _roll_2d(ROLL_VAR, values, win, minp, start, ddof, 0, False,
+                    nthreads)
+
+def roll_max_2d(ndarray[float64_t, ndim=2] values, int win, int minp,
+                ndarray[int64_t] start=None, int nthreads=1):
+    "Moving max down each column of a 2D float64 array ignoring NaNs."
+    return _roll_2d(ROLL_MAX, values, win, minp, start, 1, 0, False,
+                    nthreads)
+
+def roll_min_2d(ndarray[float64_t, ndim=2] values, int win, int minp,
+                ndarray[int64_t] start=None, int nthreads=1):
+    "Moving min down each column of a 2D float64 array ignoring NaNs."
+    return _roll_2d(ROLL_MIN, values, win, minp, start, 1, 0, False,
+                    nthreads)
+
+def ewma_2d(ndarray[float64_t, ndim=2] values, double_t com, int adjust,
+            int nthreads=1):
+    "ewma down each column of a 2D float64 array, see ewma."
+    return _roll_2d(ROLL_EWMA, values, 0, 0, None, 1, com, adjust,
+                    nthreads)
+
+cdef ndarray _roll_2d(int kind, ndarray values, int win, int minp,
+                      object start, int ddof, double com, bint adjust,
+                      int nthreads):
+    cdef:
+        Py_ssize_t N = values.shape[0], K = values.shape[1]
+        ndarray output = np.empty((N, K), dtype=np.float64, order='F')
+
+    if kind == ROLL_EWMA:
+        start = np.empty(0, dtype=np.int64)
+    elif start is None:
+        if win < 1:
+            raise ValueError('Invalid window size %d' % win)
+        minp = _check_minp(win, minp, N)
+        start = np.arange(N, dtype=np.int64) - (win - 1)
+        start[start < 0] = 0
+    else:
+        minp = _check_minp(N, minp, N)
+        start = np.ascontiguousarray(start, dtype=np.int64)
+
+    args = (kind, values, output, start, minp, ddof, com, adjust)
+
+    # the columns are split across the threads
+    _run_chunked(_roll_2d_chunk, K, nthreads, args, size=N * K)
+    return output
+
+def _roll_2d_chunk(int kind, ndarray values, ndarray output,
+                   ndarray[int64_t] start, int minp, int ddof, double com,
+                   bint adjust, Py_ssize_t k0, Py_ssize_t k1):
+    """
+    Columns k0 to k1 of the block, without the GIL
+    """
+    cdef:
+        Py_ssize_t k, N = values.shape[0]
+        Py_ssize_t xs0 = values.strides[0] // sizeof(double)
+        Py_ssize_t xs1 = values.strides[1] // sizeof(double)
+        Py_ssize_t os0 = output.strides[0] // sizeof(double)
+        Py_ssize_t os1 = output.strides[1] // sizeof(double)
+        double *x = <double*> values.data
+        double *out = <double*> output.data
+        int64_t *starts = <int64_t*> start.data
+        int64_t *queue
+        ndarray[int64_t] qbuf
+
+    # scratch space for the monotonic queue of max/min
+    if kind == ROLL_MAX or kind == ROLL_MIN:
+        qbuf = np.empty(N, dtype=np.int64)
+    else:
+        qbuf = np.empty(0, dtype=np.int64)
+    queue = <int64_t*> qbuf.data
+
+    with nogil:
+        for k in range(k0, k1):
+            if kind == ROLL_SUM or kind == ROLL_MEAN:
+                _roll_sum_col(x + k * xs1, xs0, out + k * os1, os0, N,
+                              starts, minp, kind == ROLL_MEAN)
+            elif kind == ROLL_VAR:
+                _roll_var_col(x + k * xs1, xs0, out + k * os1, os0, N,
+                              starts, minp, ddof)
+            elif kind == ROLL_MAX or kind == ROLL_MIN:
+                _roll_max_col(x + k * xs1, xs0, out + k * os1, os0, N,
+                              starts, minp, queue, kind == ROLL_MAX)
+            else:
+                _ewma_col(x + k * xs1, xs0, out + k * os1, os0, N, com,
+                          adjust)
+
+cdef void _roll_sum_col(double *x, Py_ssize_t xs, double *out,
+                        Py_ssize_t os, Py_ssize_t N, int64_t *start,
+                        int minp, bint avg) nogil:
+    cdef:
+        double val, result, sum_x = 0
+        Py_ssize_t i, j = 0, nobs = 0, neg_ct = 0
+
+    for i in range(N):
+        val = x[i * xs]
+
+        if val == val:
+            nobs += 1
+            sum_x += val
+            if signbit(val):
+                neg_ct += 1
+
+        while j < start[i]:
+            val = x[j * xs]
+            if val == val:
+                nobs -= 1
+                sum_x -= val
+                if signbit(val):
+                    neg_ct -= 1
+            j += 1
+
+        if nobs < minp:
+            out[i * os] = NaN
+        elif not avg:
+            out[i * os] = sum_x
+        else:
+            result = sum_x / nobs
+            if neg_ct == 0 and result < 0:
+                # all positive
+                out[i * os] = 0
+            elif neg_ct == nobs and result > 0:
+                # all negative
+                out[i * os] = 0
+            else:
+                out[i * os] = result
+
+cdef void _roll_var_col(double *x, Py_ssize_t xs, double *out,
+                        Py_ssize_t os, Py_ssize_t N, int64_t *start,
+                        int minp, int ddof) nogil:
+    cdef:
+        double val, sum_x = 0, sum_xx = 0, nobs = 0
+        Py_ssize_t i, j = 0
+
+    for i in range(N):
+        val = x[i * xs]
+
+        if val == val:
+            nobs += 1
+            sum_x += val
+            sum_xx += val * val
+
+        while j < start[i]:
+            val = x[j * xs]
+            if val == val:
+                nobs -= 1
+                sum_x -= val
+                sum_xx -= val * val
+            j += 1
+
+        if nobs >= minp:
+            # pathological case
+            if nobs == 1:
+                out[i * os] = 0
+                continue
+
+            val = (nobs * sum_xx - sum_x * sum_x) / (nobs * (nobs - ddof))
+            if val < 0:
+                val = 0
+
+            out[i * os] = val
+        else:
+            out[i * os] = NaN
+
+cdef void _roll_max_col(double *x, Py_ssize_t xs, double *out,
+                        Py_ssize_t os, Py_ssize_t N, int64_t *start,
+                        int minp, int64_t *queue, bint is_max) nogil:
+    cdef:
+        double val, prev
+        Py_ssize_t i, j = 0, head = 0, tail = 0, nobs = 0
+
+    for i in range(N):
+        val = x[i * xs]
+
+        if val == val:
+            nobs += 1
+
+            # candidates the new value beats can never be the answer again
+            while tail > head:
+                prev = x[queue[tail - 1] * xs]
+                if (prev > val) if is_max else (prev < val):
+                    break
+                tail -= 1
+            queue[tail] = i
+            tail += 1
+
+        while j < start[i]:
+            if x[j * xs] == x[j * xs]:
+                nobs -= 1
+            j += 1
+
+        while head < tail and queue[head] < start[i]:
+            head += 1
+
+        if nobs >= minp:
+            out[i * os] = x[queue[head] * xs]
+        else:
+            out[i * os] = NaN
+
+cdef void _ewma_col(double *x, Py_ssize_t xs, double *out, Py_ssize_t os,
+                    Py_ssize_t N, double com, bint adjust) nogil:
+    cdef:
+        double cur, prev, neww, oldw, adj
+        Py_ssize_t i
+
+    if N == 0:
+        return
+
+    neww = 1. / (1. + com)
+    oldw = 1. - neww
+    adj = oldw
+
+    if adjust:
+        out[0] = neww * x[0]
+    else:
+        out[0] = x[0]
+
+    for i in range(1, N):
+        cur = x[i * xs]
+        prev = out[(i - 1) * os]
+
+        if cur == cur:
+            if prev == prev:
+                out[i * os] = oldw * prev + neww * cur
+            else:
+                out[i * os] = neww * cur
+        else:
+            out[i * os] = prev
+
+    if adjust:
+        for i in range(N):
+            cur = x[i * xs]
+
+            if cur == cur:
+                out[i * os] = out[i * os] / (1. - adj)
+                adj *= oldw
+            else:
+                if i >= 1:
+                    out[i * os] = out[(i - 1) * os]
+
 #----------------------------------------------------------------------
 # Pairwise correlation/covariance
 
@@ -1063,11 +1509,15 @@ def nancorr_spearman(ndarray[float64_t, ndim=2] mat, Py_ssize_t minp=1):
 #----------------------------------------------------------------------
 # Rolling variance
 
-def roll_var(ndarray[double_t] input, int win, int minp, int ddof=1):
+def roll_var(ndarray[double_t] input, int win, int minp, int ddof=1,
+             ndarray[int64_t] start=None):
     cdef double val, prev, sum_x = 0, sum_xx = 0, nobs = 0
     cdef Py_ssize_t i
     cdef Py_ssize_t N = len(input)
 
+    if start is not None:
+        return _roll_var_variable(input, start, minp, ddof)
+
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
 
     minp = _check_minp(win, minp, N)
@@ -1384,7 +1834,8 @@ from libc cimport stdlib
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def roll_max2(ndarray[float64_t] a, int window, int minp):
+def roll_max2(ndarray[float64_t] a, int window, int minp,
+              ndarray[int64_t] start=None):
     "Moving max of 1d array of dtype=float64 along axis=0 ignoring NaNs."
     cdef np.float64_t ai, aold
     cdef Py_ssize_t count
@@ -1400,6 +1851,9 @@ def roll_max2(ndarray[float64_t] a, int window, int minp):
     cdef np.ndarray[np.float64_t, ndim=1] y = PyArray_EMPTY(1, dims,
 		NPY_float64, 0)
 
+    if start is not None:
+        return _roll_max_variable(a, start, minp, True)
+
     if window < 1:
         raise ValueError('Invalid window size %d'
                          % (window))
@@ -1485,7 +1939,8 @@ def roll_min(ndarray input, int win, int minp):
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def roll_min2(np.ndarray[np.float64_t, ndim=1] a, int window, int minp):
+def roll_min2(np.ndarray[np.float64_t, ndim=1] a, int window, int minp,
+              ndarray[int64_t] start=None):
     "Moving min of 1d array of dtype=float64 along axis=0 ignoring NaNs."
     cdef np.float64_t ai, aold
     cdef Py_ssize_t count
@@ -1501,6 +1956,9 @@ def roll_min2(np.ndarray[np.float64_t, ndim=1] a, int window, int minp):
     cdef np.ndarray[np.float64_t, ndim=1] y = PyArray_EMPTY(1, dims,
 		NPY_float64, 0)
 
+    if start is not None:
+        return _roll_max_variable(a, start, minp, False)
+
     if window < 1:
         raise ValueError('Invalid window size %d'
                          % (window))
@@ -1619,7 +2077,7 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int win,
     return output
 
 def roll_generic(ndarray[float64_t, cast=True] input, int win,
-                 int minp, object func):
+                 int minp, object func, ndarray[int64_t] start=None):
     cdef ndarray[double_t] output, counts, bufarr
     cdef Py_ssize_t i, n
     cdef float64_t *buf, *oldbuf
@@ -1633,6 +2091,20 @@ def roll_generic(ndarray[float64_t, cast=True] input, int win,
     if n == 0:
         return input
 
+    if start is not None:
+        minp = _check_minp(n, minp, n)
+        output = np.empty(n, dtype=float)
+        counts = roll_sum(np.isfinite(input).astype(float), n, minp,
+                          start=start)
+
+        for i from 0 <= i < n:
+            if counts[i] >= minp:
+                output[i] = func(input[start[i] : i + 1])
+            else:
+                output[i] = NaN
+
+        return output
+
     minp = _check_minp(win, minp, n)
     output = np.empty(n, dtype=float)
     counts = roll_sum(np.isfinite(input).astype(float), win, minp)
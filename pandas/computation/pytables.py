@@ -2,10 +2,12 @@
 
 import ast
 import time
+import numbers
 import warnings
 from functools import partial
-from datetime import datetime
+from datetime import datetime, date, timedelta
 
+import numpy as np
 import pandas as pd
 from pandas.compat import u, string_types, PY3
 from pandas.core.base import StringMixin
@@ -15,6 +17,30 @@ from pandas.computation.ops import is_term
 from pandas.computation.expr import BaseExprVisitor
 from pandas.computation.common import _ensure_decoded
 from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
+from pandas.util.misc import LRUCache
+
+# parsed syntax trees, keyed by the expression string
+_tree_cache = LRUCache(maxsize=256)
+
+# evaluated selection plans, keyed by the expression string, the schema of
+# the table and the values bound to the variables in the expression
+_plan_cache = LRUCache(maxsize=256)
+
+# variables bound to one of these types can be safely part of a plan key
+_bindable_types = (numbers.Number, np.bool_, np.datetime64, datetime, date,
+                   timedelta, type, type(None)) + string_types
+
+
+def _parse_tree(source):
+    """ return the (syntax tree, referenced names) of a pytables expression
+    string, caching the result """
+    result = _tree_cache.get(source)
+    if result is None:
+        tree = ast.fix_missing_locations(ast.parse(expr._preparse(source)))
+        names = tuple(sorted(set(node.id for node in ast.walk(tree)
+                                 if isinstance(node, ast.Name))))
+        result = _tree_cache[source] = tree, names
+    return result
 
 class Scope(expr.Scope):
     __slots__ = 'globals', 'locals', 'queryables'
@@ -462,12 +488,16 @@ class Expr(expr.Expr):
         self.filter = None
         self.terms = None
         self._visitor = None
+        self._plan_key = None
+        self._plan = None
 
         # capture the environement if needed
         lcls = dict()
+        bound = dict()
         if isinstance(where, Expr):
 
             lcls.update(where.env.locals)
+            bound.update(where._bound)
             where = where.expr
 
         elif isinstance(where, (list, tuple)):
@@ -475,6 +505,7 @@ class Expr(expr.Expr):
             for w in where:
                 if isinstance(w, Expr):
                     lcls.update(w.env.locals)
+                    bound.update(w._bound)
                 else:
                     w = self.parse_back_compat(w)
 
@@ -484,12 +515,68 @@ class Expr(expr.Expr):
         self.env = Scope(lcls=lcls)
         self.env.update(scope_level)
 
+        # explicitly bound variables take precedence over the captured scope
+        self._bound = bound
+        self.env.locals.update(bound)
+
         if queryables is not None and isinstance(self.expr, string_types):
             self.env.queryables.update(queryables)
             self._visitor = ExprVisitor(self.env, queryables=queryables,
                                         parser='pytables', engine='pytables',
                                         encoding=encoding)
-            self.terms = self.parse()
+            self._plan_key = self._get_plan_key(queryables)
+            if self._plan_key is not None:
+                self._plan = _plan_cache.get(self._plan_key)
+            if self._plan is not None:
+                self.terms = self._plan[0]
+            else:
+                self.terms = self.parse()
+
+    def parse(self):
+        """ parse the expression, reusing a cached syntax tree """
+        tree, _ = _parse_tree(self.expr)
+        return self._visitor.visit(tree)
+
+    def _get_plan_key(self, queryables):
+        """ return the key of this expression in the plan cache, or None if
+        the expression references a variable whose value cannot be part of a
+        key (e.g. an array, a frame or a module) """
+        _, names = _parse_tree(self.expr)
+
+        bindings = []
+        for name in names:
+            value = self.env.locals.get(name, self.env.globals.get(name, name))
+            if not isinstance(value, _bindable_types):
+                return None
+            bindings.append((name, type(value), value))
+
+        schema = tuple(sorted(queryables.items()))
+        key = (self.expr, schema, self.encoding, tuple(bindings))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def bind(self, **kwargs):
+        """ return a new Expr of the same expression with the passed variables
+        bound, these take precedence over the scope that was captured when
+        the expression was created
+
+        A prepared expression is parsed once; binding new values only
+        re-evaluates the terms, and selecting with values that have been seen
+        before reuses the cached selection plan
+
+        Examples
+        --------
+
+        >>> q = Term('index>start & columns=cols')
+        >>> store.select('df', q.bind(start=Timestamp('20130101'), cols='A'))
+        """
+        result = Expr(self)
+        result._bound.update(kwargs)
+        result.env.locals.update(kwargs)
+        return result
 
     def parse_back_compat(self, w, op=None, value=None):
         """ allow backward compatibility for passed arguments """
@@ -530,6 +617,10 @@ class Expr(expr.Expr):
     def evaluate(self):
         """ create and return the numexpr condition and filter """
 
+        if self._plan is not None:
+            _, self.condition, self.filter = self._plan
+            return self.condition, self.filter
+
         try:
             self.condition = self.terms.prune(ConditionBinOp)
         except AttributeError:
@@ -541,6 +632,10 @@ class Expr(expr.Expr):
             raise ValueError(
                 "cannot process expression [{0}], [{1}] is not a valid filter".format(self.expr,self))
 
+        if self._plan_key is not None:
+            self._plan = (self.terms, self.condition, self.filter)
+            _plan_cache[self._plan_key] = self._plan
+
         return self.condition, self.filter
 
 
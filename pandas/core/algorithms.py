@@ -7,6 +7,7 @@ import numpy as np
 
 import pandas.core.common as com
 import pandas.algos as algos
+import pandas.lib as lib
 import pandas.hashtable as htable
 import pandas.compat as compat
 
@@ -117,17 +118,48 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
     -------
     """
     from pandas.tseries.period import PeriodIndex
-    vals = np.asarray(values)
-    is_datetime = com.is_datetime64_dtype(vals)
-    (hash_klass, vec_klass), vals = _get_data_algo(vals, _hashtables)
+    from pandas.core.internals import _packed_string_block, _packed_categorical
+
+    block = _packed_string_block(values)
+    factor = _packed_categorical(values) if sort else None
+    if factor is not None:
+        # the codes of the observed levels of a categorical Series (sorted
+        # below)
+        labels, uniques = factor.labels, factor.levels.values
+        counts = np.bincount(labels[labels >= 0], minlength=len(uniques))
+        observed = counts > 0
+        if not observed.all():
+            remap = np.cumsum(observed) - 1
+            labels = np.where(labels >= 0, remap.take(labels), -1)
+            uniques = uniques[observed]
+        labels = com._ensure_platform_int(labels)
+        if na_sentinel != -1:
+            labels = np.where(labels == -1, na_sentinel, labels)
+        is_datetime = False
+
+    elif block is not None:
+        # hash the packed strings of a Series without creating them
+        data, offsets, mask, is_unicode = block.packed_values
+        labels, first = lib.factorize_packed_strings(data, offsets, mask)
+        uniques = lib.unpack_string_array(data, offsets, mask, is_unicode,
+                                          first)
+        if na_sentinel != -1:
+            labels[mask.astype(np.bool_)] = na_sentinel
+        labels = com._ensure_platform_int(labels)
+        is_datetime = False
 
-    table = hash_klass(len(vals))
-    uniques = vec_klass()
-    labels = table.get_labels(vals, uniques, 0, na_sentinel)
+    else:
+        vals = np.asarray(values)
+        is_datetime = com.is_datetime64_dtype(vals)
+        (hash_klass, vec_klass), vals = _get_data_algo(vals, _hashtables)
+
+        table = hash_klass(len(vals))
+        uniques = vec_klass()
+        labels = table.get_labels(vals, uniques, 0, na_sentinel)
 
-    labels = com._ensure_platform_int(labels)
+        labels = com._ensure_platform_int(labels)
 
-    uniques = uniques.to_array()
+        uniques = uniques.to_array()
 
     if sort and len(uniques) > 0:
         sorter = uniques.argsort()
@@ -171,9 +203,13 @@ def value_counts(values, sort=True, ascending=False, normalize=False, bins=None)
 
     """
     from pandas.core.series import Series
+    from pandas.core.internals import _packed_string_block, _packed_categorical
     from pandas.tools.tile import cut
 
-    values = Series(values).values
+    values = Series(values)
+    block = _packed_string_block(values)
+    factor = _packed_categorical(values)
+    values = values.values if block is None else values
 
     if bins is not None:
         try:
@@ -181,8 +217,25 @@ def value_counts(values, sort=True, ascending=False, normalize=False, bins=None)
         except TypeError:
             raise TypeError("bins argument only works with numeric data.")
         values = cat.labels
-
-    if com.is_integer_dtype(values.dtype):
+        block = factor = None
+
+    if factor is not None:
+        # count the codes of a categorical Series
+        labels = factor.labels
+        counts = np.bincount(labels[labels >= 0],
+                             minlength=len(factor.levels))
+        observed = counts > 0
+        keys, counts = factor.levels.values[observed], counts[observed]
+
+    elif block is not None:
+        # count the packed strings of a Series without creating them
+        data, offsets, mask, is_unicode = block.packed_values
+        labels, first = lib.factorize_packed_strings(data, offsets, mask)
+        counts = np.bincount(labels[labels >= 0], minlength=len(first))
+        keys = lib.unpack_string_array(data, offsets, mask, is_unicode,
+                                       first)
+
+    elif com.is_integer_dtype(values.dtype):
         values = com._ensure_int64(values)
         keys, counts = htable.value_count_int64(values)
 
@@ -212,7 +265,7 @@ def value_counts(values, sort=True, ascending=False, normalize=False, bins=None)
             result = result[::-1]
 
     if normalize:
-        result = result / float(values.size)
+        result = result / float(len(values))
 
     return result
 
@@ -127,6 +127,8 @@ class Categorical(PandasObject):
     __le__ = _cat_compare_op('__le__')
     __ge__ = _cat_compare_op('__ge__')
 
+    ndim = 1
+
     def __array__(self, dtype=None):
         return com.take_1d(self.levels.values, self.labels)
 
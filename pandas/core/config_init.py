@@ -280,6 +280,62 @@ with cf.config_prefix('mode'):
     cf.register_option('use_inf_as_null', False, use_inf_as_null_doc,
                        cb=use_inf_as_null_cb)
 
+consolidation_doc = """
+: string
+    When the blocks of the same dtype of a DataFrame are joined together
+    ("consolidated"). 'eager' also consolidates once a frame has more than
+    100 blocks, 'lazy' only when an operation needs it and 'never' does not
+    consolidate implicitly, apart from the few internal operations that
+    cannot work otherwise. Calling ``consolidate()`` always consolidates.
+    Valid values: 'eager', 'lazy', 'never'
+"""
+
+
+def consolidation_cb(key):
+    from pandas.core.internals import _set_consolidation_policy
+    _set_consolidation_policy(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidation', 'eager', consolidation_doc,
+                       validator=is_one_of_factory(['eager', 'lazy',
+                                                    'never']),
+                       cb=consolidation_cb)
+
+copy_on_write_doc = """
+: boolean
+    Copies of a DataFrame/Series/Panel share the data of the original
+    (marked read-only) until either of them is modified in place, instead
+    of copying it right away. Writing directly into the arrays returned by
+    ``.values`` of such objects raises.
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import _set_copy_on_write
+    _set_copy_on_write(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+pack_strings_doc = """
+: boolean
+    Store object columns that hold only strings (and nulls) packed in a
+    single byte buffer with offsets and a null mask, rather than as an array
+    of python objects. The values of such a column are created on access, so
+    a column taken from a DataFrame is not a view on it; modifying a
+    DataFrame or Series in place unpacks its strings.
+"""
+
+
+def pack_strings_cb(key):
+    from pandas.core.internals import _set_pack_strings
+    _set_pack_strings(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('pack_strings', False, pack_strings_doc,
+                       validator=is_bool, cb=pack_strings_cb)
+
 
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
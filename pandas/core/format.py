@@ -2,6 +2,7 @@ from __future__ import print_function
 # pylint: disable=W0141
 
 import sys
+import re
 
 from pandas.core.common import adjoin, isnull, notnull
 from pandas.core.index import Index, MultiIndex, _ensure_index
@@ -12,6 +13,7 @@ from pandas.util.terminal import get_terminal_size
 from pandas.core.config import get_option, set_option, reset_option
 import pandas.core.common as com
 import pandas.lib as lib
+import pandas.tslib as tslib
 
 import numpy as np
 
@@ -781,13 +783,17 @@ def _get_level_lengths(levels,sentinal=''):
     return result
 
 
+# a float_format that C can apply directly, e.g. '%.4f'
+_printf_float_format = re.compile(r'^%[-+ #0]*\d*(\.\d+)?[eEfFgG]$')
+
+
 class CSVFormatter(object):
 
     def __init__(self, obj, path_or_buf, sep=",", na_rep='', float_format=None,
                  cols=None, header=True, index=True, index_label=None,
                  mode='w', nanRep=None, encoding=None, quoting=None,
                  line_terminator='\n', chunksize=None, engine=None,
-                 tupleize_cols=False, quotechar='"'):
+                 tupleize_cols=False, quotechar='"', nprocs=None):
 
         self.engine = engine  # remove for 0.13
         self.obj = obj
@@ -864,6 +870,8 @@ class CSVFormatter(object):
         if not index:
             self.nlevels = 0
 
+        self.nprocs = nprocs
+
     # original python implem. of df.to_csv
     # invoked by df.to_csv(engine=python)
     def _helper_csv(self, writer, na_rep=None, cols=None,
@@ -953,6 +961,7 @@ class CSVFormatter(object):
             f = com._get_handle(self.path_or_buf, self.mode, encoding=self.encoding)
             close = True
 
+        self.handle = f
         try:
             writer_kwargs = dict(lineterminator=self.line_terminator,
                                  delimiter=self.sep, quoting=self.quoting,
@@ -1071,13 +1080,148 @@ class CSVFormatter(object):
         chunksize = self.chunksize
         chunks = int(nrows / chunksize)+1
 
+        bounds = []
         for i in range(chunks):
             start_i = i * chunksize
             end_i = min((i + 1) * chunksize, nrows)
             if start_i >= end_i:
                 break
 
-            self._save_chunk(start_i, end_i)
+            bounds.append((start_i, end_i))
+
+        # stateful encoders (e.g. a BOM) cannot encode the chunks separately
+        nprocs = self.nprocs or 1
+        if nprocs > 1 and len(bounds) > 1 and self.encoding is None:
+            self._save_parallel(bounds)
+            return
+
+        save_chunk = self._save_chunk
+        if self._can_save_native():
+            save_chunk = self._save_chunk_native
+
+        for start_i, end_i in bounds:
+            save_chunk(start_i, end_i)
+
+    def _save_parallel(self, bounds):
+        """
+        format the chunks in a pool of nprocs processes, writing them to the
+        handle in order; the formatting holds the GIL, so it is not spread
+        across threads
+        """
+        from multiprocessing import Pool
+        pool = Pool(self.nprocs)
+        kwargs = dict(sep=self.sep, na_rep=self.na_rep,
+                      float_format=self.float_format, index=self.index,
+                      quoting=self.quoting, quotechar=self.quotechar,
+                      line_terminator=self.line_terminator,
+                      tupleize_cols=self.tupleize_cols)
+        args = [(self.obj.iloc[start_i:end_i], kwargs)
+                for start_i, end_i in bounds]
+
+        try:
+            for text in pool.imap(_format_csv_chunk, args):
+                self.handle.write(text)
+        finally:
+            pool.terminate()
+
+    def _can_save_native(self):
+        """
+        can the data be written with lib.write_csv_rows_native, i.e. the
+        blocks are numeric, datetimes or packed strings and the output is
+        guaranteed to be identical to that of csv.writer
+        """
+        if self.encoding is not None or self.quoting != csv.QUOTE_MINIMAL:
+            return False
+
+        # a row of a single (possibly empty) field is quoted by csv.writer
+        if self.nlevels > 1 or len(self.cols) + self.nlevels < 2:
+            return False
+
+        float_format = self.float_format
+        if float_format is not None:
+            if not (isinstance(float_format, compat.string_types) and
+                    _printf_float_format.match(float_format)):
+                return False
+
+        # a formatted value must never need quoting
+        special = [self.sep, self.quotechar] + list(self.line_terminator)
+        for c in special:
+            if c is None or c.isalnum() or c in '.+-: ':
+                return False
+
+        # packed unicode strings are written from their UTF-8 buffer
+        strings_ok = compat.PY3 and all(ord(c) < 128 for c in special)
+
+        for b in self.blocks:
+            if b.is_float or b.is_bool or b.is_datetime:
+                continue
+            if (b.is_string and b.is_packed and b.packed_values[3] and
+                    strings_ok):
+                continue
+            if (b.is_integer and not b.is_timedelta and
+                    b.dtype != np.uint64):
+                continue
+            return False
+
+        return True
+
+    def _save_chunk_native(self, start_i, end_i):
+
+        data_index = self.data_index
+        slicer = slice(start_i, end_i)
+
+        ncols = len(self.data)
+        columns = [None] * ncols
+        masks = [None] * ncols
+        kinds = [None] * ncols
+        strings = [None] * ncols
+
+        for b in self.blocks:
+            if b.is_string:
+                for i in range(len(b.items)):
+                    loc = self.column_map[b][i]
+                    strings[loc], columns[loc], masks[loc] = b.packed_item(
+                        i, slicer)
+                    kinds[loc] = 'U'
+                continue
+
+            values = b.values[:, slicer]
+            mask = None
+            if b.is_float:
+                kind, mask = 'f', isnull(values)
+                values = com._ensure_float64(values)
+            elif b.is_bool:
+                kind, values = 'b', values.view(np.uint8)
+            elif b.is_datetime:
+                kind, values = 'M', values.view(np.int64)
+                mask = values == tslib.iNaT
+            else:
+                kind, values = 'i', com._ensure_int64(values)
+
+            for i in range(len(b.items)):
+                loc = self.column_map[b][i]
+                columns[loc] = np.ascontiguousarray(values[i])
+                if mask is not None:
+                    masks[loc] = np.ascontiguousarray(mask[i]).view(np.uint8)
+                kinds[loc] = kind
+
+        if self.nlevels:
+            if data_index.dtype == np.int64:
+                ix, kind = data_index.values[slicer], 'i'
+            else:
+                ix, kind = data_index.to_native_types(
+                    slicer=slicer, na_rep=self.na_rep,
+                    float_format=self.float_format), 'O'
+            columns.insert(0, ix)
+            masks.insert(0, None)
+            kinds.insert(0, kind)
+            strings.insert(0, None)
+
+        lib.write_csv_rows_native(columns, masks, kinds, self.handle,
+                                  self.sep, self.line_terminator,
+                                  self.na_rep, self.quotechar,
+                                  float_format=self.float_format,
+                                  decode=compat.PY3, strings=strings)
 
     def _save_chunk(self, start_i, end_i):
 
@@ -1097,6 +1241,15 @@ class CSVFormatter(object):
 
         lib.write_csv_rows(self.data, ix, self.nlevels, self.cols, self.writer)
 
+
+def _format_csv_chunk(args):
+    """ format the rows of a chunk of a frame in a worker process """
+    obj, kwargs = args
+    buf = StringIO()
+    CSVFormatter(obj, buf, header=False, chunksize=max(len(obj), 1),
+                 **kwargs).save()
+    return buf.getvalue()
+
 # from collections import namedtuple
 # ExcelCell = namedtuple("ExcelCell",
 #                        'row, col, val, style, mergestart, mergeend')
@@ -1144,11 +1297,15 @@ class ExcelFormatter(object):
             Column label for index column(s) if desired. If None is given, and
             `header` and `index` are True, then the index names are used. A
             sequence should be given if the DataFrame uses MultiIndex.
+    row_major : boolean, default False
+        generate the cells of the body row by row, rather than column by
+        column (required by write_only writers)
     """
 
     def __init__(self, df, na_rep='', float_format=None, cols=None,
-                 header=True, index=True, index_label=None):
+                 header=True, index=True, index_label=None, row_major=False):
         self.df = df
+        self.row_major = row_major
         self.rowcounter = 0
         self.na_rep = na_rep
         self.columns = cols
@@ -1247,6 +1404,7 @@ class ExcelFormatter(object):
             self.rowcounter += 1
 
         coloffset = 0
+        columns = []
         # output index and index_label?
         if self.index:
             # chek aliases
@@ -1276,13 +1434,13 @@ class ExcelFormatter(object):
                 index_values = self.df.index.to_timestamp()
 
             coloffset = 1
-            for idx, idxval in enumerate(index_values):
-                yield ExcelCell(self.rowcounter + idx, 0, idxval, header_style)
+            columns.append((0, index_values, header_style))
 
         for colidx, colname in enumerate(self.columns):
-            series = self.df[colname]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, colidx + coloffset, val)
+            columns.append((colidx + coloffset, self.df[colname], None))
+
+        for cell in self._format_columns(columns):
+            yield cell
 
     def _format_hierarchical_rows(self):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray))
@@ -1290,6 +1448,7 @@ class ExcelFormatter(object):
             self.rowcounter += 1
 
         gcolidx = 0
+        columns = []
         # output index and index_label?
         if self.index:
             index_labels = self.df.index.names
@@ -1311,15 +1470,30 @@ class ExcelFormatter(object):
                 self.rowcounter += 1
 
             for indexcolvals in zip(*self.df.index):
-                for idx, indexcolval in enumerate(indexcolvals):
-                    yield ExcelCell(self.rowcounter + idx, gcolidx,
-                                    indexcolval, header_style)
+                columns.append((gcolidx, indexcolvals, header_style))
                 gcolidx += 1
 
         for colidx, colname in enumerate(self.columns):
-            series = self.df[colname]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, gcolidx + colidx, val)
+            columns.append((gcolidx + colidx, self.df[colname], None))
+
+        for cell in self._format_columns(columns):
+            yield cell
+
+    def _format_columns(self, columns):
+        """
+        generate the cells of the body from a list of
+        (column location, values, style), by column or by row
+        """
+        if self.row_major:
+            locs = [(colidx, style) for colidx, _, style in columns]
+            rows = zip(*[iter(values) for _, values, _ in columns])
+            for i, row in enumerate(rows):
+                for (colidx, style), val in zip(locs, row):
+                    yield ExcelCell(self.rowcounter + i, colidx, val, style)
+        else:
+            for colidx, values, style in columns:
+                for i, val in enumerate(values):
+                    yield ExcelCell(self.rowcounter + i, colidx, val, style)
 
     def get_formatted_cells(self):
         for cell in itertools.chain(self._format_header(), self._format_body()
@@ -1492,21 +1666,12 @@ class Datetime64Formatter(GenericArrayFormatter):
 
     def get_result(self):
         if self.formatter:
-            formatter = self.formatter
+            fmt_values = [self.formatter(x) for x in self.values]
         else:
-            formatter = _format_datetime64
-
-        fmt_values = [formatter(x) for x in self.values]
+            values = np.asarray(self.values, dtype='M8[ns]').view('i8')
+            fmt_values = tslib.format_array_from_datetime(values).tolist()
         return _make_fixed_width(fmt_values, self.justify)
 
-def _format_datetime64(x, tz=None):
-    if isnull(x):
-        return 'NaT'
-
-    stamp = lib.Timestamp(x, tz=tz)
-    return stamp._repr_base
-
-
 class Timedelta64Formatter(Datetime64Formatter):
 
     def get_result(self):
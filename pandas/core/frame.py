@@ -31,9 +31,11 @@ from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import (_maybe_droplevels,
                                   _convert_to_index_sliceable,
                                   _check_bool_indexer, _maybe_convert_indices)
+from pandas.core.categorical import Categorical
 from pandas.core.internals import (BlockManager,
                                    create_block_manager_from_arrays,
-                                   create_block_manager_from_blocks)
+                                   create_block_manager_from_blocks,
+                                   _packed_categorical)
 from pandas.core.series import Series, _radd_compat
 import pandas.computation.expressions as expressions
 from pandas.computation.eval import eval as _eval
@@ -1295,7 +1297,7 @@ class DataFrame(NDFrame):
                cols=None, header=True, index=True, index_label=None,
                mode='w', nanRep=None, encoding=None, quoting=None,
                line_terminator='\n', chunksize=None,
-               tupleize_cols=False, **kwds):
+               tupleize_cols=False, nprocs=None, **kwds):
         r"""Write DataFrame to a comma-separated values (csv) file
 
         Parameters
@@ -1338,6 +1340,10 @@ class DataFrame(NDFrame):
         tupleize_cols : boolean, default False
             write multi_index columns as a list of tuples (if True)
             or new (expanded format) if False)
+        nprocs : int, optional
+            format chunks of rows in this many processes. The chunks are
+            written in order, so the output is identical to a serial write
+            (ignored if an encoding is specified)
         """
         if nanRep is not None:  # pragma: no cover
             warnings.warn("nanRep is deprecated, use na_rep",
@@ -1353,12 +1359,14 @@ class DataFrame(NDFrame):
                                      index_label=index_label, mode=mode,
                                      chunksize=chunksize, engine=kwds.get(
                                          "engine"),
-                                     tupleize_cols=tupleize_cols)
+                                     tupleize_cols=tupleize_cols,
+                                     nprocs=nprocs)
         formatter.save()
 
     def to_excel(self, excel_writer, sheet_name='sheet1', na_rep='',
                  float_format=None, cols=None, header=True, index=True,
-                 index_label=None, startrow=0, startcol=0, engine=None):
+                 index_label=None, startrow=0, startcol=0, engine=None,
+                 write_only=False):
         """
         Write DataFrame to a excel sheet
 
@@ -1389,7 +1397,11 @@ class DataFrame(NDFrame):
             write engine to use - you can also set this via the options
             ``io.excel.xlsx.writer``, ``io.excel.xls.writer``, and
             ``io.excel.xlsm.writer``.
-
+        write_only : boolean, default False
+            if excel_writer is a path, stream the rows to the file so that the
+            memory used does not grow with the number of rows (see
+            ``ExcelWriter``). With openpyxl 2.0 or later the cell styles,
+            such as the bold header, are not written in this mode
 
         Notes
         -----
@@ -1404,7 +1416,8 @@ class DataFrame(NDFrame):
         from pandas.io.excel import ExcelWriter
         need_save = False
         if isinstance(excel_writer, compat.string_types):
-            excel_writer = ExcelWriter(excel_writer, engine=engine)
+            excel_writer = ExcelWriter(excel_writer, engine=engine,
+                                       write_only=write_only)
             need_save = True
 
         formatter = fmt.ExcelFormatter(self,
@@ -1413,7 +1426,9 @@ class DataFrame(NDFrame):
                                        header=header,
                                        float_format=float_format,
                                        index=index,
-                                       index_label=index_label)
+                                       index_label=index_label,
+                                       row_major=getattr(excel_writer,
+                                                         'write_only', False))
         formatted_cells = formatter.get_formatted_cells()
         excel_writer.write_cells(formatted_cells, sheet_name,
                                  startrow=startrow, startcol=startcol)
@@ -1591,7 +1606,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=True, buf=None, max_cols=None):
+    def info(self, verbose=True, buf=None, max_cols=None, memory_usage=True):
         """
         Concise summary of a DataFrame, used in __repr__ when very large.
 
@@ -1602,6 +1617,10 @@ class DataFrame(NDFrame):
         buf : writable buffer, defaults to sys.stdout
         max_cols : int, default None
             Determines whether full summary or short summary is printed
+        memory_usage : boolean or 'deep', default True
+            Print the memory used by the frame (and its index). 'deep' also
+            counts the python objects referenced by object columns, otherwise
+            a '+' marks the figure as a lower bound for such frames
         """
         from pandas.core.format import _put_lines
 
@@ -1643,8 +1662,43 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(compat.iteritems(counts))]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+
+        if memory_usage:
+            deep = memory_usage == 'deep'
+            size_qualifier = ''
+            if not deep and 'object' in counts:
+                size_qualifier = '+'
+            mem_usage = self.memory_usage(index=True, deep=deep).sum()
+            lines.append('memory usage: %s' % _sizeof_fmt(mem_usage,
+                                                         size_qualifier))
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory used by each column in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Also return the memory used by the index, as the first entry
+            (labelled 'Index')
+        deep : boolean, default False
+            Also count the python objects (e.g. strings) referenced by object
+            columns, rather than only the pointers to them
+
+        Returns
+        -------
+        sizes : Series
+            Indexed by the column names
+        """
+        result = Series([c.memory_usage(index=False, deep=deep)
+                         for col, c in self.iteritems()],
+                        index=self.columns)
+        if index:
+            result = Series(self.index.memory_usage(deep=deep),
+                            index=['Index']).append(result)
+        return result
+
     @property
     def dtypes(self):
         return self.apply(lambda x: x.dtype, reduce=False)
@@ -1731,6 +1785,7 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
+            self._copy_if_shared()
             series = self._get_item_cache(col)
             engine = self.index._engine
             engine.set_value(series.values, index, value)
@@ -2141,9 +2196,73 @@ class DataFrame(NDFrame):
         self._data.insert(
             loc, column, value, allow_duplicates=allow_duplicates)
 
+    def assign_many(self, mapping):
+        """
+        Set several columns in place. The new columns are stored with one
+        block (a single allocation) per dtype, instead of the block per column
+        that setting them one at a time with ``df[key] = value`` creates
+
+        Parameters
+        ----------
+        mapping : dict-like of column -> value
+            The values can be anything ``df[key] = value`` accepts. New columns
+            are added in the iteration order of the mapping (pass an
+            OrderedDict to control it)
+        """
+        items, values, existing = [], [], []
+
+        def _flush():
+            if items:
+                self._data.append_items(items, values)
+                self._clear_item_cache()
+                items[:] = []
+                values[:] = []
+
+        for key, value in compat.iteritems(mapping):
+            # existing columns are set as usual once the new columns are
+            # added, so that they do not split the batch of new columns
+            if key in self.columns:
+                existing.append((key, value))
+                continue
+
+            # a frame without an index gets its columns set as usual
+            if not len(self.index):
+                self[key] = value
+                continue
+
+            value = self._sanitize_column(key, value)
+            if isinstance(value, Categorical):
+                items.append(key)
+                values.append(value)
+            elif value.ndim == 2 and value.shape[0] == 1:
+                items.append(key)
+                values.append(value[0])
+            else:
+                _flush()
+                NDFrame._set_item(self, key, value)
+
+        _flush()
+        for key, value in existing:
+            self[key] = value
+
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
         # blocks) are always copied
+
+        # categorical values keep their codes and levels (the codes are
+        # copied by their block)
+        if isinstance(value, Series) and self.columns.is_unique:
+            factor = _packed_categorical(value)
+            if factor is not None and not value.index.equals(self.index):
+                factor = _packed_categorical(value.reindex(self.index))
+            if factor is not None:
+                value = factor
+        if isinstance(value, Categorical) and self.columns.is_unique:
+            if len(value) != len(self.index):
+                raise ValueError('Length of values does not match '
+                                 'length of index')
+            return value
+
         if _is_sequence(value):
             is_frame = isinstance(value, DataFrame)
             if isinstance(value, Series) or is_frame:
@@ -2886,11 +3005,16 @@ class DataFrame(NDFrame):
                     keys.append(k)
 
                 def trans(v):
+                    # categorical keys are sorted by their codes
+                    factor = _packed_categorical(v)
+                    if factor is not None:
+                        return factor
+                    v = v.values
                     if com.needs_i8_conversion(v):
                         return v.view('i8')
                     return v
 
-                keys = [trans(self[x].values) for x in by]
+                keys = [trans(self[x]) for x in by]
                 indexer = _lexsort_indexer(keys, orders=ascending)
                 indexer = com._ensure_platform_int(indexer)
             else:
@@ -2899,9 +3023,15 @@ class DataFrame(NDFrame):
                 if k.ndim == 2:
                     raise ValueError('Cannot sort by duplicate column %s'
                                      % str(by))
-                indexer = k.argsort(kind=kind)
-                if not ascending:
-                    indexer = indexer[::-1]
+                factor = _packed_categorical(self[by])
+                if factor is not None and factor.levels.is_monotonic:
+                    # the codes of sorted levels sort like the values
+                    indexer = _lexsort_indexer([factor], orders=ascending)
+                    indexer = com._ensure_platform_int(indexer)
+                else:
+                    indexer = k.argsort(kind=kind)
+                    if not ascending:
+                        indexer = indexer[::-1]
         elif isinstance(labels, MultiIndex):
             indexer = _lexsort_indexer(labels.labels, orders=ascending)
             indexer = com._ensure_platform_int(indexer)
@@ -5121,6 +5251,9 @@ def _homogenize(data, index, dtype=None):
                 # Forces alignment. No need to copy data since we
                 # are putting it into an ndarray later
                 v = v.reindex(index, copy=False)
+        elif isinstance(v, Categorical) and dtype is None:
+            # kept as its codes and levels by the block manager
+            pass
         else:
             if isinstance(v, dict):
                 if oindex is None:
@@ -5153,6 +5286,15 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num, size_qualifier=''):
+    # returns size in human readable format
+    for x in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return '%3.1f%s %s' % (num, size_qualifier, x)
+        num /= 1024.0
+    return '%3.1f%s %s' % (num, size_qualifier, 'PB')
+
+
 def install_ipython_completers():  # pragma: no cover
     """Register the DataFrame type with IPython's tab completion machinery, so
     that it knows about accessing column names as attributes."""
@@ -1,17 +1,20 @@
 # pylint: disable=W0231,E1101
 import warnings
 import operator
+import sys
 import weakref
 import numpy as np
 import pandas.lib as lib
 
 import pandas as pd
 from pandas.core.base import PandasObject
-from pandas.core.index import Index, MultiIndex, _ensure_index, InvalidIndexError
+from pandas.core.index import (Index, MultiIndex, _ensure_index,
+                               _join_indexes, InvalidIndexError)
 import pandas.core.indexing as indexing
 from pandas.core.indexing import _maybe_convert_indices
 from pandas.tseries.index import DatetimeIndex
 from pandas.core.internals import BlockManager
+import pandas.core.internals as internals
 import pandas.core.common as com
 from pandas import compat, _np_version_under1p7
 from pandas.compat import map, zip, lrange
@@ -832,6 +835,35 @@ class NDFrame(PandasObject):
     def _clear_item_cache(self):
         self._item_cache.clear()
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory used by the object in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory used by the axes labels
+        deep : boolean, default False
+            Also count the python objects (e.g. strings) referenced by object
+            values, rather than only the pointers to them
+
+        Returns
+        -------
+        bytes : int
+        """
+        result = sum(self._data.memory_usage(deep=deep))
+        if index:
+            result += sum(ax.memory_usage(deep=deep) for ax in self.axes)
+        return result
+
+    def _copy_if_shared(self):
+        """
+        Before modifying the values in place, copy those that are shared with
+        another object under copy-on-write (the 'mode.copy_on_write' option)
+        """
+        if self._data._copy_if_shared():
+            self._clear_item_cache()
+
     def _set_item(self, key, value):
         self._data.set(key, value)
         self._clear_item_cache()
@@ -1315,6 +1347,8 @@ class NDFrame(PandasObject):
     # Consolidation of internals
 
     def _consolidate_inplace(self):
+        if internals._consolidation_policy == 'never':
+            return
         f = lambda: self._data.consolidate()
         self._data = self._protect_consolidate(f)
 
@@ -1334,7 +1368,8 @@ class NDFrame(PandasObject):
         consolidated : type of caller
         """
         if inplace:
-            self._consolidate_inplace()
+            f = lambda: self._data.consolidate()
+            self._data = self._protect_consolidate(f)
         else:
             f = lambda: self._data.consolidate()
             cons_data = self._protect_consolidate(f)
@@ -1466,6 +1501,46 @@ class NDFrame(PandasObject):
             dtype, copy=copy, raise_on_error=raise_on_error)
         return self._constructor(mgr)._propogate_attributes(self)
 
+    def compact(self, float_tolerance=0., max_categories=0.5, verbose=False,
+                buf=None):
+        """
+        Shrink the values to the smallest dtypes that hold them: int64 to the
+        smallest integer dtype, float64 to float32 where that is precise
+        enough, and object values with few distinct values to categoricals
+
+        Parameters
+        ----------
+        float_tolerance : float or None, default 0.
+            The largest relative change of a float64 value allowed by the
+            cast to float32 (0. only casts the values float32 holds exactly);
+            None keeps float64
+        max_categories : float or None, default 0.5
+            Object values become a categorical if they have at most this
+            many distinct values per value; None keeps them as objects
+        verbose : boolean, default False
+            Print the memory used before and after, and the bytes saved
+        buf : writable buffer, defaults to sys.stdout
+
+        Returns
+        -------
+        compacted : type of caller
+        """
+        mgr = self._data.compact(float_tolerance=float_tolerance,
+                                 max_categories=max_categories)
+        result = self._constructor(mgr)._propogate_attributes(self)
+
+        if verbose:
+            if buf is None:  # pragma: no cover
+                buf = sys.stdout
+            before = self.memory_usage(index=False)
+            after = result.memory_usage(index=False)
+            if not np.isscalar(before):
+                before, after = before.sum(), after.sum()
+            buf.write('compacted from %d to %d bytes, saved %d bytes\n'
+                      % (before, after, before - after))
+
+        return result
+
     def copy(self, deep=True):
         """
         Make a copy of this object
@@ -1482,6 +1557,13 @@ class NDFrame(PandasObject):
         data = self._data
         if deep:
             data = data.copy()
+            if internals._copy_on_write:
+                # the cached items are views of the values now shared with
+                # the copy, and may be held elsewhere; they must copy before
+                # writing as well
+                for item in compat.itervalues(self._item_cache):
+                    item._data._mark_shared()
+                self._clear_item_cache()
         return self._constructor(data)._propogate_attributes(self)
 
     def convert_objects(self, convert_dates=True, convert_numeric=False, copy=True):
@@ -1544,6 +1626,8 @@ class NDFrame(PandasObject):
             raise TypeError('"value" parameter must be a scalar or dict, but '
                             'you passed a "{0}"'.format(type(value).__name__))
         self._consolidate_inplace()
+        if inplace:
+            self._copy_if_shared()
 
         axis = self._get_axis_number(axis)
         method = com._clean_fill_method(method)
@@ -1708,6 +1792,8 @@ class NDFrame(PandasObject):
           and play with this method to gain intuition about how it works.
 
         """
+        if inplace:
+            self._copy_if_shared()
         if not com.is_bool(regex) and to_replace is not None:
             raise AssertionError("'to_replace' must be 'None' if 'regex' is "
                                  "not a bool")
@@ -1861,6 +1947,8 @@ class NDFrame(PandasObject):
         warn('DataFrame.interpolate will be removed in v0.13, please use '
              'either DataFrame.fillna or DataFrame.replace instead',
              FutureWarning)
+        if inplace:
+            self._copy_if_shared()
         if self._is_mixed_type and axis == 1:
             return self.T.replace(to_replace, method=method, limit=limit).T
 
@@ -2259,16 +2347,13 @@ class NDFrame(PandasObject):
         clidx, cridx = None, None
 
         if axis is None or axis == 0:
-            if not self.index.equals(other.index):
-                join_index, ilidx, iridx = \
-                    self.index.join(other.index, how=join, level=level,
-                                    return_indexers=True)
+            join_index, ilidx, iridx = _join_indexes(self.index, other.index,
+                                                     how=join, level=level)
 
         if axis is None or axis == 1:
-            if not self.columns.equals(other.columns):
-                join_columns, clidx, cridx = \
-                    self.columns.join(other.columns, how=join, level=level,
-                                      return_indexers=True)
+            join_columns, clidx, cridx = _join_indexes(self.columns,
+                                                       other.columns,
+                                                       how=join, level=level)
 
         left = self._reindex_with_indexers({0: [join_index,   ilidx],
                                             1: [join_columns, clidx]},
@@ -2293,9 +2378,10 @@ class NDFrame(PandasObject):
             if axis:
                 raise ValueError('cannot align series to a series other than axis 0')
 
-            join_index, lidx, ridx = self.index.join(other.index, how=join,
-                                                     level=level,
-                                                     return_indexers=True)
+            join_index, lidx, ridx = _join_indexes(self.index, other.index,
+                                                   how=join, level=level)
+            if join_index is None:
+                join_index = self.index
 
             left_result = self._reindex_indexer(join_index, lidx, copy)
             right_result = other._reindex_indexer(join_index, ridx, copy)
@@ -2305,21 +2391,18 @@ class NDFrame(PandasObject):
             # one has > 1 ndim
             fdata = self._data
             if axis == 0:
-                join_index = self.index
-                lidx, ridx = None, None
-                if not self.index.equals(other.index):
-                    join_index, lidx, ridx = self.index.join(other.index, how=join,
-                                                             return_indexers=True)
+                join_index, lidx, ridx = _join_indexes(self.index,
+                                                       other.index, how=join)
+                if join_index is None:
+                    join_index = self.index
 
                 if lidx is not None:
                     fdata = fdata.reindex_indexer(join_index, lidx, axis=1)
             elif axis == 1:
-                join_index = self.columns
-                lidx, ridx = None, None
-                if not self.columns.equals(other.index):
-                    join_index, lidx, ridx = \
-                                self.columns.join(other.index, how=join,
-                                                  return_indexers=True)
+                join_index, lidx, ridx = _join_indexes(self.columns,
+                                                       other.index, how=join)
+                if join_index is None:
+                    join_index = self.columns
 
                 if lidx is not None:
                     fdata = fdata.reindex_indexer(join_index, lidx, axis=0)
@@ -2471,6 +2554,7 @@ class NDFrame(PandasObject):
         if inplace:
             # we may have different type blocks come out of putmask, so
             # reconstruct the block manager
+            self._copy_if_shared()
             self._data = self._data.putmask(cond, other, align=axis is None, inplace=True)
 
         else:
@@ -11,7 +11,8 @@ from pandas.core.categorical import Categorical
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
-from pandas.core.internals import BlockManager, make_block
+from pandas.core.internals import (BlockManager, make_block,
+                                   _packed_categorical)
 from pandas.core.series import Series
 from pandas.core.panel import Panel
 from pandas.util.decorators import cache_readonly, Appender
@@ -1130,8 +1131,15 @@ class Grouping(object):
 
         self.name = name
         self.level = level
-        self.grouper = _convert_grouper(index, grouper)
         self.index = index
+
+        # a categorical Series is grouped by its codes, without factorizing
+        # its values
+        factor = _packed_categorical(grouper) if sort else None
+        if factor is not None and grouper.index.equals(index):
+            self.grouper = _observed_factor(factor)
+        else:
+            self.grouper = _convert_grouper(index, grouper)
         self.sort = sort
 
         # right place for this?
@@ -1341,6 +1349,36 @@ def _is_label_like(val):
     return isinstance(val, compat.string_types) or np.isscalar(val)
 
 
+def _observed_factor(factor):
+    """
+    The Categorical with only the observed levels of factor, in sorted order
+    (when they can be sorted), i.e. the codes are the labels of the groups
+    """
+    labels, levels = factor.labels, factor.levels
+    counts = np.bincount(labels[labels >= 0], minlength=len(levels))
+    observed = counts > 0
+    if not observed.all():
+        # renumber the observed levels
+        remap = np.cumsum(observed) - 1
+        remap = np.where(observed, remap, -1)
+        labels = np.where(labels >= 0, remap.take(labels), -1)
+        levels = levels[observed]
+
+    if not levels.is_monotonic:
+        try:
+            sorter = levels.argsort()
+        except TypeError:
+            sorter = None
+        if sorter is not None:
+            reverse_indexer = np.empty(len(sorter), dtype=np.int_)
+            reverse_indexer.put(sorter, np.arange(len(sorter)))
+            labels = np.where(labels >= 0, reverse_indexer.take(labels), -1)
+            levels = levels.take(sorter)
+
+    return Categorical(com._ensure_platform_int(labels), levels,
+                       name=factor.name)
+
+
 def _convert_grouper(axis, grouper):
     if isinstance(grouper, dict):
         return grouper.get
@@ -2543,14 +2581,20 @@ def _lexsort_indexer(keys, orders=None):
         orders = [True] * len(keys)
 
     for key, order in zip(keys, orders):
-        rizer = _hash.Factorizer(len(key))
+        if isinstance(key, Categorical) and key.levels.is_monotonic:
+            # the codes of sorted levels are the ids
+            ids = key.labels
+            n = len(key.levels)
+        else:
+            key = np.asarray(key)
+            rizer = _hash.Factorizer(len(key))
 
-        if not key.dtype == np.object_:
-            key = key.astype('O')
+            if not key.dtype == np.object_:
+                key = key.astype('O')
 
-        ids = rizer.factorize(key, sort=True)
+            ids = rizer.factorize(key, sort=True)
 
-        n = len(rizer.uniques)
+            n = len(rizer.uniques)
         shape.append(n)
         if not order:
             mask = ids == -1
@@ -1,5 +1,6 @@
 # pylint: disable=E1101,E1103,W0232
 from functools import partial
+import weakref
 from pandas.compat import range, zip, lrange, lzip
 from pandas import compat
 import numpy as np
@@ -12,6 +13,7 @@ from pandas.lib import Timestamp
 from pandas.core.base import FrozenList, FrozenNDArray
 
 from pandas.util.decorators import cache_readonly, deprecate
+from pandas.util.misc import LRUCache
 from pandas.core.common import isnull
 import pandas.core.common as com
 from pandas.core.common import _values_from_object
@@ -307,6 +309,21 @@ class Index(FrozenNDArray):
         # to disable groupby tricks in MultiIndex
         return False
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the index in bytes
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the python objects referenced by an object index
+        """
+        values = self.view(np.ndarray)
+        result = values.nbytes
+        if deep and values.dtype == np.object_:
+            result += lib.memory_usage_of_objects(values)
+        return result
+
     def summary(self, name=None):
         if len(self) > 0:
             head = self[0]
@@ -1754,6 +1771,17 @@ class MultiIndex(Index):
     def dtype(self):
         return np.dtype('O')
 
+    @cache_readonly
+    def _engine(self):
+        # hashes the packed level labels, the tuples are never created
+        return _index.MultiIndexEngine(self.levels, self.labels, len(self))
+
+    @property
+    def is_monotonic(self):
+        if self._engine.codes_sort_like_values:
+            return self._engine.is_monotonic
+        return self._tuple_index.is_monotonic
+
     def __unicode__(self):
         """
         Return a string representation for a particular Index
@@ -1831,6 +1859,24 @@ class MultiIndex(Index):
 
     _tuples = None
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the levels, the labels and the tuples (if they were
+        created) in bytes
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also count the python objects referenced by the levels and tuples
+        """
+        result = sum(lev.memory_usage(deep=deep) for lev in self.levels)
+        result += sum(lab.nbytes for lab in self.labels)
+        if self._tuples is not None:
+            result += self._tuples.nbytes
+            if deep:
+                result += lib.memory_usage_of_objects(self._tuples)
+        return result
+
     @property
     def values(self):
         if self._is_v2:
@@ -1850,6 +1896,46 @@ class MultiIndex(Index):
             self._tuples = lib.fast_zip(values)
             return self._tuples
 
+    def unique(self):
+        """
+        Return array of the unique tuples in the MultiIndex, in order of
+        appearance
+
+        Returns
+        -------
+        uniques : ndarray
+        """
+        _, first = np.unique(self._engine.get_codes(), return_index=True)
+        first.sort()
+        return self.take(first).values
+
+    def isin(self, values):
+        """
+        Compute boolean array of whether each tuple is found in the passed
+        set of tuples (or MultiIndex)
+
+        Parameters
+        ----------
+        values : set or sequence of tuples, or MultiIndex
+
+        Returns
+        -------
+        is_contained : ndarray (boolean dtype)
+        """
+        if not isinstance(values, MultiIndex):
+            values = list(values)
+            if not all(isinstance(v, tuple) for v in values):
+                return Index.isin(self, values)
+            try:
+                values = MultiIndex.from_tuples(values)
+            except (TypeError, ValueError):
+                return Index.isin(self, values)
+            if values.nlevels != self.nlevels:
+                return Index.isin(self, values.values)
+
+        codes = self._append_multi([values])._engine.get_codes()
+        return np.in1d(codes[:len(self)], codes[len(self):])
+
     # fml
     @property
     def _is_v1(self):
@@ -2179,6 +2265,10 @@ class MultiIndex(Index):
         if not isinstance(other, (list, tuple)):
             other = [other]
 
+        if all(isinstance(o, MultiIndex) and o.nlevels == self.nlevels
+               for o in other):
+            return self._append_multi(other)
+
         to_concat = (self.values,) + tuple(k.values for k in other)
         new_tuples = np.concatenate(to_concat)
 
@@ -2188,8 +2278,99 @@ class MultiIndex(Index):
         except:
             return Index(new_tuples)
 
+    def _append_multi(self, others):
+        # join the levels and recode the labels, the tuples are not needed
+        levels, labels = [], []
+        for i in range(self.nlevels):
+            level = self.levels[i]
+            for o in others:
+                level = level.union(o.levels[i])
+
+            level_labels = []
+            for idx in [self] + list(others):
+                lab = idx.labels[i]
+                if not level.equals(idx.levels[i]):
+                    indexer = com._ensure_int64(
+                        level.get_indexer(idx.levels[i]))
+                    lab = com.take_nd(indexer, lab, fill_value=-1)
+                level_labels.append(np.asarray(lab))
+
+            levels.append(level)
+            labels.append(np.concatenate(level_labels))
+
+        return MultiIndex(levels=levels, labels=labels, names=self.names)
+
+    def _sort_levels_monotonic(self):
+        # levels in sorted order, so that sorting the labels sorts the rows
+        if all(lev.is_monotonic for lev in self.levels):
+            return self
+
+        levels, labels = [], []
+        for lev, lab in zip(self.levels, self.labels):
+            if not lev.is_monotonic:
+                try:
+                    indexer = lev.argsort()
+                except TypeError:
+                    pass
+                else:
+                    lev = lev.take(indexer)
+                    new_labels = np.empty(len(indexer), dtype=np.int64)
+                    new_labels.put(indexer, np.arange(len(indexer)))
+                    lab = com.take_nd(new_labels, lab, fill_value=-1)
+            levels.append(lev)
+            labels.append(lab)
+
+        return MultiIndex(levels=levels, labels=labels, names=self.names)
+
+    def _unique_sorted(self, mask=None, names=None):
+        """
+        The distinct rows (where mask is True) sorted by the labels, which
+        is the order of the tuples when the levels are monotonic; the levels
+        only keep the values that are used
+        """
+        if names is None:
+            # the levels would otherwise lend the result their names
+            names = [None] * self.nlevels
+
+        codes = self._engine.get_codes()
+        if mask is None:
+            locs = np.arange(len(codes))
+        else:
+            locs = mask.nonzero()[0]
+
+        if len(locs) == 0:
+            return MultiIndex(levels=[[]] * self.nlevels,
+                              labels=[[]] * self.nlevels,
+                              names=names)
+
+        _, first = np.unique(codes.take(locs), return_index=True)
+        result = self.take(locs.take(first))
+        result = result.take(result._lexsort_labels())._drop_unused_levels()
+        return MultiIndex(levels=result.levels, labels=result.labels,
+                          sortorder=0, names=names)
+
+    def _drop_unused_levels(self):
+        # the levels without the values that no label refers to
+        levels, labels = [], []
+        for lev, lab in zip(self.levels, self.labels):
+            lab = np.asarray(lab)
+            used = np.zeros(len(lev), dtype=bool)
+            used[lab[lab != -1]] = True
+            if not used.all():
+                recode = np.cumsum(used) - 1
+                lab = np.where(lab == -1, -1, recode.take(lab))
+                lev = lev[used]
+            levels.append(lev)
+            labels.append(lab)
+
+        return MultiIndex(levels=levels, labels=labels, names=self.names)
+
+    def _lexsort_labels(self):
+        # nulls (label -1) sort first
+        return np.lexsort([np.asarray(lab) for lab in self.labels[::-1]])
+
     def argsort(self, *args, **kwargs):
-        return self.values.argsort()
+        return self._sort_levels_monotonic()._lexsort_labels()
 
     def drop(self, labels, level=None):
         """
@@ -2401,6 +2582,14 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
+        if (method is None and isinstance(target, MultiIndex) and
+                target.nlevels == self.nlevels):
+            if not self.is_unique:
+                raise Exception('Reindexing only valid with uniquely valued '
+                                'Index objects')
+            # compare the level labels, not the tuples
+            return com._ensure_platform_int(self._engine.get_indexer(target))
+
         target_index = target
         if isinstance(target, MultiIndex):
             target_index = target._tuple_index
@@ -2474,6 +2663,12 @@ class MultiIndex(Index):
 
         return target, indexer
 
+    def get_indexer_non_unique(self, target, **kwargs):
+        target = _ensure_index(target)
+        if isinstance(target, MultiIndex):
+            target = target._tuple_index
+        return self._tuple_index.get_indexer_non_unique(target)
+
     @cache_readonly
     def _tuple_index(self):
         """
@@ -2767,6 +2962,11 @@ class MultiIndex(Index):
             return False
 
         for i in range(self.nlevels):
+            if self.levels[i].equals(other.levels[i]):
+                if not np.array_equal(self.labels[i], other.labels[i]):
+                    return False
+                continue
+
             svalues = com.take_nd(self.levels[i].values, self.labels[i],
                                   allow_fill=False)
             ovalues = com.take_nd(other.levels[i].values, other.labels[i],
@@ -2808,6 +3008,11 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        if isinstance(other, MultiIndex) and other.nlevels == self.nlevels:
+            combined = self._append_multi([other])
+            return combined._sort_levels_monotonic()._unique_sorted(
+                names=result_names)
+
         uniq_tuples = lib.fast_unique_multiple([self.values, other.values])
         return MultiIndex.from_arrays(lzip(*uniq_tuples), sortorder=0,
                                       names=result_names)
@@ -2831,6 +3036,9 @@ class MultiIndex(Index):
 
         result_names = self.names if self.names == other.names else None
 
+        if isinstance(other, MultiIndex) and other.nlevels == self.nlevels:
+            return self._setop_codes(other, True, result_names)
+
         self_tuples = self.values
         other_tuples = other.values
         uniq_tuples = sorted(set(self_tuples) & set(other_tuples))
@@ -2869,6 +3077,9 @@ class MultiIndex(Index):
                               labels=[[]] * self.nlevels,
                               names=result_names)
 
+        if other.nlevels == self.nlevels:
+            return self._setop_codes(other, False, result_names)
+
         difference = sorted(set(self.values) - set(other.values))
 
         if len(difference) == 0:
@@ -2879,6 +3090,15 @@ class MultiIndex(Index):
             return MultiIndex.from_tuples(difference, sortorder=0,
                                           names=result_names)
 
+    def _setop_codes(self, other, in_other, names):
+        # the distinct rows of self that are (not) in other, by their codes
+        combined = self._append_multi([other])._sort_levels_monotonic()
+        codes = combined._engine.get_codes()
+        n = len(self)
+        mask = np.zeros(len(combined), dtype=bool)
+        mask[:n] = np.in1d(codes[:n], codes[n:]) == in_other
+        return combined._unique_sorted(mask, names=names)
+
     def _assert_can_do_setop(self, other):
         pass
 
@@ -3037,6 +3257,62 @@ def _validate_join_method(method):
         raise ValueError('do not recognize join method %s' % method)
 
 
+# the joins of recently aligned pairs of indexes, keyed by their identities;
+# the entries only hold weak references to the indexes and are dropped when
+# either of them is collected, so an id cannot be reused while cached
+_join_cache = LRUCache(maxsize=32)
+
+
+def _join_indexes(left, right, how='outer', level=None):
+    """
+    Join two indexes to align objects on them
+
+    Returns
+    -------
+    (join_index, left_indexer, right_indexer) : all None when the indexes
+        are equal; repeating the alignment of the same two index objects
+        (with the same names) is looked up rather than recomputed
+    """
+    key = id(left), id(right), how, level
+    names = list(left.names), list(right.names)
+    entry = _join_cache.get(key)
+    if (entry is not None and entry[0]() is left and entry[1]() is right and
+            entry[2] == names):
+        join_index, lidx, ridx = result = entry[3]
+        # a join that is one of its inputs is stored by side, not by value
+        if join_index is _JOIN_LEFT:
+            result = left, lidx, ridx
+        elif join_index is _JOIN_RIGHT:
+            result = right, lidx, ridx
+        return result
+
+    if left is right or (len(left) == len(right) and left.equals(right)):
+        result = None, None, None
+    else:
+        result = left.join(right, how=how, level=level,
+                           return_indexers=True)
+
+    # the indexers are handed out on every lookup, so must not be modified
+    for indexer in result[1:]:
+        if indexer is not None:
+            indexer.setflags(write=False)
+
+    cached = result
+    if result[0] is left:
+        cached = (_JOIN_LEFT,) + result[1:]
+    elif result[0] is right:
+        cached = (_JOIN_RIGHT,) + result[1:]
+
+    discard = lambda ref: _join_cache.discard(key)
+    _join_cache[key] = (weakref.ref(left, discard),
+                        weakref.ref(right, discard), names, cached)
+    return result
+
+
+_JOIN_LEFT = object()
+_JOIN_RIGHT = object()
+
+
 # TODO: handle index names!
 def _get_combined_index(indexes, intersect=False):
     indexes = _get_distinct_indexes(indexes)
@@ -131,6 +131,7 @@ class _NDFrameIndexer(object):
     def _setitem_with_indexer(self, indexer, value):
 
         self._has_valid_setitem_indexer(indexer)
+        self.obj._copy_if_shared()
 
         # also has the side effect of consolidating in-place
         from pandas import Panel, DataFrame, Series
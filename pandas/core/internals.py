@@ -2,10 +2,12 @@ import itertools
 import re
 from datetime import datetime, timedelta
 import copy
+import codecs
 from collections import defaultdict
 
 import numpy as np
 from pandas.core.base import PandasObject
+from pandas.core.categorical import Categorical
 
 from pandas.core.common import (_possibly_downcast_to_dtype, isnull, notnull,
                                 _NS_DTYPE, _TD_DTYPE, ABCSeries, ABCSparseSeries,
@@ -18,11 +20,69 @@ import pandas.core.common as com
 from pandas.sparse.array import _maybe_to_sparse, SparseArray
 import pandas.lib as lib
 import pandas.tslib as tslib
+from pandas.parser import downcast_int64
 import pandas.computation.expressions as expressions
 
 from pandas.tslib import Timestamp
 from pandas import compat
 from pandas.compat import range, lrange, lmap, callable, map, zip
+from pandas.core.config import get_option
+
+# when blocks of the same dtype are joined together, set by the
+# 'mode.consolidation' option
+_consolidation_policy = 'eager'
+
+# share the values of copied blocks until one of them is modified, set by
+# the 'mode.copy_on_write' option
+_copy_on_write = False
+
+# store the object columns holding only strings packed in StringBlocks, set
+# by the 'mode.pack_strings' option
+_pack_strings = False
+
+
+def _set_consolidation_policy(key):
+    '''Option change callback for the consolidation policy'''
+    global _consolidation_policy
+    _consolidation_policy = get_option(key)
+
+
+def _set_copy_on_write(key):
+    '''Option change callback for copy-on-write'''
+    global _copy_on_write
+    _copy_on_write = get_option(key)
+
+
+def _set_pack_strings(key):
+    '''Option change callback for packing strings'''
+    global _pack_strings
+    _pack_strings = get_option(key)
+
+
+def get_consolidation_stats(obj, reset=False):
+    """
+    Return how often the blocks of an object have been consolidated so far;
+    the counts are kept by its BlockManager (and carried over to the
+    consolidated managers that replace it)
+
+    Parameters
+    ----------
+    obj : DataFrame, Series, Panel or BlockManager
+    reset : boolean, default False
+        Reset the counts to zero (after returning them)
+
+    Returns
+    -------
+    stats : dict
+        consolidations : number of BlockManager consolidations
+        blocks_merged : number of blocks that were merged into others
+        bytes_copied : number of bytes copied by the merges
+    """
+    mgr = getattr(obj, '_data', obj)
+    stats = dict(mgr.consolidation_stats)
+    if reset:
+        mgr._consolidation_stats = None
+    return stats
 
 
 class Block(PandasObject):
@@ -42,6 +102,8 @@ class Block(PandasObject):
     is_timedelta = False
     is_bool = False
     is_object = False
+    is_string = False
+    is_categorical = False
     is_sparse = False
     _can_hold_na = False
     _downcast_dtype = None
@@ -224,7 +286,7 @@ class Block(PandasObject):
 
         new_items = new_ref_items
         if indexer is None:
-            new_values = self.values.copy() if copy else self.values
+            new_values = self._share_values() if copy else self.values
 
         else:
 
@@ -259,6 +321,44 @@ class Block(PandasObject):
     def iget(self, i):
         return self.values[i]
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the values in bytes; with deep, also count the python
+        objects referenced by object values
+        """
+        result = self.values.nbytes
+        if deep and self.is_object:
+            result += lib.memory_usage_of_objects(self.values.ravel())
+        return result
+
+    def _share_values(self):
+        """
+        Return the values for a copy of this block: the values themselves,
+        marked read-only, under copy-on-write, otherwise a copy of them
+        """
+        if _copy_on_write and not self.is_sparse:
+            self._mark_shared()
+            return self.values
+        return self.values.copy()
+
+    def _mark_shared(self):
+        """
+        Mark the values read-only, as shared with another block, so that they
+        are copied before being modified in place
+        """
+        self.values.flags.writeable = False
+
+    def _copy_if_shared(self):
+        """
+        Replace values that are shared with another block (marked read-only
+        by copy-on-write) with a private copy, before they are modified in
+        place; return whether a copy was made
+        """
+        if self.values.flags.writeable:
+            return False
+        self.values = self.values.copy()
+        return True
+
     def set(self, item, value):
         """
         Modify Block in-place with new item value
@@ -267,6 +367,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._copy_if_shared()
         loc = self.items.get_loc(item)
         self.values[loc] = value
 
@@ -380,6 +481,46 @@ class Block(PandasObject):
 
         return blocks
 
+    def compact(self, float_tolerance=0., max_categories=0.5):
+        """
+        Shrink the values of each item to the smallest dtype that holds them
+        (see _compact_values); the items that shrink get a block of their own
+        """
+        if self._is_single_block:
+            values = _compact_values(self.values, float_tolerance,
+                                     max_categories)
+            if values is None:
+                return [self]
+            return [make_block(values, self.items, self.ref_items,
+                               ndim=self.ndim, fastpath=True)]
+
+        compacted = [_compact_values(self.iget(i), float_tolerance,
+                                     max_categories)
+                     for i in range(len(self.items))]
+        if all(values is None for values in compacted):
+            return [self]
+
+        is_unique = self.items.is_unique
+        blocks = []
+        kept = [i for i, values in enumerate(compacted) if values is None]
+        if len(kept):
+            placement = None if is_unique else kept
+            blocks.append(make_block(self.values[kept], self.items.take(kept),
+                                     self.ref_items, ndim=self.ndim,
+                                     klass=self.__class__, fastpath=True,
+                                     placement=placement))
+
+        for i, values in enumerate(compacted):
+            if values is None:
+                continue
+            if not isinstance(values, Categorical):
+                values = values.reshape((1,) + values.shape)
+            placement = None if is_unique else [i]
+            blocks.append(make_block(values, self.items.take([i]),
+                                     self.ref_items, ndim=self.ndim,
+                                     fastpath=True, placement=placement))
+        return blocks
+
     def astype(self, dtype, copy=False, raise_on_error=True, values=None):
         return self._astype(dtype, copy=copy, raise_on_error=raise_on_error,
                             values=values)
@@ -516,7 +657,7 @@ class Block(PandasObject):
     def copy(self, deep=True, ref_items=None):
         values = self.values
         if deep:
-            values = values.copy()
+            values = self._share_values()
         if ref_items is None:
             ref_items = self.ref_items
         return make_block(
@@ -546,6 +687,7 @@ class Block(PandasObject):
             indexer is a direct slice/positional indexer; value must be a compaitable shape """
 
         # coerce args
+        self._copy_if_shared()
         values, value = self._try_coerce_args(self.values, value)
         arr_value = np.array(value)
 
@@ -607,6 +749,8 @@ class Block(PandasObject):
         a new block(s), the result of the putmask
         """
 
+        if inplace:
+            self._copy_if_shared()
         new_values = self.values if inplace else self.values.copy()
 
         # may need to align the new
@@ -732,6 +876,8 @@ class Block(PandasObject):
                     return [self.copy()]
 
         fill_value = self._try_fill(fill_value)
+        if inplace:
+            self._copy_if_shared()
         values = self.values if inplace else self.values.copy()
         values = self._try_operate(values)
         values = com.interpolate_2d(values, method, axis, limit, fill_value)
@@ -1253,6 +1399,8 @@ class ObjectBlock(Block):
                 result = [result]
             return result
 
+        if inplace:
+            self._copy_if_shared()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -1285,6 +1433,488 @@ class ObjectBlock(Block):
                                                 self.ref_items, fastpath=True)]
 
 
+class StringBlock(ObjectBlock):
+
+    """
+    An ObjectBlock of strings (and nulls) packed into a single byte buffer
+    (UTF-8 for unicode), with the int64 offsets of the strings into it and a
+    null mask. The object values are created on first access and kept,
+    marked read-only as they stand in for the packed strings; before the
+    values are modified in place the block unpacks itself, i.e. it keeps its
+    values as a plain object array from then on.
+    """
+    __slots__ = ['_data', '_offsets', '_mask', '_is_unicode', '_shape',
+                 '_unpacked', '_materialized']
+    is_string = True
+    _can_consolidate = False
+
+    def __init__(self, values, items, ref_items, ndim=2, fastpath=False,
+                 placement=None):
+        super(StringBlock, self).__init__(values, items, ref_items,
+                                          ndim=ndim, fastpath=fastpath,
+                                          placement=placement)
+        self._pack()
+
+    def _get_values(self):
+        if self._unpacked is None:
+            if self._materialized is None:
+                values = self._unpack()
+                values.flags.writeable = False
+                self._materialized = values
+            return self._materialized
+        return self._unpacked
+
+    def _set_values(self, values):
+        self._unpacked = values
+        self._data = self._offsets = self._mask = self._materialized = None
+
+    values = property(_get_values, _set_values)
+
+    def _pack(self):
+        """ pack the values, if they are all strings (or null) """
+        values = self._unpacked
+        try:
+            packed = lib.pack_string_array(com._ensure_object(values).ravel())
+        except (TypeError, UnicodeError):
+            # not all strings, or unicode (lone surrogates) that cannot be
+            # encoded as UTF-8
+            return
+        self._data, self._offsets, self._mask, self._is_unicode = packed
+        self._shape = values.shape
+        self._unpacked = None
+
+    def _unpack(self, indexer=None):
+        """ the object values (at the flat positions in indexer) """
+        values = lib.unpack_string_array(self._data, self._offsets,
+                                         self._mask, self._is_unicode,
+                                         indexer)
+        if indexer is None:
+            values = values.reshape(self._shape)
+        return values
+
+    @property
+    def is_packed(self):
+        return self._unpacked is None
+
+    @property
+    def packed_values(self):
+        """ (data, offsets, mask, is_unicode) of the packed strings """
+        return self._data, self._offsets, self._mask, self._is_unicode
+
+    def encode_like(self, value):
+        """
+        The string value encoded like the packed strings, or None if it is of
+        another type
+        """
+        if self._is_unicode:
+            if isinstance(value, compat.text_type):
+                return value.encode('utf-8')
+        elif isinstance(value, compat.binary_type):
+            return value
+        return None
+
+    def packed_item(self, i, slicer=None):
+        """
+        (data, offsets, mask) of the packed strings of the i-th item (of the
+        rows in the contiguous slice slicer); the offsets point into the
+        whole data buffer
+        """
+        n = self._shape[-1]
+        if slicer is None:
+            slicer = slice(None)
+        start, stop, step = slicer.indices(n)
+        if step != 1:
+            raise ValueError('only contiguous rows of packed strings can be '
+                             'taken')
+        start += i * n
+        stop = max(start, stop + i * n)
+        return self._data, self._offsets[start:stop + 1], self._mask[start:stop]
+
+    @property
+    def shape(self):
+        if self._unpacked is None:
+            return self._shape
+        return self._unpacked.shape
+
+    @property
+    def dtype(self):
+        return np.dtype(np.object_)
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def iget(self, i):
+        if self._unpacked is None and self.ndim > 1:
+            n = self._shape[1]
+            return self._unpack(np.arange(i * n, (i + 1) * n, dtype=np.int64))
+        return super(StringBlock, self).iget(i)
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        if com.is_integer(loc):
+            return self.iget(loc)
+        return super(StringBlock, self).get(item)
+
+    def _slice(self, slicer):
+        if (self._unpacked is None and self.ndim == 1 and
+                isinstance(slicer, slice)):
+            indexer = np.arange(self._shape[0], dtype=np.int64)[slicer]
+            return self._unpack(indexer)
+        return super(StringBlock, self)._slice(slicer)
+
+    def memory_usage(self, deep=False):
+        if self._unpacked is None:
+            return (self._data.nbytes + self._offsets.nbytes +
+                    self._mask.nbytes)
+        return super(StringBlock, self).memory_usage(deep=deep)
+
+    def _copy_if_shared(self):
+        """
+        Unpack the strings before the values are modified in place (the
+        values of a packed block are created on access); return whether the
+        values were unpacked or copied
+        """
+        if self._unpacked is None:
+            self._unpacked = self._unpack()
+            self._data = self._offsets = self._mask = None
+            self._materialized = None
+            return True
+        return super(StringBlock, self)._copy_if_shared()
+
+    def copy(self, deep=True, ref_items=None):
+        if self._unpacked is not None:
+            return super(StringBlock, self).copy(deep=deep,
+                                                 ref_items=ref_items)
+
+        # the packed buffers are never modified, so are always shared
+        if ref_items is None:
+            ref_items = self.ref_items
+        block = StringBlock.__new__(StringBlock)
+        block.set_ref_locs(self._ref_locs)
+        block.items = self.items
+        block.ref_items = ref_items
+        block.ndim = self.ndim
+        block._data, block._offsets = self._data, self._offsets
+        block._mask, block._is_unicode = self._mask, self._is_unicode
+        block._shape = self._shape
+        block._unpacked = block._materialized = None
+        return block
+
+    def to_fixed_bytes(self, na_rep, encoding=None, itemsize=0):
+        """
+        The strings as a fixed width bytes array (of our shape), with na_rep
+        for the nulls, encoded with encoding; None if they cannot be copied
+        from the packed buffer (they are unpacked or another encoding is
+        asked for)
+        """
+        if self._unpacked is not None:
+            return None
+        if self._is_unicode:
+            if encoding is None or codecs.lookup(encoding).name != 'utf-8':
+                return None
+            na_rep = compat.text_type(na_rep).encode('utf-8')
+        elif encoding is not None or not isinstance(na_rep, bytes):
+            return None
+
+        result = lib.packed_strings_to_fixed(self._data, self._offsets,
+                                             self._mask, na_rep,
+                                             itemsize=itemsize)
+        return result.reshape(self._shape)
+
+
+class CategoricalBlock(ObjectBlock):
+
+    """
+    A block of a single categorical item, held as its integer codes (of the
+    smallest integer dtype that fits the number of levels, -1 for nulls) and
+    its levels, i.e. a Categorical. The values are created on first access
+    and kept, marked read-only as they stand in for the codes; before the
+    values are modified in place the block unpacks itself, i.e. it keeps its
+    values as a plain array from then on. The dtype (and the is_* flags) are
+    those of the values, i.e. of the levels, upcast to hold the nulls.
+    """
+    __slots__ = ['_codes', '_levels', '_dtype', '_unpacked', '_materialized']
+    is_categorical = True
+    _can_consolidate = False
+
+    is_numeric = property(lambda self: issubclass(self._values_type,
+                                                  NumericBlock))
+    is_float = property(lambda self: self._values_type is FloatBlock)
+    is_complex = property(lambda self: self._values_type is ComplexBlock)
+    is_integer = property(lambda self: issubclass(self._values_type,
+                                                  IntBlock))
+    is_timedelta = property(lambda self: self._values_type is TimeDeltaBlock)
+    is_datetime = property(lambda self: self._values_type is DatetimeBlock)
+    is_bool = property(lambda self: self._values_type is BoolBlock)
+    is_object = property(lambda self: self._values_type is ObjectBlock)
+
+    def __init__(self, values, items, ref_items, ndim=2, fastpath=False,
+                 placement=None):
+        if not isinstance(values, Categorical):
+            super(CategoricalBlock, self).__init__(values, items, ref_items,
+                                                   ndim=ndim,
+                                                   fastpath=fastpath,
+                                                   placement=placement)
+            return
+
+        codes = np.asarray(values.labels).astype(
+            _codes_dtype(len(values.levels)))
+        if ndim is None or ndim == 2:
+            codes = codes.reshape((1, len(codes)))
+
+        # the codes stand in for the values when checking the shape
+        super(CategoricalBlock, self).__init__(codes, items, ref_items,
+                                               ndim=codes.ndim,
+                                               fastpath=fastpath,
+                                               placement=placement)
+        self._set_codes(codes, values.levels)
+
+    def _set_codes(self, codes, levels):
+        self._codes = codes
+        self._levels = levels
+        self._unpacked = None
+        self._materialized = None
+
+        # the dtype of the values, upcast to hold the nulls
+        dtype = levels.dtype
+        if (codes == -1).any():
+            dtype, _ = com._maybe_promote(dtype)
+        self._dtype = dtype
+
+    def _get_values(self):
+        if self._unpacked is None:
+            if self._materialized is None:
+                values = self._unpack()
+                values.flags.writeable = False
+                self._materialized = values
+            return self._materialized
+        return self._unpacked
+
+    def _set_values(self, values):
+        self._unpacked = values
+        self._codes = self._levels = self._materialized = None
+
+    values = property(_get_values, _set_values)
+
+    def _unpack(self):
+        values = com.take_1d(self._levels.values, self._codes.ravel())
+        return values.reshape(self._codes.shape)
+
+    @property
+    def _values_type(self):
+        """ the Block class of dense values of our dtype """
+        return _block_type(self.dtype)
+
+    @property
+    def is_packed(self):
+        return self._unpacked is None
+
+    @property
+    def categorical(self):
+        """ the Categorical of the codes and levels of the item """
+        return Categorical(com._ensure_platform_int(self._codes.ravel()),
+                           self._levels)
+
+    def _from_codes(self, codes, items=None, ref_items=None, placement=None):
+        """ a block of other codes of our levels """
+        block = CategoricalBlock.__new__(CategoricalBlock)
+        block.set_ref_locs(placement)
+        block.items = self.items if items is None else items
+        block.ref_items = self.ref_items if ref_items is None else ref_items
+        block.ndim = self.ndim
+        block._set_codes(codes, self._levels)
+        return block
+
+    def _take_codes(self, indexer, axis):
+        """ the codes at the positions in indexer, -1 where it is -1 """
+        indexer = com._ensure_platform_int(indexer)
+        codes = self._codes.take(indexer, axis=axis)
+        mask = indexer == -1
+        if mask.any():
+            slicer = [slice(None)] * codes.ndim
+            slicer[axis] = mask
+            codes[tuple(slicer)] = -1
+        return codes
+
+    @property
+    def shape(self):
+        if self._unpacked is None:
+            return self._codes.shape
+        return self._unpacked.shape
+
+    @property
+    def dtype(self):
+        if self._unpacked is None:
+            return self._dtype
+        return self._unpacked.dtype
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def should_store(self, value):
+        # new values of the item always go to a block of their own
+        return False
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        if self._unpacked is None and com.is_integer(loc):
+            return self.categorical
+        return super(CategoricalBlock, self).get(item)
+
+    def _slice(self, slicer):
+        if self._unpacked is None:
+            if self.ndim == 1:
+                return Categorical(self._codes[slicer], self._levels)
+            elif (isinstance(slicer, tuple) and len(slicer) == 2 and
+                  isinstance(slicer[0], slice) and
+                  slicer[0] == slice(None)):
+                return Categorical(self._codes[0][slicer[1]], self._levels)
+        return super(CategoricalBlock, self)._slice(slicer)
+
+    def take(self, indexer, ref_items, axis=1):
+        if self._unpacked is None:
+            if axis < 1:
+                raise AssertionError('axis must be at least 1, got %d' % axis)
+            codes = self._codes.take(com._ensure_platform_int(indexer),
+                                     axis=axis)
+            return [self._from_codes(codes, ref_items=ref_items)]
+        return super(CategoricalBlock, self).take(indexer, ref_items,
+                                                  axis=axis)
+
+    def reindex_axis(self, indexer, method=None, axis=1, fill_value=None,
+                     limit=None, mask_info=None):
+        if self._unpacked is None and isnull(fill_value):
+            if axis < 1:
+                raise AssertionError('axis must be at least 1, got %d' % axis)
+            return self._from_codes(self._take_codes(indexer, axis),
+                                    placement=self._ref_locs)
+        return super(CategoricalBlock, self).reindex_axis(
+            indexer, method=method, axis=axis, fill_value=fill_value,
+            limit=limit, mask_info=mask_info)
+
+    def reindex_items_from(self, new_ref_items, indexer=None, method=None,
+                           fill_value=None, limit=None, copy=True):
+        if (self._unpacked is not None or method is not None or
+                limit is not None or notnull(fill_value)):
+            return super(CategoricalBlock, self).reindex_items_from(
+                new_ref_items, indexer=indexer, method=method,
+                fill_value=fill_value, limit=limit, copy=copy)
+
+        if indexer is None:
+            new_ref_items, indexer = self.items.reindex(new_ref_items)
+
+        new_items = new_ref_items
+        codes = self._codes
+        if indexer is not None:
+            if self.ndim == 1:
+                codes = self._take_codes(indexer, 0)
+            else:
+                masked_idx = indexer[indexer != -1]
+                codes = codes.take(masked_idx, axis=0)
+                new_items = self.items.take(masked_idx)
+
+        return self._from_codes(codes, items=new_items,
+                                ref_items=new_ref_items)
+
+    def convert(self, copy=True, **kwargs):
+        if self._unpacked is None:
+            return [self.copy() if copy else self]
+        return super(CategoricalBlock, self).convert(copy=copy, **kwargs)
+
+    def compact(self, **kwargs):
+        if self._unpacked is None:
+            return [self]
+        return super(CategoricalBlock, self).compact(**kwargs)
+
+    def memory_usage(self, deep=False):
+        if self._unpacked is None:
+            levels = self._levels.values
+            result = self._codes.nbytes + levels.nbytes
+            if deep and levels.dtype == np.object_:
+                result += lib.memory_usage_of_objects(levels)
+            return result
+        return super(CategoricalBlock, self).memory_usage(deep=deep)
+
+    def _copy_if_shared(self):
+        """
+        Unpack the values before they are modified in place (the values of a
+        packed block are created on access); return whether the values were
+        unpacked or copied
+        """
+        if self._unpacked is None:
+            self.values = self._unpack()
+            return True
+        return super(CategoricalBlock, self)._copy_if_shared()
+
+    def copy(self, deep=True, ref_items=None):
+        if self._unpacked is not None:
+            return super(CategoricalBlock, self).copy(deep=deep,
+                                                      ref_items=ref_items)
+
+        # the codes are never modified, so are always shared
+        return self._from_codes(self._codes, ref_items=ref_items,
+                                placement=self._ref_locs)
+
+
+def _compact_values(values, float_tolerance=0., max_categories=0.5):
+    """
+    The values in the smallest dtype that holds them, or None if they do not
+    shrink: int64 to the smallest integer dtype (as the C parser's
+    compact_ints does), float64 to float32 if no value changes by more than
+    float_tolerance (relative), and 1-d object values with at most
+    max_categories * len(values) distinct values to a Categorical
+    """
+    if values.dtype == np.int64:
+        flat = values.ravel()
+
+        # the minimum int64 is the NA of downcast_int64
+        if not len(flat) or flat.min() == np.iinfo(np.int64).min:
+            return None
+        result = downcast_int64(flat).reshape(values.shape)
+
+    elif values.dtype == np.float64 and float_tolerance is not None:
+        result = values.astype(np.float32)
+        back = result.astype(np.float64)
+        ok = ((back == values) | (isnull(back) & isnull(values)) |
+              (np.abs(back - values) <= float_tolerance * np.abs(values)))
+        if not ok.all():
+            return None
+
+    elif (values.dtype == np.object_ and values.ndim == 1 and
+          max_categories and len(values)):
+        try:
+            result = Categorical.from_array(values)
+        except TypeError:
+            # unhashable values
+            return None
+        if len(result.levels) > max_categories * len(values):
+            return None
+        return result
+
+    else:
+        return None
+
+    if result.dtype == values.dtype:
+        return None
+    return result
+
+
+def _codes_dtype(n):
+    """ the smallest signed integer dtype of the codes of n levels """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
 class DatetimeBlock(Block):
     is_datetime = True
     _can_hold_na = True
@@ -1346,6 +1976,8 @@ class DatetimeBlock(Block):
 
     def fillna(self, value, inplace=False, downcast=None):
         # straight putmask here
+        if inplace:
+            self._copy_if_shared()
         values = self.values if inplace else self.values.copy()
         mask = com.isnull(self.values)
         value = self._try_fill(value)
@@ -1359,17 +1991,12 @@ class DatetimeBlock(Block):
         values = self.values
         if slicer is not None:
             values = values[:, slicer]
-        mask = isnull(values)
-
-        rvalues = np.empty(values.shape, dtype=object)
         if na_rep is None:
             na_rep = 'NaT'
-        rvalues[mask] = na_rep
-        imask = (-mask).ravel()
-        rvalues.flat[imask] = np.array(
-            [Timestamp(val)._repr_base for val in values.ravel()[imask]], dtype=object)
+        rvalues = tslib.format_array_from_datetime(
+            values.view('i8').ravel(), na_rep=na_rep)
 
-        return rvalues.tolist()
+        return rvalues.reshape(values.shape).tolist()
 
     def should_store(self, value):
         return issubclass(value.dtype.type, np.datetime64)
@@ -1533,6 +2160,9 @@ class SparseBlock(Block):
                                  kind=kind or self.kind, dtype=dtype, fill_value=fill_value, copy=copy)
         return make_block(new_values, items, ref_items, ndim=self.ndim, fastpath=fastpath)
 
+    def compact(self, **kwargs):
+        return [self]
+
     def interpolate(self, method='pad', axis=0, inplace=False,
                     limit=None, fill_value=None, **kwargs):
 
@@ -1544,6 +2174,8 @@ class SparseBlock(Block):
         # we may need to upcast our fill to match our dtype
         if issubclass(self.dtype.type, np.floating):
             value = float(value)
+        if inplace:
+            self._copy_if_shared()
         values = self.values if inplace else self.values.copy()
         return [ self.make_block(values.get_values(value), fill_value=value) ]
 
@@ -1639,27 +2271,19 @@ class SparseBlock(Block):
 
 def make_block(values, items, ref_items, klass=None, ndim=None, dtype=None, fastpath=False, placement=None):
 
+    if klass is None and isinstance(values, Categorical):
+        klass = CategoricalBlock
+
     if klass is None:
         dtype = dtype or values.dtype
-        vtype = dtype.type
 
         if isinstance(values, SparseArray):
             klass = SparseBlock
-        elif issubclass(vtype, np.floating):
-            klass = FloatBlock
-        elif issubclass(vtype, np.integer) and issubclass(vtype, np.timedelta64):
-            klass = TimeDeltaBlock
-        elif issubclass(vtype, np.integer) and not issubclass(vtype, np.datetime64):
-            klass = IntBlock
-        elif dtype == np.bool_:
-            klass = BoolBlock
-        elif issubclass(vtype, np.datetime64):
-            klass = DatetimeBlock
-        elif issubclass(vtype, np.complexfloating):
-            klass = ComplexBlock
+        else:
+            klass = _block_type(dtype)
 
         # try to infer a DatetimeBlock, or set to an ObjectBlock
-        else:
+        if klass is ObjectBlock:
 
             if np.prod(values.shape):
                 flat = values.ravel()
@@ -1675,11 +2299,31 @@ def make_block(values, items, ref_items, klass=None, ndim=None, dtype=None, fast
                     except:  # it already object, so leave it
                         pass
 
-            if klass is None:
-                klass = ObjectBlock
+                elif (_pack_strings and
+                      inferred_type in ('string', 'unicode', 'mixed') and
+                      lib.is_packable_string_array(com._ensure_object(flat))):
+                    klass = StringBlock
 
     return klass(values, items, ref_items, ndim=ndim, fastpath=fastpath, placement=placement)
 
+
+def _block_type(dtype):
+    """ the Block class of dense values of dtype, ObjectBlock for object """
+    vtype = dtype.type
+    if issubclass(vtype, np.floating):
+        return FloatBlock
+    elif issubclass(vtype, np.integer) and issubclass(vtype, np.timedelta64):
+        return TimeDeltaBlock
+    elif issubclass(vtype, np.integer) and not issubclass(vtype, np.datetime64):
+        return IntBlock
+    elif dtype == np.bool_:
+        return BoolBlock
+    elif issubclass(vtype, np.datetime64):
+        return DatetimeBlock
+    elif issubclass(vtype, np.complexfloating):
+        return ComplexBlock
+    return ObjectBlock
+
 # TODO: flexible with index=None and/or items=None
 
 
@@ -1701,7 +2345,8 @@ class BlockManager(PandasObject):
     This is *not* a public API class
     """
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map']
+                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map',
+                 '_consolidation_stats']
 
     def __init__(self, blocks, axes, do_integrity_check=True, fastpath=True):
         self.axes = [_ensure_index(ax) for ax in axes]
@@ -1983,9 +2628,9 @@ class BlockManager(PandasObject):
             if block.ref_items is not self.items:
                 raise AssertionError("Block ref_items must be BlockManager "
                                      "items")
-            if not block.is_sparse and block.values.shape[1:] != mgr_shape[1:]:
+            if not block.is_sparse and block.shape[1:] != mgr_shape[1:]:
                 construction_error(
-                    tot_items, block.values.shape[1:], self.axes)
+                    tot_items, block.shape[1:], self.axes)
         if len(self.items) != tot_items:
             raise AssertionError('Number of manager items must equal union of '
                                  'block items\n# manager items: {0}, # '
@@ -2059,6 +2704,9 @@ class BlockManager(PandasObject):
     def convert(self, *args, **kwargs):
         return self.apply('convert', *args, **kwargs)
 
+    def compact(self, *args, **kwargs):
+        return self.apply('compact', *args, **kwargs)
+
     def replace(self, *args, **kwargs):
         return self.apply('replace', *args, **kwargs)
 
@@ -2148,7 +2796,8 @@ class BlockManager(PandasObject):
     @property
     def is_mixed_type(self):
         # Warning, consolidation needs to get checked upstairs
-        self._consolidate_inplace()
+        if _consolidation_policy != 'never':
+            self._consolidate_inplace()
         return len(self.blocks) > 1
 
     @property
@@ -2327,6 +2976,30 @@ class BlockManager(PandasObject):
         new_axes = list(self.axes)
         return self.apply('copy', axes=new_axes, deep=deep, do_integrity_check=False)
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the values of each block in bytes, in the order of
+        self.blocks; see Block.memory_usage
+        """
+        return [block.memory_usage(deep=deep) for block in self.blocks]
+
+    def _copy_if_shared(self):
+        """
+        Give each block that shares its values with another block a private
+        copy of them; return whether any copy was made
+        """
+        copied = False
+        for block in self.blocks:
+            if block._copy_if_shared():
+                copied = True
+        return copied
+
+    def _mark_shared(self):
+        """ mark the values of the (dense) blocks as shared """
+        for block in self.blocks:
+            if not block.is_sparse:
+                block._mark_shared()
+
     def as_matrix(self, items=None):
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
@@ -2467,12 +3140,24 @@ class BlockManager(PandasObject):
             return self
 
         bm = self.__class__(self.blocks, self.axes)
+        bm._consolidation_stats = dict(self.consolidation_stats)
         bm._consolidate_inplace()
         return bm
 
+    @property
+    def consolidation_stats(self):
+        """ the counts of get_consolidation_stats """
+        stats = getattr(self, '_consolidation_stats', None)
+        if stats is None:
+            stats = dict(consolidations=0, blocks_merged=0, bytes_copied=0)
+            self._consolidation_stats = stats
+        return stats
+
     def _consolidate_inplace(self):
         if not self.is_consolidated():
-            self.blocks = _consolidate(self.blocks, self.items)
+            stats = self.consolidation_stats
+            stats['consolidations'] += 1
+            self.blocks = _consolidate(self.blocks, self.items, stats=stats)
 
             # reset our mappings
             if not self.items.is_unique:
@@ -2558,7 +3243,11 @@ class BlockManager(PandasObject):
         Set new item in-place. Does not consolidate. Adds new Block if not
         contained in the current set of items
         """
-        if not isinstance(value, SparseArray):
+        if isinstance(value, Categorical):
+            if len(value) != self.shape[-1]:
+                raise AssertionError('Shape of new values must be compatible '
+                                     'with manager shape')
+        elif not isinstance(value, SparseArray):
             if value.ndim == self.ndim - 1:
                 value = value.reshape((1,) + value.shape)
             if value.shape[1:] != self.shape[1:]:
@@ -2567,7 +3256,7 @@ class BlockManager(PandasObject):
 
         def _set_item(item, arr):
             i, block = self._find_block(item)
-            if not block.should_store(value):
+            if isinstance(value, Categorical) or not block.should_store(value):
                 # delete from block, create and append new block
                 self._delete_from_block(i, item)
                 self._add_new_block(item, arr, loc=None)
@@ -2641,7 +3330,7 @@ class BlockManager(PandasObject):
             # re-raise
             raise
 
-        if len(self.blocks) > 100:
+        if _consolidation_policy == 'eager' and len(self.blocks) > 100:
             self._consolidate_inplace()
 
         self._known_consolidated = False
@@ -2650,6 +3339,35 @@ class BlockManager(PandasObject):
         if loc != len(self.items) - 1 and new_items.is_unique:
             self.set_items_clear(new_items)
 
+    def append_items(self, items, values):
+        """
+        Add new items at the end, stacking the values of each dtype into a
+        single new block rather than adding a block per item
+
+        Parameters
+        ----------
+        items : list of labels, none of them already in the manager
+        values : list of arrays with the shape of an item (the manager
+            shape without the items axis)
+        """
+        items = _ensure_index(items)
+        if len(items) != len(values):
+            raise AssertionError('Number of items to append did not match')
+
+        new_items = self.items.append(items)
+        if not new_items.is_unique:
+            raise ValueError('cannot append items that already exist')
+
+        new_blocks = form_blocks(values, items, [items] + self.axes[1:])
+        self.set_items_norename(new_items)
+        for block in new_blocks:
+            block.set_ref_items(new_items, maybe_rename='clear')
+        self.blocks.extend(new_blocks)
+
+        self._known_consolidated = False
+        if _consolidation_policy == 'eager' and len(self.blocks) > 100:
+            self._consolidate_inplace()
+
     def set_items_norename(self, value):
         self.set_axis(0, value, maybe_rename=False, check_axis=False)
         self._shape = None
@@ -3148,12 +3866,25 @@ class SingleBlockManager(BlockManager):
 
         self.blocks = [block]
         self._block = self.blocks[0]
-        self._values = self._block.values
+        self._set_values()
         self._has_sparse = self._block.is_sparse
 
     def _post_setstate(self):
         self._block = self.blocks[0]
-        self._values = self._block.values
+        self._set_values()
+
+    def _set_values(self):
+        # the values of packed strings and categoricals are created on access
+        if self._block.is_string or self._block.is_categorical:
+            self._values = None
+        else:
+            self._values = self._block.values
+
+    def _copy_if_shared(self):
+        copied = super(SingleBlockManager, self)._copy_if_shared()
+        if copied:
+            self._set_values()
+        return copied
 
     @property
     def shape(self):
@@ -3223,6 +3954,8 @@ class SingleBlockManager(BlockManager):
 
     @property
     def values(self):
+        if self._values is None:
+            return self._block.values
         return self._values.view()
 
     @property
@@ -3308,10 +4041,13 @@ def form_blocks(arrays, names, axes):
     object_items = []
     sparse_items = []
     datetime_items = []
+    categorical_items = []
 
     for i, (k, v) in enumerate(zip(names, arrays)):
         if isinstance(v, (SparseArray, ABCSparseSeries)):
             sparse_items.append((i, k, v))
+        elif isinstance(v, Categorical) or _packed_categorical(v) is not None:
+            categorical_items.append((i, k, v))
         elif issubclass(v.dtype.type, np.floating):
             float_items.append((i, k, v))
         elif issubclass(v.dtype.type, np.complexfloating):
@@ -3361,15 +4097,37 @@ def form_blocks(arrays, names, axes):
             bool_items, items, np.bool_, is_unique=is_unique)
         blocks.extend(bool_blocks)
 
+    # the columns of only strings go to a (packed) StringBlock of their own
+    string_items = []
+    if _pack_strings and len(object_items) > 0:
+        other_items = []
+        for t in object_items:
+            v = com._ensure_object(np.asarray(t[2]))
+            if v.ndim == 1 and lib.is_packable_string_array(v):
+                string_items.append(t)
+            else:
+                other_items.append(t)
+        object_items = other_items
+
     if len(object_items) > 0:
         object_blocks = _simple_blockify(
             object_items, items, np.object_, is_unique=is_unique)
         blocks.extend(object_blocks)
 
+    if len(string_items) > 0:
+        string_blocks = _simple_blockify(
+            string_items, items, np.object_, is_unique=is_unique)
+        blocks.extend(string_blocks)
+
     if len(sparse_items) > 0:
         sparse_blocks = _sparse_blockify(sparse_items, items)
         blocks.extend(sparse_blocks)
 
+    if len(categorical_items) > 0:
+        categorical_blocks = _categorical_blockify(
+            categorical_items, items, is_unique=is_unique)
+        blocks.extend(categorical_blocks)
+
     if len(extra_items):
         shape = (len(extra_items),) + tuple(len(x) for x in axes[1:])
 
@@ -3436,6 +4194,22 @@ def _sparse_blockify(tuples, ref_items, dtype=None):
     return new_blocks
 
 
+def _categorical_blockify(tuples, ref_items, is_unique=True):
+    """ return a CategoricalBlock for each of the (categorical) arrays """
+
+    new_blocks = []
+    for i, name, array in tuples:
+        if not isinstance(array, Categorical):
+            array = _packed_categorical(array)
+        placement = None if is_unique else [i]
+        block = make_block(array, _ensure_index([name]), ref_items,
+                           klass=CategoricalBlock, fastpath=True,
+                           placement=placement)
+        new_blocks.append(block)
+
+    return new_blocks
+
+
 def _stack_arrays(tuples, ref_items, dtype):
 
     # fml
@@ -3471,6 +4245,25 @@ def _stack_arrays(tuples, ref_items, dtype):
     return items, stacked, placement
 
 
+def _packed_string_block(obj):
+    """ the packed StringBlock holding the values of a Series, or None """
+    block = getattr(getattr(obj, '_data', None), '_block', None)
+    if block is not None and block.is_string and block.is_packed:
+        return block
+    return None
+
+
+def _packed_categorical(obj):
+    """
+    the Categorical of the values of a Series held in a packed
+    CategoricalBlock, or None
+    """
+    block = getattr(getattr(obj, '_data', None), '_block', None)
+    if block is not None and block.is_categorical and block.is_packed:
+        return block.categorical
+    return None
+
+
 def _blocks_to_series_dict(blocks, index=None):
     from pandas.core.series import Series
 
@@ -3488,7 +4281,11 @@ def _interleaved_dtype(blocks):
 
     counts = defaultdict(lambda: [])
     for x in blocks:
-        counts[type(x)].append(x)
+        # categoricals interleave like the dense values of their dtype
+        if x.is_categorical:
+            counts[x._values_type].append(x)
+        else:
+            counts[type(x)].append(x)
 
     def _lcd_dtype(l):
         """ find the lowest dtype that can accomodate the given types """
@@ -3500,7 +4297,7 @@ def _interleaved_dtype(blocks):
 
     have_int = len(counts[IntBlock]) > 0
     have_bool = len(counts[BoolBlock]) > 0
-    have_object = len(counts[ObjectBlock]) > 0
+    have_object = len(counts[ObjectBlock]) + len(counts[StringBlock]) > 0
     have_float = len(counts[FloatBlock]) > 0
     have_complex = len(counts[ComplexBlock]) > 0
     have_dt64 = len(counts[DatetimeBlock]) > 0
@@ -3541,9 +4338,10 @@ def _interleaved_dtype(blocks):
         return _lcd_dtype(counts[FloatBlock] + counts[SparseBlock])
 
 
-def _consolidate(blocks, items):
+def _consolidate(blocks, items, stats=None):
     """
-    Merge blocks having same dtype, exclude non-consolidating blocks
+    Merge blocks having same dtype, exclude non-consolidating blocks; count
+    the merges in the dict stats, if passed
     """
 
     # sort by _can_consolidate, dtype
@@ -3552,8 +4350,14 @@ def _consolidate(blocks, items):
 
     new_blocks = []
     for (_can_consolidate, dtype), group_blocks in grouper:
+        group_blocks = list(group_blocks)
+        if stats is not None and _can_consolidate and len(group_blocks) > 1:
+            stats['blocks_merged'] += len(group_blocks) - 1
+            stats['bytes_copied'] += sum(b.values.nbytes
+                                         for b in group_blocks)
+
         merged_blocks = _merge_blocks(
-            list(group_blocks), items, dtype=dtype, _can_consolidate=_can_consolidate)
+            group_blocks, items, dtype=dtype, _can_consolidate=_can_consolidate)
         if isinstance(merged_blocks, list):
             new_blocks.extend(merged_blocks)
         else:
@@ -3573,8 +4377,28 @@ def _merge_blocks(blocks, items, dtype=None, _can_consolidate=True):
                 raise AssertionError("_merge_blocks are invalid!")
             dtype = blocks[0].dtype
 
-        new_values = _vstack([b.values for b in blocks], dtype)
         new_items = blocks[0].items.append([b.items for b in blocks[1:]])
+
+        # unique, can put the rows in the order of items directly rather
+        # than stacking and then reindexing, which copies everything twice
+        if items.is_unique:
+            positions = items.get_indexer(new_items)
+            if (positions != -1).all():
+                order = positions.argsort()
+                rank = np.empty(len(order), dtype=np.int64)
+                rank[order] = np.arange(len(order))
+
+                values = blocks[0].values
+                new_values = np.empty((len(new_items),) + values.shape[1:],
+                                      dtype=values.dtype)
+                start = 0
+                for b in blocks:
+                    end = start + len(b.items)
+                    new_values[rank[start:end]] = b.values
+                    start = end
+                return make_block(new_values, new_items.take(order), items)
+
+        new_values = _vstack([b.values for b in blocks], dtype)
         new_block = make_block(new_values, new_items, items)
 
         # unique, can reindex
@@ -23,12 +23,14 @@ from pandas.core.common import (isnull, notnull, _is_bool_indexer,
                                 _possibly_convert_platform,
                                 ABCSparseArray)
 from pandas.core.index import (Index, MultiIndex, InvalidIndexError,
-                               _ensure_index, _handle_legacy_indexes)
+                               _ensure_index, _handle_legacy_indexes,
+                               _join_indexes)
 from pandas.core.indexing import (
     _SeriesIndexer, _check_bool_indexer, _check_slice_bounds,
     _is_index_slice, _maybe_convert_indices)
 from pandas.core import generic
-from pandas.core.internals import SingleBlockManager
+from pandas.core.internals import (SingleBlockManager, _packed_string_block,
+                                   _packed_categorical)
 from pandas.core.categorical import Categorical
 from pandas.tseries.index import DatetimeIndex
 from pandas.tseries.period import PeriodIndex, Period
@@ -276,13 +278,12 @@ def _arith_method(op, name, fill_zeros=None):
 
         if isinstance(rvalues, Series):
 
-            join_idx, lidx, ridx = left.index.join(rvalues.index, how='outer',
-                                                   return_indexers=True)
-            rindex = rvalues.index
+            join_idx, lidx, ridx = _join_indexes(left.index, rvalues.index,
+                                                 how='outer')
             name = _maybe_match_name(left, rvalues)
             lvalues = getattr(lvalues, 'values', lvalues)
             rvalues = getattr(rvalues, 'values', rvalues)
-            if left.index.equals(rindex):
+            if join_idx is None:
                 index = left.index
             else:
                 index = join_idx
@@ -334,11 +335,11 @@ def _comp_method(op, name, masker=False):
         from pandas.core.frame import DataFrame
 
         if isinstance(other, Series):
-            name = _maybe_match_name(self, other)
+            res_name = _maybe_match_name(self, other)
             if len(self) != len(other):
                 raise ValueError('Series lengths must match to compare')
             return self._constructor(na_op(self.values, other.values),
-                                     index=self.index, name=name)
+                                     index=self.index, name=res_name)
         elif isinstance(other, DataFrame):  # pragma: no cover
             return NotImplemented
         elif isinstance(other, (pa.Array, Series)):
@@ -348,6 +349,20 @@ def _comp_method(op, name, masker=False):
                                      index=self.index, name=self.name)
         else:
 
+            # compare packed strings for equality without creating them
+            block = _packed_string_block(self)
+            if block is not None and name in ('__eq__', '__ne__'):
+                pattern = block.encode_like(other)
+                if pattern is not None:
+                    data, offsets, mask, _ = block.packed_values
+                    res = lib.match_packed_strings(data, offsets, mask,
+                                                   pattern, 'equal')
+                    res = res.view(np.bool_)
+                    if name == '__ne__':
+                        res = ~res
+                        res[mask.astype(np.bool_)] = masker
+                    return Series(res, index=self.index, name=self.name)
+
             mask = isnull(self)
 
             values = self.values
@@ -629,7 +644,14 @@ class Series(generic.NDFrame):
             elif isinstance(data, Categorical):
                 if name is None:
                     name = data.name
-                data = np.asarray(data)
+                if dtype is None and (index is None or
+                                      len(index) == len(data)):
+                    # keep the codes and levels in a CategoricalBlock
+                    if index is None:
+                        index = _default_index(len(data))
+                    data = SingleBlockManager(data, index, fastpath=True)
+                else:
+                    data = np.asarray(data)
             elif isinstance(data, types.GeneratorType):
                 data = list(data)
             elif isinstance(data, (set, frozenset)):
@@ -914,6 +936,10 @@ class Series(generic.NDFrame):
         if raise_on_error:
             _check_slice_bounds(slobj, self.values)
 
+        if self._data._block.is_categorical:
+            # keep the codes and levels of a categorical
+            return self._constructor(self._data.get_slice(slobj),
+                                     name=self.name, fastpath=True)
         return self._constructor(self.values[slobj], index=self.index[slobj],
                                  name=self.name)
 
@@ -1017,6 +1043,7 @@ class Series(generic.NDFrame):
             return self.values[indexer]
 
     def __setitem__(self, key, value):
+        self._copy_if_shared()
         try:
             self._set_with_engine(key, value)
             return
@@ -1222,6 +1249,7 @@ class Series(generic.NDFrame):
             If label is contained, will be reference to calling Series,
             otherwise a new object
         """
+        self._copy_if_shared()
         try:
             self.index._engine.set_value(self.values, label, value)
             return self
@@ -1610,7 +1638,7 @@ class Series(generic.NDFrame):
         counts : Series
         """
         from pandas.core.algorithms import value_counts
-        return value_counts(self.values, sort=sort, ascending=ascending,
+        return value_counts(self, sort=sort, ascending=ascending,
                             normalize=normalize, bins=bins)
 
     def unique(self):
@@ -2307,6 +2335,7 @@ class Series(generic.NDFrame):
         other = other.reindex_like(self)
         mask = notnull(other)
 
+        self._copy_if_shared()
         self._data = self._data.putmask(mask, other, inplace=True)
         self._maybe_update_cacher()
 
@@ -2465,10 +2494,17 @@ class Series(generic.NDFrame):
                 # uses the argsort default quicksort
                 return arr.argsort(kind='quicksort')
 
-        arr = self.values
-        sortedIdx = pa.empty(len(self), dtype=np.int32)
+        factor = _packed_categorical(self)
+        if factor is not None and factor.levels.is_monotonic:
+            # the codes of sorted levels sort like the values
+            arr = factor.labels
+            bad = arr == -1
+        else:
+            factor = None
+            arr = self.values
+            bad = isnull(arr)
 
-        bad = isnull(arr)
+        sortedIdx = pa.empty(len(self), dtype=np.int32)
 
         good = -bad
         idx = pa.arange(len(self))
@@ -2487,7 +2523,10 @@ class Series(generic.NDFrame):
             sortedIdx[n:] = idx[good][argsorted]
             sortedIdx[:n] = idx[bad]
 
-        return self._constructor(arr[sortedIdx], index=self.index[sortedIdx],
+        values = arr[sortedIdx]
+        if factor is not None:
+            values = Categorical(values, factor.levels)
+        return self._constructor(values, index=self.index[sortedIdx],
                                  name=self.name)
 
     def sortlevel(self, level=0, ascending=True):
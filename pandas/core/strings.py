@@ -3,6 +3,7 @@ import numpy as np
 from pandas.compat import zip
 from pandas.core.common import isnull, _values_from_object
 from pandas.core.series import Series
+from pandas.core.internals import _packed_string_block
 import pandas.compat as compat
 import re
 import pandas.lib as lib
@@ -114,6 +115,39 @@ def _map(f, arr, na_mask=False, na_value=np.nan):
     else:
         return lib.map_infer(arr, f)
 
+def _packed_result(result, mask, na_value=np.nan):
+    """ the result of a packed strings kernel as _na_map would return it """
+    mask = mask.astype(np.bool_)
+    if not mask.any():
+        return result
+    if result.dtype == np.int64 and na_value is np.nan:
+        result = result.astype(np.float64)
+        result[mask] = np.nan
+        return result
+    result = result.astype(object)
+    result[mask] = na_value
+    return lib.maybe_convert_objects(result)
+
+
+def _packed_match(arr, pat, how, na):
+    """
+    match the packed strings of arr against pat with
+    lib.match_packed_strings, or return None if they are not packed
+    """
+    block = _packed_string_block(arr)
+    if block is None:
+        return None
+    bpat = block.encode_like(pat)
+    if bpat is None:
+        return None
+    data, offsets, mask, _ = block.packed_values
+    result = lib.match_packed_strings(data, offsets, mask, bpat, how)
+    return _packed_result(result.view(np.bool_), mask, na)
+
+
+_regex_chars = frozenset('.^$*+?{}[]\\|()')
+
+
 def str_title(arr):
     """
     Convert strings to titlecased version
@@ -163,6 +197,12 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan):
     -------
 
     """
+    if (case and not flags and isinstance(pat, compat.string_types) and
+            not _regex_chars.intersection(pat)):
+        result = _packed_match(arr, pat, 'contains', na)
+        if result is not None:
+            return result
+
     if not case:
         flags |= re.IGNORECASE
 
@@ -187,6 +227,10 @@ def str_startswith(arr, pat, na=np.nan):
     -------
     startswith : array (boolean)
     """
+    result = _packed_match(arr, pat, 'startswith', na)
+    if result is not None:
+        return result
+
     f = lambda x: x.startswith(pat)
     return _na_map(f, arr, na)
 
@@ -206,6 +250,10 @@ def str_endswith(arr, pat, na=np.nan):
     -------
     endswith : array (boolean)
     """
+    result = _packed_match(arr, pat, 'endswith', na)
+    if result is not None:
+        return result
+
     f = lambda x: x.endswith(pat)
     return _na_map(f, arr, na)
 
@@ -353,6 +401,11 @@ def str_len(arr):
     -------
     lengths : array
     """
+    block = _packed_string_block(arr)
+    if block is not None:
+        data, offsets, mask, is_unicode = block.packed_values
+        result = lib.len_packed_strings(data, offsets, mask, is_unicode)
+        return _packed_result(result, mask)
     return _na_map(len, arr)
 
 
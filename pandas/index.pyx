@@ -201,6 +201,10 @@ cdef class IndexEngine:
     property is_unique:
 
         def __get__(self):
+            # a sorted index finds out uniqueness in the monotonic check,
+            # without building the hash table
+            if not self.unique_check and not self.monotonic_check:
+                self._do_monotonic_check()
             if not self.unique_check:
                 self._do_unique_check()
 
@@ -263,9 +267,23 @@ cdef class IndexEngine:
         self.initialized = 0
 
     def get_indexer(self, values):
+        # a unique, monotonic index is merged with a monotonic target
+        # instead of building the hash table (kept for the engine's life)
+        if not self.initialized and self.is_monotonic and self.is_unique:
+            result = self._get_merge_indexer(values)
+            if result is not None:
+                return result
+
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
+    def _get_merge_indexer(self, values):
+        """
+        The indexer of the values from a merge with the (unique,
+        monotonic) index values, or None if the values are not monotonic
+        """
+        return None
+
     def get_indexer_non_unique(self, targets):
         """ return an indexer suitable for takng from a non unique index
             return the labels in the same order ast the target
@@ -343,6 +361,13 @@ cdef class Int64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return algos.is_monotonic_int64(values)
 
+    def _get_merge_indexer(self, values):
+        if (values.dtype != np.int64 or
+                not algos.is_monotonic_int64(values)[0]):
+            return None
+        return algos.left_join_indexer_unique_int64(values,
+                                                    self._get_index_values())
+
     def get_pad_indexer(self, other, limit=None):
         return algos.pad_int64(self._get_index_values(), other,
                                limit=limit)
@@ -399,6 +424,16 @@ cdef class Float64Engine(IndexEngine):
     def _call_monotonic(self, values):
         return algos.is_monotonic_float64(values)
 
+    def _get_merge_indexer(self, values):
+        # NaN compares as neither smaller nor larger
+        if (values.dtype != np.float64 or
+                not algos.is_monotonic_float64(values)[0]):
+            return None
+        index_values = self._get_index_values()
+        if np.isnan(values).any() or np.isnan(index_values).any():
+            return None
+        return algos.left_join_indexer_unique_float64(values, index_values)
+
     def get_pad_indexer(self, other, limit=None):
         return algos.pad_float64(self._get_index_values(), other,
                                     limit=limit)
@@ -524,11 +559,10 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != 'M8[ns]':
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
-        return self.mapping.lookup(values)
+        return Int64Engine.get_indexer(self, values)
 
     def get_pad_indexer(self, other, limit=None):
         if other.dtype != 'M8[ns]':
@@ -545,6 +579,158 @@ cdef class DatetimeEngine(Int64Engine):
                                      limit=limit)
 
 
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def pack_level_labels(list labels, list sizes, list tables=None):
+    """
+    Pack the level labels of the rows of a MultiIndex (-1 for a null) into
+    int64 codes, in mixed radix with the labels shifted by one. Where the
+    next level could overflow int64, the codes so far are first replaced by
+    dense ids: without tables these are assigned (building the tables),
+    with them they are looked up and rows not found get code -1
+
+    Returns
+    -------
+    (codes, tables) : tables holds an (Int64HashTable, count) pair for each
+        level where the codes were replaced, None elsewhere
+    """
+    cdef:
+        Py_ssize_t i, nlevels = len(labels)
+        bint build = tables is None
+
+    if build:
+        tables = [None] * nlevels
+
+    codes = algos.ensure_int64(labels[0]) + 1
+    missing = None
+    radix = sizes[0]
+    for i in range(1, nlevels):
+        if build and radix * sizes[i] >= _INT64_MAX:
+            table = _hash.Int64HashTable(len(codes))
+            uniques = _hash.Int64Vector()
+            codes = table.get_labels(codes, uniques, 0, -1)
+            tables[i] = (table, len(uniques))
+        elif not build and tables[i] is not None:
+            codes = tables[i][0].lookup(codes)
+            mask = codes == -1
+            missing = mask if missing is None else missing | mask
+
+        if tables[i] is not None:
+            radix = tables[i][1]
+        codes = codes * sizes[i] + (algos.ensure_int64(labels[i]) + 1)
+        radix *= sizes[i]
+
+    if missing is not None and missing.any():
+        codes[missing] = -1
+    return codes, tables
+
+
+cdef class MultiIndexEngine(Int64Engine):
+    """
+    Hash the rows of a MultiIndex as their packed level labels (see
+    pack_level_labels) rather than as tuples of values
+    """
+
+    cdef readonly:
+        object levels, labels
+
+    cdef:
+        object sizes, codes, tables
+
+    def __init__(self, levels, labels, n):
+        self.levels = list(levels)
+        self.labels = list(labels)
+        self.sizes = [len(lev) + 1 for lev in self.levels]
+        self.codes = None
+        IndexEngine.__init__(self, self.get_codes, n)
+
+    def get_codes(self):
+        """ the packed level labels of the rows """
+        if self.codes is None:
+            self.codes, self.tables = pack_level_labels(self.labels,
+                                                        self.sizes)
+        return self.codes
+
+    property codes_sort_like_values:
+        """ whether the codes are ordered as the tuples of values """
+
+        def __get__(self):
+            self.get_codes()
+            for i in range(len(self.levels)):
+                if (self.tables[i] is not None or
+                        not self.levels[i].is_monotonic or
+                        (self.labels[i] == -1).any()):
+                    return False
+            return True
+
+    cdef _pack_key(self, object key):
+        cdef Py_ssize_t i
+
+        if not PyTuple_Check(key) or len(key) != len(self.levels):
+            raise KeyError(key)
+
+        self.get_codes()
+        code = 0
+        for i in range(len(self.levels)):
+            if i > 0:
+                if self.tables[i] is not None:
+                    code = self.tables[i][0].get_item(code)
+                code *= self.sizes[i]
+
+            # a null is label -1, i.e. adds nothing
+            val = key[i]
+            if not util._checknull(val):
+                try:
+                    lab = self.levels[i].get_loc(val)
+                except (TypeError, ValueError):
+                    raise KeyError(key)
+                if not util.is_integer_object(lab):
+                    raise KeyError(key)
+                code += lab + 1
+        return code
+
+    def __contains__(self, object val):
+        try:
+            code = self._pack_key(val)
+        except (KeyError, TypeError):
+            return False
+        return IndexEngine.__contains__(self, code)
+
+    cpdef get_loc(self, object val):
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        try:
+            return Int64Engine.get_loc(self, self._pack_key(val))
+        except KeyError:
+            raise KeyError(val)
+
+    def get_indexer(self, target):
+        """
+        The locations of the rows of the MultiIndex target, -1 where not
+        found; only the level labels are compared
+        """
+        cdef Py_ssize_t i
+
+        self.get_codes()
+        labels = []
+        missing = np.zeros(len(target), dtype=bool)
+        for i in range(len(self.levels)):
+            tlab = algos.ensure_int64(target.labels[i])
+            lev_indexer = algos.ensure_int64(
+                self.levels[i].get_indexer(target.levels[i]))
+            lab = lev_indexer.take(tlab)
+            is_null = tlab == -1
+            missing |= (lab == -1) & ~is_null
+            lab[is_null] = -1
+            labels.append(lab)
+
+        codes, _ = pack_level_labels(labels, self.sizes, self.tables)
+        codes[missing] = -1
+        return IndexEngine.get_indexer(self, codes)
+
+
 cpdef convert_scalar(ndarray arr, object value):
     if arr.descr.type_num == NPY_DATETIME:
         if isinstance(value,np.ndarray):
@@ -5,6 +5,7 @@ Module parse to/from Excel
 #----------------------------------------------------------------------
 # ExcelFile class
 import os
+import copy
 import datetime
 import abc
 import numpy as np
@@ -15,6 +16,7 @@ from pandas import json
 from pandas.compat import map, zip, reduce, range, lrange, u, add_metaclass
 from pandas.core import config
 from pandas.core.common import pprint_thing, PandasError
+import pandas.core.common as com
 import pandas.compat as compat
 from warnings import warn
 
@@ -54,8 +56,9 @@ def read_excel(path_or_buf, sheetname, **kwds):
          Name of Excel sheet
     header : int, default 0
          Row to use for the column labels of the parsed DataFrame
-    skiprows : list-like
-        Rows to skip at the beginning (0-indexed)
+    skiprows : list-like or integer
+        Rows to skip at the beginning (0-indexed), or the number of rows to
+        skip
     skip_footer : int, default 0
         Rows at the end to skip (0-indexed)
     index_col : int, default None
@@ -67,6 +70,14 @@ def read_excel(path_or_buf, sheetname, **kwds):
         * If list of ints then indicates list of column numbers to be parsed
         * If string then indicates comma separated list of column names and
           column ranges (e.g. "A:E" or "A,C,E:F")
+    nrows : int, default None
+        Number of data rows to read; the rest of the sheet is not read
+    chunksize : int, default None
+        Return a TextFileReader that reads the sheet in chunks of this many
+        rows, for iteration
+    engine : {'xlrd', 'openpyxl'}, default 'xlrd'
+        'openpyxl' streams the rows of an xlsx sheet from the file instead of
+        loading the whole sheet
     na_values : list-like, default None
         List of additional strings to recognize as NA/NaN
     keep_default_na : bool, default True
@@ -84,20 +95,44 @@ def read_excel(path_or_buf, sheetname, **kwds):
         kwds.pop('kind')
         warn("kind keyword is no longer supported in read_excel and may be "
              "removed in a future version", FutureWarning)
-    return ExcelFile(path_or_buf).parse(sheetname=sheetname, **kwds)
+    engine = kwds.pop('engine', None)
+    io = ExcelFile(path_or_buf, engine=engine)
+    result = io.parse(sheetname=sheetname, **kwds)
+
+    # a chunked reader still reads from the workbook
+    if kwds.get('chunksize') is None:
+        io.close()
+    return result
 
 
 class ExcelFile(object):
     """
     Class for parsing tabular excel sheets into DataFrame objects.
-    Uses xlrd. See ExcelFile.parse for more documentation
+    Uses xlrd by default. See ExcelFile.parse for more documentation
 
     Parameters
     ----------
     path : string or file-like object
         Path to xls or xlsx file
+    engine : {'xlrd', 'openpyxl'}, default 'xlrd'
+        Library used to read the file. 'openpyxl' (xlsx files only) opens the
+        workbook read-only and streams the rows of a sheet from the file
+        instead of loading the whole sheet into memory
     """
-    def __init__(self, path_or_buf, **kwds):
+    def __init__(self, path_or_buf, engine=None, **kwds):
+
+        if engine is None:
+            engine = 'xlrd'
+        if engine not in ('xlrd', 'openpyxl'):
+            raise ValueError("Unknown engine: %s" % engine)
+
+        self.path_or_buf = path_or_buf
+        self.tmpfile = None
+        self.engine = engine
+
+        if engine == 'openpyxl':
+            self.book = _open_openpyxl_workbook(path_or_buf)
+            return
 
         import xlrd  # throw an ImportError if we need to
 
@@ -106,19 +141,17 @@ class ExcelFile(object):
             raise ImportError("pandas requires xlrd >= 0.9.0 for excel "
                               "support, current version " + xlrd.__VERSION__)
 
-        self.path_or_buf = path_or_buf
-        self.tmpfile = None
-
+        # only load the sheets that are parsed
         if isinstance(path_or_buf, compat.string_types):
-            self.book = xlrd.open_workbook(path_or_buf)
+            self.book = xlrd.open_workbook(path_or_buf, on_demand=True)
         else:
             data = path_or_buf.read()
-            self.book = xlrd.open_workbook(file_contents=data)
+            self.book = xlrd.open_workbook(file_contents=data, on_demand=True)
 
     def parse(self, sheetname, header=0, skiprows=None, skip_footer=0,
               index_col=None, parse_cols=None, parse_dates=False,
               date_parser=None, na_values=None, thousands=None, chunksize=None,
-              **kwds):
+              nrows=None, **kwds):
         """Read an Excel table into DataFrame
 
         Parameters
@@ -127,8 +160,9 @@ class ExcelFile(object):
             Name of Excel sheet or the page number of the sheet
         header : int, default 0
             Row to use for the column labels of the parsed DataFrame
-        skiprows : list-like
-            Rows to skip at the beginning (0-indexed)
+        skiprows : list-like or integer
+            Rows to skip at the beginning (0-indexed), or the number of rows
+            to skip
         skip_footer : int, default 0
             Rows at the end to skip (0-indexed)
         index_col : int, default None
@@ -141,6 +175,12 @@ class ExcelFile(object):
               parsed
             * If string then indicates comma separated list of column names and
               column ranges (e.g. "A:E" or "A,C,E:F")
+            ``usecols`` is accepted as an alias
+        nrows : int, default None
+            Number of data rows to read; the rest of the sheet is not read
+        chunksize : int, default None
+            Return a TextFileReader that reads the sheet in chunks of this many
+            rows, for iteration
         na_values : list-like, default None
             List of additional strings to recognize as NA/NaN
         keep_default_na : bool, default True
@@ -160,6 +200,10 @@ class ExcelFile(object):
         if skipfooter is not None:
             skip_footer = skipfooter
 
+        usecols = kwds.pop('usecols', None)
+        if parse_cols is None:
+            parse_cols = usecols
+
         return self._parse_excel(sheetname, header=header, skiprows=skiprows,
                                  index_col=index_col,
                                  has_index_names=has_index_names,
@@ -167,7 +211,7 @@ class ExcelFile(object):
                                  parse_dates=parse_dates,
                                  date_parser=date_parser, na_values=na_values,
                                  thousands=thousands, chunksize=chunksize,
-                                 skip_footer=skip_footer, **kwds)
+                                 skip_footer=skip_footer, nrows=nrows, **kwds)
 
     def _should_parse(self, i, parse_cols):
 
@@ -202,46 +246,31 @@ class ExcelFile(object):
         else:
             return i in parse_cols
 
+    def _columns_to_parse(self, ncols, parse_cols):
+        if parse_cols is None:
+            return lrange(ncols)
+        return [j for j in range(ncols) if self._should_parse(j, parse_cols)]
+
     def _parse_excel(self, sheetname, header=0, skiprows=None, skip_footer=0,
                      index_col=None, has_index_names=None, parse_cols=None,
                      parse_dates=False, date_parser=None, na_values=None,
-                     thousands=None, chunksize=None, **kwds):
-        from xlrd import (xldate_as_tuple, XL_CELL_DATE,
-                          XL_CELL_ERROR, XL_CELL_BOOLEAN)
+                     thousands=None, chunksize=None, nrows=None, **kwds):
+        if com.is_integer(skiprows):
+            skiprows = lrange(skiprows)
+        skiprows = set() if skiprows is None else set(skiprows)
 
-        datemode = self.book.datemode
-        if isinstance(sheetname, compat.string_types):
-            sheet = self.book.sheet_by_name(sheetname)
-        else:  # assume an integer if not a string
-            sheet = self.book.sheet_by_index(sheetname)
-
-        data = []
-        should_parse = {}
-        for i in range(sheet.nrows):
-            row = []
-            for j, (value, typ) in enumerate(zip(sheet.row_values(i),
-                                                 sheet.row_types(i))):
-                if parse_cols is not None and j not in should_parse:
-                    should_parse[j] = self._should_parse(j, parse_cols)
-
-                if parse_cols is None or should_parse[j]:
-                    if typ == XL_CELL_DATE:
-                        dt = xldate_as_tuple(value, datemode)
-                        # how to produce this first case?
-                        if dt[0] < datetime.MINYEAR:  # pragma: no cover
-                            value = datetime.time(*dt[3:])
-                        else:
-                            value = datetime.datetime(*dt)
-                    elif typ == XL_CELL_ERROR:
-                        value = np.nan
-                    elif typ == XL_CELL_BOOLEAN:
-                        value = bool(value)
-                    row.append(value)
-
-            data.append(row)
+        if self.engine == 'openpyxl':
+            rows = self._openpyxl_rows(sheetname, parse_cols)
+        else:
+            rows = self._xlrd_rows(sheetname, parse_cols)
 
+        # the skipped rows are dropped while reading, so the header is
+        # the row at its position among the remaining rows, i.e. the first
+        # row at or after header that is not skipped
         if header is not None:
-            data[header] = _trim_excel_header(data[header])
+            header -= len([i for i in skiprows if i < header])
+
+        data = _select_excel_rows(rows, header, skiprows, nrows)
 
         parser = TextParser(data, header=header, index_col=index_col,
                             has_index_names=has_index_names,
@@ -249,17 +278,120 @@ class ExcelFile(object):
                             thousands=thousands,
                             parse_dates=parse_dates,
                             date_parser=date_parser,
-                            skiprows=skiprows,
                             skip_footer=skip_footer,
                             chunksize=chunksize,
                             **kwds)
 
+        if chunksize is not None:
+            return parser
+
         return parser.read()
 
+    def _xlrd_rows(self, sheetname, parse_cols):
+        from xlrd import (xldate_as_tuple, XL_CELL_DATE,
+                          XL_CELL_ERROR, XL_CELL_BOOLEAN)
+
+        datemode = self.book.datemode
+        if isinstance(sheetname, compat.string_types):
+            sheet = self.book.sheet_by_name(sheetname)
+        else:  # assume an integer if not a string
+            sheet = self.book.sheet_by_index(sheetname)
+
+        cols = self._columns_to_parse(sheet.ncols, parse_cols)
+        for i in range(sheet.nrows):
+            values = sheet.row_values(i)
+            types = sheet.row_types(i)
+            row = []
+            for j in cols:
+                if j >= len(values):
+                    break
+                value, typ = values[j], types[j]
+                if typ == XL_CELL_DATE:
+                    dt = xldate_as_tuple(value, datemode)
+                    # how to produce this first case?
+                    if dt[0] < datetime.MINYEAR:  # pragma: no cover
+                        value = datetime.time(*dt[3:])
+                    else:
+                        value = datetime.datetime(*dt)
+                elif typ == XL_CELL_ERROR:
+                    value = np.nan
+                elif typ == XL_CELL_BOOLEAN:
+                    value = bool(value)
+                row.append(value)
+
+            yield row
+
+    def _openpyxl_rows(self, sheetname, parse_cols):
+        if isinstance(sheetname, compat.string_types):
+            sheet = self.book.get_sheet_by_name(sheetname)
+            if sheet is None:
+                raise KeyError("No sheet named <%r>" % sheetname)
+        else:  # assume an integer if not a string
+            sheet = self.book.worksheets[sheetname]
+
+        cols = {}
+        for cells in sheet.iter_rows():
+            ncols = len(cells)
+            if ncols not in cols:
+                cols[ncols] = self._columns_to_parse(ncols, parse_cols)
+
+            row = []
+            for j in cols[ncols]:
+                cell = cells[j]
+                try:
+                    value = cell.value
+                except AttributeError:  # RawCell of openpyxl < 2.0
+                    value = cell.internal_value
+                if value is None:
+                    # xlrd reads empty cells as ''
+                    value = ''
+                elif getattr(cell, 'data_type', None) == 'e':
+                    value = np.nan
+                row.append(value)
+
+            yield row
+
     @property
     def sheet_names(self):
+        if self.engine == 'openpyxl':
+            return self.book.get_sheet_names()
         return self.book.sheet_names()
 
+    def close(self):
+        """ release the resources (file handle or contents) of the workbook """
+        if self.engine == 'xlrd':
+            self.book.release_resources()
+
+
+def _open_openpyxl_workbook(path_or_buf):
+    from openpyxl import load_workbook
+
+    try:
+        return load_workbook(path_or_buf, read_only=True, data_only=True)
+    except TypeError:  # openpyxl < 2.0
+        return load_workbook(path_or_buf, use_iterators=True)
+
+
+def _select_excel_rows(rows, header, skiprows, nrows):
+    """
+    drop the skipped rows from an iterator of sheet rows and trim the header
+    row; stop reading the sheet once nrows data rows have been read
+    """
+    pos = nread = 0
+    for i, row in enumerate(rows):
+        if i in skiprows:
+            continue
+
+        if pos == header:
+            row = _trim_excel_header(row)
+        elif header is None or pos > header:
+            if nrows is not None and nread >= nrows:
+                return
+            nread += 1
+
+        pos += 1
+        yield row
+
 
 def _trim_excel_header(row):
     # trim header row so auto-index inference works
@@ -269,6 +401,28 @@ def _trim_excel_header(row):
     return row
 
 
+def _rows_from_cells(cells):
+    """
+    group cells that are in row order into (row, {col: cell}) pairs; the
+    cells within a row can be in any order
+    """
+    row, current = None, {}
+    for cell in cells:
+        if cell.row != row:
+            if row is not None:
+                if cell.row < row:
+                    raise ValueError("a write_only ExcelWriter requires the "
+                                     "cells to be written in row order")
+                yield row, current
+            row, current = cell.row, {}
+        if cell.mergestart is not None and cell.mergeend is not None:
+            raise NotImplementedError("a write_only ExcelWriter cannot "
+                                      "merge cells")
+        current[cell.col] = cell
+    if row is not None:
+        yield row, current
+
+
 def _conv_value(val):
     # convert value for excel dump
     if isinstance(val, np.int64):
@@ -335,6 +489,11 @@ class ExcelWriter(object):
     engine : string (optional)
         Engine to use for writing. If None, defaults to ``io.excel.<extension>.writer``.
         NOTE: can only be passed as a keyword argument.
+    write_only : boolean, default False
+        Stream the cells to the workbook row by row, so that the memory used
+        does not grow with the number of rows written. Cells must be written
+        in row order and cannot be merged, and cell styles are not written
+        by the openpyxl engine with openpyxl 2.0 or later.
     """
     # declare external properties you can count on
     book = None
@@ -375,7 +534,7 @@ class ExcelWriter(object):
         """
         pass
 
-    def __init__(self, path, engine=None, **engine_kwargs):
+    def __init__(self, path, engine=None, write_only=False, **engine_kwargs):
         # note that subclasses will *never* get anything for engine
         # included here so that it's visible as part of the public signature.
 
@@ -386,6 +545,20 @@ class ExcelWriter(object):
         self.path = path
         self.sheets = {}
         self.cur_sheet = None
+        self.write_only = write_only
+
+        # the next row that can be written, per sheet, in write_only mode
+        self._next_rows = {}
+
+    def _check_next_row(self, sheet_name, row):
+        """ in write_only mode rows that were written cannot be revisited """
+        next_row = self._next_rows.get(sheet_name, 0)
+        if row < next_row:
+            raise ValueError("cannot write row %d of sheet '%s' in "
+                             "write_only mode, rows up to %d have been "
+                             "written" % (row, sheet_name, next_row - 1))
+        self._next_rows[sheet_name] = row + 1
+        return next_row
 
     def _get_sheet_name(self, sheet_name):
         if sheet_name is None:
@@ -419,8 +592,23 @@ class _OpenpyxlWriter(ExcelWriter):
 
         super(_OpenpyxlWriter, self).__init__(path, **engine_kwargs)
 
-        # Create workbook object with default optimized_write=True.
-        self.book = Workbook()
+        # in write_only mode with openpyxl < 2.0, the styles of the streamed
+        # cells, by style key (their cellXfs index is their position + 2)
+        self._dump_styles = None
+        self._dump_style_ids = {}
+
+        if self.write_only:
+            try:
+                self.book = Workbook(write_only=True)
+            except TypeError:
+                # openpyxl < 2.0
+                self.book = Workbook(
+                    optimized_write=True,
+                    optimized_worksheet_class=_styled_dump_worksheet())
+                self._dump_styles = []
+        else:
+            self.book = Workbook()
+
         # Openpyxl 1.6.1 adds a dummy sheet. We remove it.
         if self.book.worksheets:
             self.book.remove_sheet(self.book.worksheets[0])
@@ -429,6 +617,13 @@ class _OpenpyxlWriter(ExcelWriter):
         """
         Save workbook to disk.
         """
+        if self._dump_styles:
+            # the streamed cells refer to their styles by index, which the
+            # dump writer does not collect from the sheets
+            from openpyxl.writer.dump_worksheet import ExcelDumpWriter
+            writer = ExcelDumpWriter(self.book)
+            writer.style_writer._style_list.extend(self._dump_styles)
+            return writer.save(self.path)
         return self.book.save(self.path)
 
     def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0):
@@ -444,20 +639,38 @@ class _OpenpyxlWriter(ExcelWriter):
             wks.title = sheet_name
             self.sheets[sheet_name] = wks
 
+        if self.write_only:
+            return self._write_rows(wks, cells, sheet_name, startrow,
+                                    startcol)
+
+        style_dict = {}
+
         for cell in cells:
             colletter = get_column_letter(startcol + cell.col + 1)
             xcell = wks.cell("%s%s" % (colletter, startrow + cell.row + 1))
             xcell.value = _conv_value(cell.val)
             if cell.style:
-                style = self._convert_to_style(cell.style)
+                stylekey = json.dumps(cell.style)
+                if stylekey in style_dict:
+                    style = style_dict[stylekey]
+                else:
+                    style = self._convert_to_style(cell.style)
+                    style_dict[stylekey] = style
                 for field in style.__fields__:
                     xcell.style.__setattr__(field,
                                             style.__getattribute__(field))
 
             if isinstance(cell.val, datetime.datetime):
-                xcell.style.number_format.format_code = "YYYY-MM-DD HH:MM:SS"
+                format_code = "YYYY-MM-DD HH:MM:SS"
             elif isinstance(cell.val, datetime.date):
-                xcell.style.number_format.format_code = "YYYY-MM-DD"
+                format_code = "YYYY-MM-DD"
+            else:
+                format_code = None
+            if format_code is not None:
+                # the fields of a cached style are shared by its cells
+                xcell.style.number_format = copy.copy(
+                    xcell.style.number_format)
+                xcell.style.number_format.format_code = format_code
 
             # merging requires openpyxl latest (works on 1.6.1)
             # todo add version check
@@ -469,6 +682,46 @@ class _OpenpyxlWriter(ExcelWriter):
                                                startrow + cell.row + 1,
                                                cletterend,
                                                startrow + cell.mergestart + 1))
+
+    def _write_rows(self, wks, cells, sheet_name, startrow, startcol):
+        # append the cells to a write-only sheet, a row at a time
+        for row, rcells in _rows_from_cells(cells):
+            row += startrow
+            next_row = self._check_next_row(sheet_name, row)
+            for i in range(next_row, row):
+                wks.append([])
+
+            values = [None] * (startcol + max(rcells) + 1)
+            for col, cell in compat.iteritems(rcells):
+                value = _conv_value(cell.val)
+                if cell.style and self._dump_styles is not None:
+                    value = _DumpCell(value, self._get_dump_style(cell))
+                values[startcol + col] = value
+            wks.append(values)
+
+    def _get_dump_style(self, cell):
+        """
+        the cellXfs index of the style of a streamed cell, converting each
+        distinct style (and number format) once
+        """
+        if isinstance(cell.val, datetime.datetime):
+            format_code = "YYYY-MM-DD HH:MM:SS"
+        elif isinstance(cell.val, datetime.date):
+            format_code = "YYYY-MM-DD"
+        else:
+            format_code = None
+
+        key = json.dumps(cell.style), format_code
+        style_id = self._dump_style_ids.get(key)
+        if style_id is None:
+            style = self._convert_to_style(cell.style)
+            if format_code is not None:
+                style.number_format.format_code = format_code
+            self._dump_styles.append(style)
+            # cellXfs 0 is the default style, 1 the dump writer's dates
+            style_id = self._dump_style_ids[key] = len(self._dump_styles) + 1
+        return style_id
+
     @classmethod
     def _convert_to_style(cls, style_dict):
         """
@@ -493,10 +746,96 @@ class _OpenpyxlWriter(ExcelWriter):
 register_writer(_OpenpyxlWriter)
 
 
+class _DumpCell(object):
+    """ a value streamed to a sheet with the cellXfs index of its style """
+    __slots__ = ['value', 'style_id']
+
+    def __init__(self, value, style_id):
+        self.value = value
+        self.style_id = style_id
+
+
+_StyledDumpWorksheet = None
+
+
+def _styled_dump_worksheet():
+    """
+    The write-only worksheet class of openpyxl < 2.0 (DumpWorksheet),
+    extended to append _DumpCell values with their style
+    """
+    global _StyledDumpWorksheet
+    if _StyledDumpWorksheet is not None:
+        return _StyledDumpWorksheet
+
+    from openpyxl.cell import get_column_letter
+    from openpyxl.shared import NUMERIC_TYPES
+    from openpyxl.shared.xmltools import start_tag, end_tag, tag
+    from openpyxl.writer.dump_worksheet import DumpWorksheet, STYLES
+
+    class StyledDumpWorksheet(DumpWorksheet):
+
+        def append(self, row):
+            # DumpWorksheet.append, writing the style of _DumpCell values
+            doc = self._get_content_generator()
+            self._max_row += 1
+            span = len(row)
+            self._max_col = max(self._max_col, span)
+            row_idx = self._max_row
+            start_tag(doc, 'row', {'r': '%d' % row_idx,
+                                   'spans': '1:%d' % span})
+
+            for col_idx, cell in enumerate(row):
+                style_id = None
+                if isinstance(cell, _DumpCell):
+                    cell, style_id = cell.value, cell.style_id
+                if cell is None:
+                    continue
+
+                coordinate = '%s%d' % (get_column_letter(col_idx + 1),
+                                       row_idx)
+                attributes = {'r': coordinate}
+
+                if isinstance(cell, bool):
+                    dtype = 'boolean'
+                elif isinstance(cell, NUMERIC_TYPES):
+                    dtype = 'numeric'
+                elif isinstance(cell, (datetime.datetime, datetime.date)):
+                    dtype = 'datetime'
+                    cell = self._shared_date.datetime_to_julian(cell)
+                    attributes['s'] = STYLES[dtype]['style']
+                elif cell and cell[0] == '=' and cell[1:]:
+                    dtype = 'formula'
+                else:
+                    dtype = 'string'
+                    cell = self._string_builder.add(cell)
+
+                if style_id is not None:
+                    attributes['s'] = '%d' % style_id
+                if dtype != 'formula':
+                    attributes['t'] = STYLES[dtype]['type']
+                start_tag(doc, 'c', attributes)
+
+                if dtype == 'formula':
+                    tag(doc, 'f', body='%s' % cell[1:])
+                    tag(doc, 'v')
+                elif dtype == 'boolean':
+                    tag(doc, 'v', body='%d' % cell)
+                else:
+                    tag(doc, 'v', body='%s' % cell)
+                end_tag(doc, 'c')
+            end_tag(doc, 'row')
+
+    _StyledDumpWorksheet = StyledDumpWorksheet
+    return _StyledDumpWorksheet
+
+
 class _XlwtWriter(ExcelWriter):
     engine = 'xlwt'
     supported_extensions = ('.xls',)
 
+    # in write_only mode, serialize the written rows this often
+    _flush_rows = 1000
+
     def __init__(self, path, **engine_kwargs):
         # Use the xlwt module as the Excel writer.
         import xlwt
@@ -526,6 +865,9 @@ class _XlwtWriter(ExcelWriter):
 
         style_dict = {}
 
+        if self.write_only:
+            cells = self._check_row_order(cells, sheet_name, startrow)
+
         for cell in cells:
             val = _conv_value(cell.val)
 
@@ -556,6 +898,20 @@ class _XlwtWriter(ExcelWriter):
                           startcol + cell.col,
                           val, style)
 
+        if self.write_only:
+            wks.flush_row_data()
+
+    def _check_row_order(self, cells, sheet_name, startrow):
+        # written rows are serialized (and released) every
+        # _flush_rows rows; they cannot be revisited
+        wks = self.sheets[sheet_name]
+        for i, (row, rcells) in enumerate(_rows_from_cells(cells)):
+            self._check_next_row(sheet_name, startrow + row)
+            for col in sorted(rcells):
+                yield rcells[col]
+            if (i + 1) % self._flush_rows == 0:
+                wks.flush_row_data()
+
     @classmethod
     def _style_to_xlwt(cls, item, firstlevel=True, field_sep=',', line_sep=';'):
         """helper which recursively generate an xlwt easy style string
@@ -1664,27 +1664,38 @@ class DataCol(IndexCol):
 
     def set_atom_string(
             self, block, existing_col, min_itemsize, nan_rep, encoding):
-        # fill nan items with myself
-        block = block.fillna(nan_rep)[0]
-        data = block.values
-
-        # see if we have a valid string type
-        inferred_type = lib.infer_dtype(data.ravel())
-        if inferred_type != 'string':
-
-            # we cannot serialize this data, so report an exception on a column
-            # by column basis
-            for item in block.items:
-
-                col = block.get(item)
-                inferred_type = lib.infer_dtype(col.ravel())
-                if inferred_type != 'string':
-                    raise TypeError("Cannot serialize the column [%s] because\n"
-                                    "its data contents are [%s] object dtype" %
-                                    (item, inferred_type))
-
-        # itemsize is the maximum length of a string (along any dimension)
-        itemsize = lib.max_len_string_array(com._ensure_object(data.ravel()))
+        # packed strings are copied straight from their buffer
+        fixed = None
+        if block.is_string:
+            fixed = block.to_fixed_bytes(nan_rep, encoding=encoding)
+
+        if fixed is not None:
+            itemsize = fixed.dtype.itemsize
+
+        else:
+
+            # fill nan items with myself
+            block = block.fillna(nan_rep)[0]
+            data = block.values
+
+            # see if we have a valid string type
+            inferred_type = lib.infer_dtype(data.ravel())
+            if inferred_type != 'string':
+
+                # we cannot serialize this data, so report an exception on a
+                # column by column basis
+                for item in block.items:
+
+                    col = block.get(item)
+                    inferred_type = lib.infer_dtype(col.ravel())
+                    if inferred_type != 'string':
+                        raise TypeError("Cannot serialize the column [%s] because\n"
+                                        "its data contents are [%s] object dtype" %
+                                        (item, inferred_type))
+
+            # itemsize is the maximum length of a string (along any dimension)
+            itemsize = lib.max_len_string_array(
+                com._ensure_object(data.ravel()))
 
         # specified min_itemsize?
         if isinstance(min_itemsize, dict):
@@ -1701,7 +1712,12 @@ class DataCol(IndexCol):
         self.itemsize = itemsize
         self.kind = 'string'
         self.typ = self.get_atom_string(block, itemsize)
-        self.set_data(self.convert_string_data(data, itemsize, encoding))
+        if fixed is not None:
+            if fixed.dtype.itemsize != itemsize:
+                fixed = fixed.astype('S%d' % itemsize)
+            self.set_data(fixed)
+        else:
+            self.set_data(self.convert_string_data(data, itemsize, encoding))
 
     def convert_string_data(self, data, itemsize, encoding):
         return _convert_string_array(data, encoding, itemsize)
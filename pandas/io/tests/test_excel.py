@@ -3,6 +3,7 @@
 from pandas.compat import u, range, map
 import os
 import unittest
+from datetime import datetime
 
 import nose
 
@@ -15,6 +16,7 @@ from pandas.io.excel import (
     ExcelFile, ExcelWriter, read_excel, _XlwtWriter, _OpenpyxlWriter,
     register_writer
 )
+from pandas.core.format import ExcelFormatter
 from pandas.util.testing import ensure_clean
 import pandas.util.testing as tm
 import pandas as pd
@@ -231,6 +233,59 @@ class ExcelReaderTests(SharedItems, unittest.TestCase):
         tm.assert_frame_equal(df4, df.ix[:-1])
         tm.assert_frame_equal(df4, df5)
 
+    def test_excel_table_nrows_chunksize(self):
+        _skip_if_no_xlrd()
+
+        pth = os.path.join(self.dirpath, 'test.xls')
+        xls = ExcelFile(pth)
+        df = xls.parse('Sheet1', index_col=0, parse_dates=True)
+
+        result = xls.parse('Sheet1', index_col=0, parse_dates=True, nrows=3)
+        tm.assert_frame_equal(result, df[:3])
+
+        result = xls.parse('Sheet2', skiprows=[1], index_col=0,
+                           parse_dates=True, nrows=3, usecols=[0, 2])
+        tm.assert_frame_equal(result, df[['B']][:3])
+
+        reader = xls.parse('Sheet1', index_col=0, parse_dates=True,
+                           chunksize=4)
+        chunks = list(reader)
+        self.assertEqual(len(chunks[0]), 4)
+        tm.assert_frame_equal(pd.concat(chunks), df)
+
+    def test_excel_table_skiprows_header(self):
+        _skip_if_no_xlrd()
+
+        pth = os.path.join(self.dirpath, 'test.xls')
+        xls = ExcelFile(pth)
+
+        # the header is the first row at or after header that is not skipped
+        for skiprows in [2, [0, 1]]:
+            result = xls.parse('Sheet1', index_col=0, skiprows=skiprows)
+            expected = xls.parse('Sheet1', index_col=0, header=2)
+            tm.assert_frame_equal(result, expected)
+        result = xls.parse('Sheet1', index_col=0, header=1, skiprows=[1])
+        tm.assert_frame_equal(result, expected)
+        xls.close()
+
+    def test_excel_table_openpyxl_engine(self):
+        _skip_if_no_xlrd()
+        _skip_if_no_openpyxl()
+
+        xls = ExcelFile(self.xlsx1)
+        streamed = ExcelFile(self.xlsx1, engine='openpyxl')
+        self.assertEqual(streamed.sheet_names, xls.sheet_names)
+
+        df = xls.parse('Sheet1', index_col=0, parse_dates=True)
+        result = streamed.parse('Sheet1', index_col=0, parse_dates=True)
+        tm.assert_frame_equal(result, df)
+
+        result = streamed.parse(1, skiprows=[1], index_col=0,
+                                parse_dates=True, parse_cols='A:C', nrows=5)
+        tm.assert_frame_equal(result, df[['A', 'B']][:5])
+
+        self.assertRaises(ValueError, ExcelFile, self.xlsx1, engine='foo')
+
     def test_excel_read_buffer(self):
         _skip_if_no_xlrd()
         _skip_if_no_openpyxl()
@@ -565,6 +620,39 @@ class ExcelWriterBase(SharedItems):
             self.assertEqual(frame.index.names, df.index.names)
             self.frame.index = old_index  # needed if setUP becomes a classmethod
 
+    def test_to_excel_write_only(self):
+        _skip_if_no_xlrd()
+        ext = self.ext
+        path = '__tmp_to_excel_write_only__.' + ext
+
+        frame = self.frame.copy()
+        frame['A'][:5] = nan
+        frame.index.name = 'idx'
+
+        with ensure_clean(path) as path:
+            frame.to_excel(path, 'test1', write_only=True)
+            recons = read_excel(path, 'test1', index_col=0)
+            tm.assert_frame_equal(frame, recons)
+
+            # several frames on sheets of one writer, rows after startrow
+            writer = ExcelWriter(path, write_only=True)
+            frame.to_excel(writer, 'test1', startrow=2)
+            frame.to_excel(writer, 'test2', index=False)
+            self.assertRaises(ValueError, frame.to_excel, writer, 'test1')
+            writer.save()
+
+            recons = read_excel(path, 'test1', index_col=0, skiprows=2)
+            tm.assert_frame_equal(frame, recons)
+            recons = read_excel(path, 'test2', index_col=None)
+            recons.index = frame.index
+            tm.assert_frame_equal(frame, recons)
+
+        # the body of a frame is generated row by row
+        formatter = ExcelFormatter(frame[['A', 'B']], row_major=True)
+        cells = [(c.row, c.col) for c in formatter.get_formatted_cells()]
+        self.assertEqual(cells[:6], [(0, 1), (0, 2), (0, 0),
+                                     (1, 0), (1, 1), (1, 2)])
+
     def test_to_excel_multiindex_dates(self):
         _skip_if_no_xlrd()
         ext = self.ext
@@ -817,6 +905,32 @@ class OpenpyxlTests(ExcelWriterBase, unittest.TestCase):
         self.assertEquals(openpyxl.style.Alignment.HORIZONTAL_CENTER,
                           xlsx_style.alignment.horizontal)
 
+    def test_to_excel_write_only_styles(self):
+        _skip_if_no_openpyxl()
+
+        import openpyxl
+        if openpyxl.__version__ >= '2.0':
+            raise nose.SkipTest('styles are streamed with openpyxl < 2.0')
+
+        frame = DataFrame({'A': [1.5, 2.5], 'B': ['x', 'y']},
+                          index=[datetime(2013, 1, 1), datetime(2013, 1, 2)])
+        frame.index.name = 'date'
+        with ensure_clean('__tmp_write_only_styles__.xlsx') as path:
+            frame.to_excel(path, 'test1', write_only=True)
+
+            wks = openpyxl.load_workbook(path).get_sheet_by_name('test1')
+            for coord in ['A1', 'B1', 'C1', 'A2']:
+                style = wks.cell(coord).style
+                self.assertTrue(style.font.bold)
+                self.assertEquals(openpyxl.style.Border.BORDER_THIN,
+                                  style.borders.top.border_style)
+            self.assertFalse(wks.cell('B2').style.font.bold)
+            format_code = wks.cell('A2').style.number_format.format_code
+            self.assertEquals(format_code.upper(), 'YYYY-MM-DD HH:MM:SS')
+
+            recons = read_excel(path, 'test1', index_col=0)
+            tm.assert_frame_equal(frame, recons)
+
 
 class XlwtTests(ExcelWriterBase, unittest.TestCase):
     ext = 'xls'
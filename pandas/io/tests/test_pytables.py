@@ -2148,6 +2148,59 @@ class TestHDFStore(unittest.TestCase):
             expected = wp.loc[:,wp.major_axis<=Timestamp('20000103'),:]
             assert_panel_equal(result, expected)
 
+    def test_term_plan_cache(self):
+        from pandas.computation import pytables as cpytables
+
+        with ensure_clean(self.path) as store:
+
+            df = tm.makeTimeDataFrame()
+            store.append('df', df, data_columns=['A'])
+            expected = df[df.A > 0]
+
+            cpytables._plan_cache.clear()
+            result = store.select('df', 'A>0')
+            assert_frame_equal(result, expected)
+            self.assertEqual(cpytables._plan_cache.hits, 0)
+
+            # the same query reuses the cached plan
+            result = store.select('df', 'A>0')
+            assert_frame_equal(result, expected)
+            self.assertEqual(cpytables._plan_cache.hits, 1)
+
+            # a different value for a variable is a new plan
+            cutoff = 0.5
+            result = store.select('df', 'A>cutoff')
+            assert_frame_equal(result, df[df.A > 0.5])
+            cutoff = 0
+            result = store.select('df', 'A>cutoff')
+            assert_frame_equal(result, expected)
+            self.assertEqual(cpytables._plan_cache.hits, 1)
+
+            # non-scalar variables are never cached
+            values = np.array([0.5])
+            result = store.select('df', 'A>values')
+            assert_frame_equal(result, df[df.A > 0.5])
+            result = store.select('df', 'A>values')
+            self.assertEqual(cpytables._plan_cache.hits, 1)
+
+    def test_term_bind(self):
+        with ensure_clean(self.path) as store:
+
+            df = tm.makeTimeDataFrame()
+            store.append('df', df, data_columns=['A'])
+
+            q = Term('index>start & A>cutoff')
+            for start, cutoff in [(df.index[3], 0), (df.index[10], 0.5)]:
+                result = store.select('df', q.bind(start=start, cutoff=cutoff))
+                expected = df[(df.index > start) & (df.A > cutoff)]
+                assert_frame_equal(result, expected)
+
+            # bound values take precedence over the captured scope
+            start = df.index[-1]
+            result = store.select('df', q.bind(start=df.index[3], cutoff=0))
+            expected = df[(df.index > df.index[3]) & (df.A > 0)]
+            assert_frame_equal(result, expected)
+
     def test_same_name_scoping(self):
 
         with ensure_clean(self.path) as store:
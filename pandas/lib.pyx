@@ -790,6 +790,24 @@ def max_len_string_array(ndarray[object, ndim=1] arr):
 
     return m
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def memory_usage_of_objects(ndarray[object, ndim=1] arr):
+    """
+    return the memory used by the python objects referenced by a 1-dim object
+    array, in bytes, not including the array itself; an object referenced
+    more than once is counted each time
+    """
+    cdef:
+        Py_ssize_t i, n
+        int64_t total = 0
+
+    n = len(arr)
+    for i from 0 <= i < n:
+        total += arr[i].__sizeof__()
+
+    return total
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def string_array_replace_from_nan_rep(ndarray[object, ndim=1] arr, object nan_rep, object replace = None):
@@ -1209,3 +1227,5 @@ def indices_fast(object index, ndarray[int64_t] labels, list keys,
 include "reduce.pyx"
 include "properties.pyx"
 include "inference.pyx"
+include "writers.pyx"
+include "stringarray.pyx"
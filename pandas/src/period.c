@@ -137,7 +137,7 @@ static int dInfoCalc_SetFromDateAndTime(struct date_info *dinfo,
                  day);
 
         yearoffset = dInfoCalc_YearOffset(year, calendar);
-        if (PyErr_Occurred()) goto onError;
+        if (yearoffset == INT_ERR_CODE) goto onError;
 
         absdate = day + month_offset[leap][month - 1] + yearoffset;
 
@@ -213,7 +213,7 @@ int dInfoCalc_SetFromAbsDate(register struct date_info *dinfo,
     while (1) {
         /* Calculate the year offset */
         yearoffset = dInfoCalc_YearOffset(year, calendar);
-        if (PyErr_Occurred())
+        if (yearoffset == INT_ERR_CODE)
             goto onError;
 
         /* Backward correction: absdate must be greater than the
@@ -1021,6 +1021,34 @@ onError:
     return INT_ERR_CODE;
 }
 
+void get_asfreq_plan(int fromFreq, int toFreq, char relation, asfreq_plan *plan)
+{
+    plan->func = get_asfreq_func(fromFreq, toFreq);
+    get_asfreq_info(fromFreq, toFreq, &plan->af_info);
+    plan->relation = relation;
+}
+
+/* Convert n ordinals with a plan from get_asfreq_plan, returning the
+   position of the first one that fails to convert, or -1. This does not
+   touch the Python error state unless a year falls out of the supported
+   range, so it can run without the GIL on ordinals whose extremes are
+   known to convert */
+Py_ssize_t asfreq_array(npy_int64 *ordinals, npy_int64 *out, Py_ssize_t n,
+                        asfreq_plan *plan)
+{
+    Py_ssize_t i;
+    npy_int64 val;
+
+    for (i = 0; i < n; i++) {
+        val = (*plan->func)(ordinals[i], plan->relation, &plan->af_info);
+        if (val == INT_ERR_CODE) {
+            return i;
+        }
+        out[i] = val;
+    }
+    return -1;
+}
+
 
 /* generate an ordinal in period space */
 npy_int64 get_period_ordinal(int year, int month, int day,
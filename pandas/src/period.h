@@ -123,11 +123,22 @@ typedef struct date_info {
 
 typedef npy_int64 (*freq_conv_func)(npy_int64, char, asfreq_info*);
 
+// everything needed to convert ordinals between a pair of frequencies,
+// set up once by get_asfreq_plan and reused for a whole array
+typedef struct asfreq_plan {
+    freq_conv_func func;
+    asfreq_info af_info;
+    char relation;       // 'S' or 'E'
+} asfreq_plan;
+
 /*
  * new pandas API helper functions here
  */
 
 npy_int64 asfreq(npy_int64 period_ordinal, int freq1, int freq2, char relation);
+void get_asfreq_plan(int fromFreq, int toFreq, char relation, asfreq_plan *plan);
+Py_ssize_t asfreq_array(npy_int64 *ordinals, npy_int64 *out, Py_ssize_t n,
+                        asfreq_plan *plan);
 
 npy_int64 get_period_ordinal(int year, int month, int day,
                       int hour, int minute, int second,
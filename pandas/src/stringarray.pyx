@@ -0,0 +1,331 @@
+#-------------------------------------------------------------------------------
+# Packed string arrays: the strings of an object array stored in a single
+# byte buffer (UTF-8 encoded for unicode), with int64 offsets into it and a
+# uint8 null mask, so that they can be hashed, compared and written without a
+# python object per element
+
+from cpython cimport (PyUnicode_Check, PyUnicode_AsUTF8String,
+                      PyUnicode_DecodeUTF8, PyBytes_Check, PyBytes_AS_STRING,
+                      PyBytes_GET_SIZE, PyBytes_FromStringAndSize)
+from libc.string cimport memcmp, memcpy
+
+
+def is_packable_string_array(ndarray[object] values):
+    """
+    Whether the values are all bytes or all unicode strings, or null, with
+    at least one string, i.e. can be packed with pack_string_array
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        int kind = 0, k
+        object val
+
+    for i in range(n):
+        val = values[i]
+        if PyUnicode_Check(val):
+            k = 2
+        elif PyBytes_Check(val):
+            k = 1
+        elif _checknull(val):
+            continue
+        else:
+            return False
+
+        if kind == 0:
+            kind = k
+        elif kind != k:
+            return False
+
+    return kind != 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pack_string_array(ndarray[object] values):
+    """
+    Pack an array of strings (all bytes or all unicode) and nulls
+
+    Returns
+    -------
+    (data, offsets, mask, is_unicode) : the uint8 buffer of the strings,
+        the int64 offsets of the strings into it (n + 1 of them, a null is
+        empty), the uint8 null mask (2 for None, 1 for the other nulls) and
+        whether the strings are unicode
+    """
+    cdef:
+        Py_ssize_t i, n = len(values), length, total = 0
+        ndarray[int64_t] offsets = np.empty(n + 1, dtype=np.int64)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] data
+        list encoded = [None] * n
+        bint is_unicode = False, is_bytes = False
+        object val
+        char *dst
+
+    for i in range(n):
+        val = values[i]
+        if PyUnicode_Check(val):
+            is_unicode = True
+            val = PyUnicode_AsUTF8String(val)
+        elif PyBytes_Check(val):
+            is_bytes = True
+        elif val is None:
+            mask[i] = 2
+            continue
+        elif _checknull(val):
+            mask[i] = 1
+            continue
+        else:
+            raise TypeError('cannot pack a %s as a string' %
+                            type(val).__name__)
+
+        if is_unicode and is_bytes:
+            raise TypeError('cannot pack a mix of bytes and unicode strings')
+
+        encoded[i] = val
+        total += PyBytes_GET_SIZE(val)
+
+    data = np.empty(total, dtype=np.uint8)
+    dst = <char*> data.data
+    total = 0
+    for i in range(n):
+        offsets[i] = total
+        if mask[i]:
+            continue
+        val = encoded[i]
+        length = PyBytes_GET_SIZE(val)
+        memcpy(dst + total, PyBytes_AS_STRING(val), length)
+        total += length
+    offsets[n] = total
+
+    return data, offsets, mask, is_unicode
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unpack_string_array(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                        ndarray[uint8_t] mask, bint is_unicode,
+                        ndarray[int64_t] indexer=None, object na_value=np.nan):
+    """
+    Create the object array of (the strings at the positions in indexer of)
+    a packed string array; -1 in indexer and nulls become na_value, except
+    that None is kept
+    """
+    cdef:
+        Py_ssize_t i, j, n
+        ndarray[object] result
+        char *src = <char*> data.data
+
+    if indexer is None:
+        n = len(mask)
+    else:
+        n = len(indexer)
+
+    result = np.empty(n, dtype=object)
+    for i in range(n):
+        if indexer is None:
+            j = i
+        else:
+            j = indexer[i]
+
+        if j == -1 or mask[j] == 1:
+            result[i] = na_value
+        elif mask[j]:
+            result[i] = None
+        elif is_unicode:
+            result[i] = PyUnicode_DecodeUTF8(src + offsets[j],
+                                             offsets[j + 1] - offsets[j],
+                                             NULL)
+        else:
+            result[i] = PyBytes_FromStringAndSize(src + offsets[j],
+                                                  offsets[j + 1] - offsets[j])
+    return result
+
+
+cdef inline uint64_t _hash_bytes(char *s, Py_ssize_t n):
+    """ 64 bit FNV-1a """
+    cdef:
+        Py_ssize_t i
+        uint64_t h = 14695981039346656037ULL
+
+    for i in range(n):
+        h = (h ^ <uint8_t> s[i]) * 1099511628211ULL
+    return h
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def factorize_packed_strings(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                             ndarray[uint8_t] mask):
+    """
+    Hash the strings of a packed string array
+
+    Returns
+    -------
+    (labels, first) : the int64 label of each string (in order of first
+        appearance, -1 for nulls) and the position of the first occurrence
+        of each label
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(mask), nuniques = 0, size = 8
+        Py_ssize_t start, length
+        uint64_t slot, size_mask
+        ndarray[int64_t] labels = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] first = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] table
+        char *src = <char*> data.data
+
+    while size < 2 * n:
+        size <<= 1
+    size_mask = size - 1
+    table = np.empty(size, dtype=np.int64)
+    table.fill(-1)
+
+    for i in range(n):
+        if mask[i]:
+            labels[i] = -1
+            continue
+
+        start = offsets[i]
+        length = offsets[i + 1] - start
+        slot = _hash_bytes(src + start, length) & size_mask
+
+        # open addressing, the table holds the label of a slot
+        while True:
+            j = table[slot]
+            if j == -1:
+                table[slot] = nuniques
+                first[nuniques] = i
+                labels[i] = nuniques
+                nuniques += 1
+                break
+
+            j = first[j]
+            if (offsets[j + 1] - offsets[j] == length and
+                    memcmp(src + offsets[j], src + start, length) == 0):
+                labels[i] = table[slot]
+                break
+            slot = (slot + 1) & size_mask
+
+    return labels, first[:nuniques].copy()
+
+
+cdef enum:
+    _MATCH_EQUAL = 0
+    _MATCH_START = 1
+    _MATCH_END = 2
+    _MATCH_CONTAINS = 3
+
+_packed_match_kinds = {'equal': _MATCH_EQUAL, 'startswith': _MATCH_START,
+                       'endswith': _MATCH_END, 'contains': _MATCH_CONTAINS}
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def match_packed_strings(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                         ndarray[uint8_t] mask, bytes pattern, object how):
+    """
+    Compare each string of a packed string array to the (encoded) pattern:
+    how is one of 'equal', 'startswith', 'endswith', 'contains'; returns a
+    uint8 array, 0 for nulls
+    """
+    cdef:
+        Py_ssize_t i, k, n = len(mask), start, length
+        Py_ssize_t plen = len(pattern)
+        int kind = _packed_match_kinds[how]
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        char *src = <char*> data.data
+        char *pat = pattern
+
+    for i in range(n):
+        if mask[i]:
+            continue
+
+        start = offsets[i]
+        length = offsets[i + 1] - start
+        if kind == _MATCH_EQUAL:
+            result[i] = (length == plen and
+                         memcmp(src + start, pat, plen) == 0)
+        elif length < plen:
+            continue
+        elif kind == _MATCH_START:
+            result[i] = memcmp(src + start, pat, plen) == 0
+        elif kind == _MATCH_END:
+            result[i] = memcmp(src + start + length - plen, pat, plen) == 0
+        else:
+            # UTF-8 is self-synchronizing, so a byte match is a match of
+            # the characters
+            for k in range(length - plen + 1):
+                if memcmp(src + start + k, pat, plen) == 0:
+                    result[i] = 1
+                    break
+
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def len_packed_strings(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                       ndarray[uint8_t] mask, bint is_unicode):
+    """
+    The length of each string of a packed string array (in characters for
+    unicode), 0 for nulls
+    """
+    cdef:
+        Py_ssize_t i, k, n = len(mask), count
+        ndarray[int64_t] result = np.zeros(n, dtype=np.int64)
+        uint8_t *src = <uint8_t*> data.data
+
+    for i in range(n):
+        if mask[i]:
+            continue
+        if not is_unicode:
+            result[i] = offsets[i + 1] - offsets[i]
+            continue
+
+        # count the bytes that are not UTF-8 continuation bytes
+        count = 0
+        for k in range(offsets[i], offsets[i + 1]):
+            if (src[k] & 0xC0) != 0x80:
+                count += 1
+        result[i] = count
+
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def packed_strings_to_fixed(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                            ndarray[uint8_t] mask, bytes na_rep,
+                            Py_ssize_t itemsize=0):
+    """
+    Copy a packed string array to a fixed width bytes ('S') array, with
+    na_rep for the nulls; the itemsize is at least that of the longest
+    string
+    """
+    cdef:
+        Py_ssize_t i, n = len(mask), length
+        Py_ssize_t nlen = len(na_rep)
+        ndarray result
+        char *src = <char*> data.data
+        char *dst
+
+    for i in range(n):
+        if mask[i]:
+            length = nlen
+        else:
+            length = offsets[i + 1] - offsets[i]
+        if length > itemsize:
+            itemsize = length
+
+    result = np.zeros(n, dtype='S%d' % max(itemsize, 1))
+    itemsize = result.dtype.itemsize
+    dst = result.data
+    for i in range(n):
+        if mask[i]:
+            memcpy(dst + i * itemsize, <char*> na_rep, nlen)
+        else:
+            memcpy(dst + i * itemsize, src + offsets[i],
+                   offsets[i + 1] - offsets[i])
+
+    return result
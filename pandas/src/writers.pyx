@@ -0,0 +1,338 @@
+#-------------------------------------------------------------------------------
+# Native (C-level) csv writing of numeric and datetime columns
+
+from cpython cimport PyBytes_FromStringAndSize
+from libc.stdlib cimport realloc
+from libc.string cimport memcpy, strlen, strchr
+
+cdef extern from "Python.h":
+    char *PyOS_double_to_string(double val, char format_code, int precision,
+                                int flags, int *ptype) except NULL
+    void PyMem_Free(void *p)
+    enum: Py_DTSF_ADD_DOT_0
+
+cdef extern from "stdio.h":
+    int snprintf(char *s, size_t n, char *fmt, ...)
+
+# flush the output buffer to the handle once it holds this many bytes
+_CSV_FLUSH_SIZE = 1 << 20
+
+cdef enum:
+    CSV_FLOAT = 0
+    CSV_INT = 1
+    CSV_BOOL = 2
+    CSV_DATETIME = 3
+    CSV_OBJECT = 4
+    CSV_STRING = 5
+
+_csv_kinds = {'f': CSV_FLOAT, 'i': CSV_INT, 'b': CSV_BOOL,
+              'M': CSV_DATETIME, 'O': CSV_OBJECT, 'U': CSV_STRING}
+
+
+cdef class _CSVBuffer:
+    """
+    A growable byte buffer that is written to a file handle in large pieces
+    """
+
+    cdef:
+        char *buf
+        Py_ssize_t length, capacity, flush_size
+        object handle
+        bint decode
+
+    def __cinit__(self, object handle, Py_ssize_t flush_size, bint decode):
+        self.handle = handle
+        self.flush_size = flush_size
+        self.decode = decode
+        self.length = 0
+        self.capacity = flush_size + 1024
+        self.buf = <char*> malloc(self.capacity)
+        if self.buf is NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    cdef int reserve(self, Py_ssize_t n) except -1:
+        """ make sure that n more bytes fit in the buffer """
+        cdef:
+            Py_ssize_t capacity
+            char *buf
+
+        if self.length + n <= self.capacity:
+            return 0
+
+        capacity = max(2 * self.capacity, self.length + n)
+        buf = <char*> realloc(self.buf, capacity)
+        if buf is NULL:
+            raise MemoryError()
+        self.buf = buf
+        self.capacity = capacity
+        return 0
+
+    cdef int write(self, char *s, Py_ssize_t n) except -1:
+        self.reserve(n)
+        memcpy(self.buf + self.length, s, n)
+        self.length += n
+        return 0
+
+    cdef int write_bytes(self, bytes s) except -1:
+        return self.write(s, len(s))
+
+    cdef int write_quoted(self, char *s, Py_ssize_t n, char *quote_chars,
+                          char quotechar) except -1:
+        """ write s, quoted if it contains any of the quote_chars """
+        cdef:
+            Py_ssize_t i
+
+        for i in range(n):
+            if strchr(quote_chars, s[i]) is not NULL and s[i] != 0:
+                break
+        else:
+            return self.write(s, n)
+
+        self.reserve(2 * n + 2)
+        self.buf[self.length] = quotechar
+        self.length += 1
+        for i in range(n):
+            if s[i] == quotechar:
+                self.buf[self.length] = quotechar
+                self.length += 1
+            self.buf[self.length] = s[i]
+            self.length += 1
+        self.buf[self.length] = quotechar
+        self.length += 1
+        return 0
+
+    cdef int write_float(self, double val, char *fmt) except -1:
+        cdef:
+            char *s
+            int n
+            Py_ssize_t avail
+
+        if fmt is NULL:
+            # the same as repr(val), which is what csv.writer writes
+            s = PyOS_double_to_string(val, 'r', 0, Py_DTSF_ADD_DOT_0, NULL)
+            try:
+                self.write(s, strlen(s))
+            finally:
+                PyMem_Free(s)
+            return 0
+
+        self.reserve(64)
+        avail = self.capacity - self.length
+        n = snprintf(self.buf + self.length, avail, fmt, val)
+        if n >= avail:
+            self.reserve(n + 1)
+            n = snprintf(self.buf + self.length, n + 1, fmt, val)
+        self.length += n
+        return 0
+
+    cdef int write_int(self, int64_t val) except -1:
+        self.reserve(24)
+        self.length += snprintf(self.buf + self.length, 24, "%lld",
+                                <long long> val)
+        return 0
+
+    cdef int write_datetime(self, int64_t val) except -1:
+        """ the same format as Timestamp._repr_base """
+        cdef:
+            pandas_datetimestruct dts
+            int nanos
+
+        pandas_datetime_to_datetimestruct(val, PANDAS_FR_ns, &dts)
+        self.reserve(48)
+        self.length += snprintf(self.buf + self.length, 48,
+                                "%d-%.2d-%.2d %.2d:%.2d:%.2d",
+                                <int> dts.year, dts.month, dts.day,
+                                dts.hour, dts.min, dts.sec)
+        nanos = dts.ps / 1000
+        if nanos != 0:
+            self.length += snprintf(self.buf + self.length, 16, ".%.9d",
+                                    nanos + 1000 * dts.us)
+        elif dts.us != 0:
+            self.length += snprintf(self.buf + self.length, 16, ".%.6d",
+                                    dts.us)
+        return 0
+
+    cdef int maybe_flush(self) except -1:
+        if self.length >= self.flush_size:
+            self.flush()
+        return 0
+
+    cdef int flush(self) except -1:
+        if self.length == 0:
+            return 0
+        data = PyBytes_FromStringAndSize(self.buf, self.length)
+        self.length = 0
+        if self.decode:
+            data = data.decode('utf-8')
+        self.handle.write(data)
+        return 0
+
+
+cdef bytes _csv_field(object val, object quote_chars, object quotechar,
+                      bint decode):
+    """
+    format an arbitrary object the way csv.writer (with QUOTE_MINIMAL) does,
+    encoded to bytes
+    """
+    if val is None:
+        val = ''
+    elif decode and isinstance(val, bytes):
+        val = str(val)
+    elif PyFloat_Check(val):
+        val = repr(val)
+    elif not isinstance(val, basestring):
+        val = str(val)
+
+    for c in quote_chars:
+        if c in val:
+            val = '%s%s%s' % (quotechar,
+                              val.replace(quotechar, quotechar * 2),
+                              quotechar)
+            break
+
+    if decode:
+        return val.encode('utf-8')
+    elif isinstance(val, unicode):
+        return val.encode('ascii')
+    return val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_csv_rows_native(list columns, list masks, object kinds,
+                          object handle, object sep, object line_terminator,
+                          object na_rep, object quotechar,
+                          object float_format=None, bint decode=False,
+                          Py_ssize_t flush_size=_CSV_FLUSH_SIZE,
+                          list strings=None):
+    """
+    Write rows of csv straight from the column arrays, formatting the values
+    into a byte buffer without creating a python string per cell
+
+    Parameters
+    ----------
+    columns : list of 1-d arrays, one per output field; float64 (kind 'f'),
+        int64 (kind 'i'), uint8 (kind 'b'), int64 nanoseconds (kind 'M'),
+        object (kind 'O', formatted in python, e.g. the index) or the n + 1
+        int64 offsets into a buffer of UTF-8 strings (kind 'U')
+    masks : list of uint8 null masks (or None), null values are written as
+        na_rep
+    kinds : the kind of each column
+    handle : the file handle to write to
+    float_format : printf style format for the kind 'f' columns, or None to
+        write repr(value)
+    decode : decode the output to text before writing it (a text mode handle
+        on python 3)
+    strings : list of the uint8 string buffers of the kind 'U' columns (None
+        for the other columns); the quote characters must be ASCII
+    """
+    cdef:
+        Py_ssize_t i, j, n, ncols
+        _CSVBuffer buf
+        char **data = NULL
+        uint8_t **mdata = NULL
+        int *ckinds = NULL
+        char *fmt = NULL
+        bytes bsep, bterm, bna, bfmt, bquote
+        list objects
+        uint8_t *m
+        char *p
+        char **sdata = NULL
+        int64_t *off
+        char qc
+
+    ncols = len(columns)
+    if ncols == 0:
+        return
+    n = len(columns[0]) - (kinds[0] == 'U')
+    if strings is None:
+        strings = [None] * ncols
+
+    quote_chars = [sep, quotechar, '\r', '\n'] + list(line_terminator)
+    if 'U' in kinds:
+        bquote = ''.join(quote_chars).encode('ascii')
+        qc = bquote[1]
+    bsep = _csv_field(sep, [], quotechar, decode)
+    bterm = _csv_field(line_terminator, [], quotechar, decode)
+    bna = _csv_field(na_rep, quote_chars, quotechar, decode)
+    if float_format is not None:
+        bfmt = _csv_field(float_format, [], quotechar, decode)
+        fmt = bfmt
+
+    buf = _CSVBuffer(handle, flush_size, decode)
+    objects = [None] * ncols
+
+    data = <char**> malloc(ncols * sizeof(char*))
+    mdata = <uint8_t**> malloc(ncols * sizeof(uint8_t*))
+    ckinds = <int*> malloc(ncols * sizeof(int))
+    sdata = <char**> malloc(ncols * sizeof(char*))
+    if data is NULL or mdata is NULL or ckinds is NULL or sdata is NULL:
+        free(data)
+        free(mdata)
+        free(ckinds)
+        free(sdata)
+        raise MemoryError()
+
+    try:
+        for j in range(ncols):
+            ckinds[j] = _csv_kinds[kinds[j]]
+            if len(columns[j]) - (ckinds[j] == CSV_STRING) != n:
+                raise ValueError('all columns must have the same length')
+
+            sdata[j] = NULL
+            if ckinds[j] == CSV_OBJECT:
+                objects[j] = columns[j]
+                data[j] = NULL
+            else:
+                data[j] = <char*> (<ndarray> columns[j]).data
+                if ckinds[j] == CSV_STRING:
+                    sdata[j] = <char*> (<ndarray> strings[j]).data
+
+            if masks[j] is None:
+                mdata[j] = NULL
+            else:
+                mdata[j] = <uint8_t*> (<ndarray> masks[j]).data
+
+        for i in range(n):
+            for j in range(ncols):
+                if j > 0:
+                    buf.write(bsep, len(bsep))
+
+                m = mdata[j]
+                if m is not NULL and m[i]:
+                    buf.write(bna, len(bna))
+                    continue
+
+                p = data[j]
+                if ckinds[j] == CSV_FLOAT:
+                    buf.write_float((<double*> p)[i], fmt)
+                elif ckinds[j] == CSV_INT:
+                    buf.write_int((<int64_t*> p)[i])
+                elif ckinds[j] == CSV_BOOL:
+                    if (<uint8_t*> p)[i]:
+                        buf.write("True", 4)
+                    else:
+                        buf.write("False", 5)
+                elif ckinds[j] == CSV_DATETIME:
+                    buf.write_datetime((<int64_t*> p)[i])
+                elif ckinds[j] == CSV_STRING:
+                    off = <int64_t*> p
+                    buf.write_quoted(sdata[j] + off[i], off[i + 1] - off[i],
+                                     bquote, qc)
+                else:
+                    buf.write_bytes(_csv_field(objects[j][i], quote_chars,
+                                               quotechar, decode))
+
+            buf.write(bterm, len(bterm))
+            buf.maybe_flush()
+
+        buf.flush()
+
+    finally:
+        free(data)
+        free(mdata)
+        free(ckinds)
+        free(sdata)
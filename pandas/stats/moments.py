@@ -11,8 +11,13 @@ import numpy as np
 
 from pandas.core.api import DataFrame, Series, Panel, notnull
 import pandas.algos as algos
+import pandas.tslib as tslib
 import pandas.core.common as com
 from pandas.core.common import _values_from_object
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.index import DatetimeIndex
+from pandas.tseries.offsets import DateOffset, Tick
+import pandas.compat as compat
 
 from pandas.util.decorators import Substitution, Appender
 
@@ -31,24 +36,37 @@ __all__ = ['rolling_count', 'rolling_max', 'rolling_min',
 #------------------------------------------------------------------------------
 # Docs
 
-_doc_template = """
+_doc_params = """
 %s
 
 Parameters
 ----------
 %s
-window : Number of observations used for calculating statistic
+window : int, string alias or fixed frequency date offset
+    Number of observations used for calculating statistic, or the time span
+    (such as '5min') of the window ending at each observation, for data with
+    a monotonic DatetimeIndex
 min_periods : int
-    Minimum number of observations in window required to have a value
+    Minimum number of observations in window required to have a value,
+    default the window size (1 for time based windows)
 freq : None or string alias / date offset object, default=None
     Frequency to conform to before computing statistic
     time_rule is a legacy alias for freq
+"""
+
+_nthreads_doc = """nthreads : int, default 1
+    Number of threads to split the columns of a DataFrame across
+"""
 
+_returns_doc = """
 Returns
 -------
 %s
 """
 
+_doc_template = _doc_params + _returns_doc
+_doc_template_2d = _doc_params + _nthreads_doc + _returns_doc
+
 
 _ewm_doc = r"""%s
 
@@ -89,7 +107,7 @@ y : type of input argument
 """
 
 
-_expanding_doc = """
+_expanding_params = """
 %s
 
 Parameters
@@ -99,12 +117,11 @@ min_periods : int
     Minimum number of observations in window required to have a value
 freq : None or string alias / date offset object, default=None
     Frequency to conform to before computing statistic
-
-Returns
--------
-%s
 """
 
+_expanding_doc = _expanding_params + _returns_doc
+_expanding_doc_2d = _expanding_params + _nthreads_doc + _returns_doc
+
 
 _type_of_input = "y : type of input argument"
 
@@ -133,7 +150,9 @@ def rolling_count(arg, window, freq=None, center=False, time_rule=None):
     Parameters
     ----------
     arg :  DataFrame or numpy ndarray-like
-    window : Number of observations used for calculating statistic
+    window : int, string alias or fixed frequency date offset
+        Number of observations used for calculating statistic, or the
+        time span of the window for data with a DatetimeIndex
     freq : None or string alias / date offset object, default=None
         Frequency to conform to before computing statistic
     center : boolean, default False
@@ -145,13 +164,18 @@ def rolling_count(arg, window, freq=None, center=False, time_rule=None):
     rolling_count : type of caller
     """
     arg = _conv_timerule(arg, freq, time_rule)
-    window = min(window, len(arg))
+    if not _is_time_window(window):
+        window = min(window, len(arg))
 
     return_hook, values = _process_data_structure(arg, kill_inf=False)
 
     converted = np.isfinite(values).astype(float)
+    if _is_time_window(window):
+        # the window bounds come from the index
+        converted = return_hook(converted)
     result = rolling_sum(converted, window, min_periods=1,
                          center=center)  # already converted
+    result = np.asarray(result)
 
     # putmask here?
     result[np.isnan(result)] = 0
@@ -165,7 +189,8 @@ def rolling_cov(arg1, arg2, window, min_periods=None, freq=None,
                 center=False, time_rule=None):
     arg1 = _conv_timerule(arg1, freq, time_rule)
     arg2 = _conv_timerule(arg2, freq, time_rule)
-    window = min(window, len(arg1), len(arg2))
+    if not _is_time_window(window):
+        window = min(window, len(arg1), len(arg2))
 
     def _get_cov(X, Y):
         mean = lambda x: rolling_mean(x, window, min_periods,center=center)
@@ -253,7 +278,8 @@ def rolling_corr_pairwise(df, window, min_periods=None):
 
 
 def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
-                    center=False, time_rule=None, **kwargs):
+                    center=False, time_rule=None, func_2d=None, nthreads=1,
+                    **kwargs):
     """
     Rolling statistical measure using supplied function. Designed to be
     used with passed-in Cython array-based functions.
@@ -271,16 +297,38 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
     center : boolean, default False
         Whether the label should correspond with center of window
     time_rule : Legacy alias for freq
+    func_2d : Cython function computing func down each column of a 2D
+        array at once, optional
+    nthreads : int, default 1
+        Number of threads func_2d splits the columns across, only supported
+        by the functions with a func_2d
     
     Returns
     -------
     y : type of input
     """
+    if func_2d is None and nthreads != 1:
+        raise ValueError('nthreads is not supported by this function')
+
     arg = _conv_timerule(arg, freq, time_rule)
+
+    start = _get_window_start(arg, window)
+    if start is not None:
+        if center:
+            raise ValueError('center is not supported for time based '
+                             'windows')
+        kwargs['start'] = start
+        window = len(start)
+        if minp is None:
+            minp = 1
+
     calc = lambda x: func(x, window, minp=minp, **kwargs)
     return_hook, values = _process_data_structure(arg)
     # actually calculate the moment. Faster way to do this?
-    if values.ndim > 1:
+    if values.ndim == 2 and axis == 0 and func_2d is not None:
+        result = func_2d(values, window, minp=minp, nthreads=nthreads,
+                         **kwargs)
+    elif values.ndim > 1:
         result = np.apply_along_axis(calc, axis, values)
     else:
         result = calc(values)
@@ -291,6 +339,36 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
     return rs
 
 
+def _is_time_window(window):
+    return isinstance(window, compat.string_types + (DateOffset,))
+
+
+def _get_window_start(arg, window):
+    """
+    For a time based window, the position of the first observation in the
+    window ending at each observation of arg. None for a number of
+    observations
+    """
+    if not _is_time_window(window):
+        return None
+
+    offset = to_offset(window)
+    if not isinstance(offset, Tick):
+        raise ValueError('time based windows must have a fixed frequency, '
+                         'got %s' % window)
+
+    index = getattr(arg, 'index', None)
+    if not isinstance(index, DatetimeIndex):
+        raise ValueError('time based windows require a DatetimeIndex')
+    if not index.is_monotonic:
+        raise ValueError('time based windows require a monotonic index')
+    stamps = index.asi8
+    if (stamps == tslib.iNaT).any():
+        raise ValueError('time based windows require an index without NaT')
+
+    return algos.roll_window_start(stamps, offset.nanos)
+
+
 def _center_window(rs, window, axis):
     if axis > rs.ndim-1:
         raise ValueError("Requested axis is larger then no. of argument dimensions")
@@ -366,7 +444,14 @@ def ewma(arg, com=None, span=None, min_periods=0, freq=None, time_rule=None,
         return result
 
     return_hook, values = _process_data_structure(arg)
-    output = np.apply_along_axis(_ewma, 0, values)
+    if values.ndim == 2:
+        output = algos.ewma_2d(values, com, int(adjust))
+        if min_periods and len(values):
+            first = notnull(values).argmax(0)
+            rows = np.arange(len(values))[:, None]
+            output[(rows >= first) & (rows < first + min_periods)] = NaN
+    else:
+        output = np.apply_along_axis(_ewma, 0, values)
     return return_hook(output)
 
 
@@ -496,36 +581,63 @@ def _use_window(minp, window):
         return minp
 
 
-def _rolling_func(func, desc, check_minp=_use_window):
+def _check_minp_2d(func_2d, check_minp):
+    if func_2d is None:
+        return None
+
+    def call_cython(arg, window, minp, **kwds):
+        minp = check_minp(minp, window)
+        return func_2d(arg, window, minp, **kwds)
+    return call_cython
+
+
+def _rolling_func(func, desc, check_minp=_use_window, time_window=True,
+                  func_2d=None):
     @Substitution(desc, _unary_arg, _type_of_input)
-    @Appender(_doc_template)
+    @Appender(_doc_template if func_2d is None else _doc_template_2d)
     @wraps(func)
     def f(arg, window, min_periods=None, freq=None, center=False,
           time_rule=None, **kwargs):
+        if not time_window and _is_time_window(window):
+            raise NotImplementedError('%s does not support time based '
+                                      'windows' % desc)
+
         def call_cython(arg, window, minp, **kwds):
             minp = check_minp(minp, window)
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods,
                                freq=freq, center=center,
-                               time_rule=time_rule, **kwargs)
+                               time_rule=time_rule,
+                               func_2d=_check_minp_2d(func_2d, check_minp),
+                               **kwargs)
 
     return f
 
-rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum')
-rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum')
-rolling_sum = _rolling_func(algos.roll_sum, 'Moving sum')
-rolling_mean = _rolling_func(algos.roll_mean, 'Moving mean')
-rolling_median = _rolling_func(algos.roll_median_cython, 'Moving median')
+rolling_max = _rolling_func(algos.roll_max2, 'Moving maximum',
+                            func_2d=algos.roll_max_2d)
+rolling_min = _rolling_func(algos.roll_min2, 'Moving minimum',
+                            func_2d=algos.roll_min_2d)
+rolling_sum = _rolling_func(algos.roll_sum, 'Moving sum',
+                            func_2d=algos.roll_sum_2d)
+rolling_mean = _rolling_func(algos.roll_mean, 'Moving mean',
+                             func_2d=algos.roll_mean_2d)
+rolling_median = _rolling_func(algos.roll_median_cython, 'Moving median',
+                               time_window=False)
 
 _ts_std = lambda *a, **kw: _zsqrt(algos.roll_var(*a, **kw))
+_ts_std_2d = lambda *a, **kw: _zsqrt(algos.roll_var_2d(*a, **kw))
 rolling_std = _rolling_func(_ts_std, 'Unbiased moving standard deviation',
-                            check_minp=_require_min_periods(1))
+                            check_minp=_require_min_periods(1),
+                            func_2d=_ts_std_2d)
 rolling_var = _rolling_func(algos.roll_var, 'Unbiased moving variance',
-                            check_minp=_require_min_periods(1))
+                            check_minp=_require_min_periods(1),
+                            func_2d=algos.roll_var_2d)
 rolling_skew = _rolling_func(algos.roll_skew, 'Unbiased moving skewness',
-                             check_minp=_require_min_periods(3))
+                             check_minp=_require_min_periods(3),
+                             time_window=False)
 rolling_kurt = _rolling_func(algos.roll_kurt, 'Unbiased moving kurtosis',
-                             check_minp=_require_min_periods(4))
+                             check_minp=_require_min_periods(4),
+                             time_window=False)
 
 
 def rolling_quantile(arg, window, quantile, min_periods=None, freq=None,
@@ -550,6 +662,10 @@ def rolling_quantile(arg, window, quantile, min_periods=None, freq=None,
     y : type of input argument
     """
 
+    if _is_time_window(window):
+        raise NotImplementedError('rolling_quantile does not support time '
+                                  'based windows')
+
     def call_cython(arg, window, minp):
         minp = _use_window(minp, window)
         return algos.roll_quantile(arg, window, minp, quantile)
@@ -564,7 +680,9 @@ def rolling_apply(arg, window, func, min_periods=None, freq=None,
     Parameters
     ----------
     arg : Series, DataFrame
-    window : Number of observations used for calculating statistic
+    window : int, string alias or fixed frequency date offset
+        Number of observations used for calculating statistic, or the
+        time span of the window for data with a DatetimeIndex
     func : function
         Must produce a single value from an ndarray input
     min_periods : int
@@ -579,9 +697,9 @@ def rolling_apply(arg, window, func, min_periods=None, freq=None,
     -------
     y : type of input argument
     """
-    def call_cython(arg, window, minp):
+    def call_cython(arg, window, minp, start=None):
         minp = _use_window(minp, window)
-        return algos.roll_generic(arg, window, minp, func)
+        return algos.roll_generic(arg, window, minp, func, start=start)
     return _rolling_moment(arg, window, call_cython, min_periods,
                            freq=freq, center=center, time_rule=time_rule)
 
@@ -688,9 +806,9 @@ def _pop_args(win_type, arg_names, kwargs):
     return all_args
 
 
-def _expanding_func(func, desc, check_minp=_use_window):
+def _expanding_func(func, desc, check_minp=_use_window, func_2d=None):
     @Substitution(desc, _unary_arg, _type_of_input)
-    @Appender(_expanding_doc)
+    @Appender(_expanding_doc if func_2d is None else _expanding_doc_2d)
     @wraps(func)
     def f(arg, min_periods=1, freq=None, center=False, time_rule=None,
           **kwargs):
@@ -701,22 +819,30 @@ def _expanding_func(func, desc, check_minp=_use_window):
             return func(arg, window, minp, **kwds)
         return _rolling_moment(arg, window, call_cython, min_periods,
                                freq=freq, center=center,
-                               time_rule=time_rule, **kwargs)
+                               time_rule=time_rule,
+                               func_2d=_check_minp_2d(func_2d, check_minp),
+                               **kwargs)
 
     return f
 
-expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum')
-expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum')
-expanding_sum = _expanding_func(algos.roll_sum, 'Expanding sum')
-expanding_mean = _expanding_func(algos.roll_mean, 'Expanding mean')
+expanding_max = _expanding_func(algos.roll_max2, 'Expanding maximum',
+                                func_2d=algos.roll_max_2d)
+expanding_min = _expanding_func(algos.roll_min2, 'Expanding minimum',
+                                func_2d=algos.roll_min_2d)
+expanding_sum = _expanding_func(algos.roll_sum, 'Expanding sum',
+                                func_2d=algos.roll_sum_2d)
+expanding_mean = _expanding_func(algos.roll_mean, 'Expanding mean',
+                                 func_2d=algos.roll_mean_2d)
 expanding_median = _expanding_func(
     algos.roll_median_cython, 'Expanding median')
 
 expanding_std = _expanding_func(_ts_std,
                                 'Unbiased expanding standard deviation',
-                                check_minp=_require_min_periods(2))
+                                check_minp=_require_min_periods(2),
+                                func_2d=_ts_std_2d)
 expanding_var = _expanding_func(algos.roll_var, 'Unbiased expanding variance',
-                                check_minp=_require_min_periods(2))
+                                check_minp=_require_min_periods(2),
+                                func_2d=algos.roll_var_2d)
 expanding_skew = _expanding_func(
     algos.roll_skew, 'Unbiased expanding skewness',
     check_minp=_require_min_periods(3))
@@ -7,12 +7,14 @@ from datetime import datetime
 from numpy.random import randn
 import numpy as np
 
-from pandas import Series, DataFrame, bdate_range, isnull, notnull
+from pandas import (Series, DataFrame, DatetimeIndex, Timestamp, NaT,
+                    bdate_range, isnull, notnull)
 from pandas.util.testing import (
     assert_almost_equal, assert_series_equal, assert_frame_equal
 )
 import pandas.core.datetools as datetools
 import pandas.stats.moments as mom
+import pandas.algos as algos
 import pandas.util.testing as tm
 from pandas.compat import range, zip, PY3, StringIO
 
@@ -316,6 +318,108 @@ class TestMoments(unittest.TestCase):
         self._check_moment_func(mom.rolling_kurt,
                                 lambda x: kurtosis(x, bias=False))
 
+    def test_time_window(self):
+        stamps = np.cumsum(np.random.randint(1, 90, size=500)) * 10**9
+        index = DatetimeIndex(stamps + Timestamp('2013-01-01').value)
+        values = randn(500)
+        values[::17] = np.NaN
+        series = Series(values, index=index)
+
+        def brute_force(func, minp=1, dropna=True):
+            result = []
+            for t in index.asi8:
+                window = series[(index.asi8 > t - 300 * 10**9) &
+                                (index.asi8 <= t)]
+                if window.count() >= minp:
+                    if dropna:
+                        window = window.dropna()
+                    result.append(func(window.values))
+                else:
+                    result.append(np.NaN)
+            return Series(result, index=index)
+
+        for func, static_comp in [(mom.rolling_sum, np.sum),
+                                  (mom.rolling_mean, np.mean),
+                                  (mom.rolling_max, np.max),
+                                  (mom.rolling_min, np.min)]:
+            assert_series_equal(func(series, '5min'), brute_force(static_comp))
+
+        result = mom.rolling_var(series, datetools.Minute(5), min_periods=3)
+        expected = brute_force(lambda x: np.var(x, ddof=1), minp=3)
+        assert_series_equal(result, expected)
+
+        # as with fixed windows, func is passed the NaN in the window
+        result = mom.rolling_apply(series, '5min', np.median)
+        assert_series_equal(result, brute_force(np.median, dropna=False))
+
+        result = mom.rolling_count(series, '5min')
+        assert_series_equal(result, brute_force(len).fillna(0).astype(float))
+
+        frame = DataFrame({'A': values, 'B': values[::-1]}, index=index)
+        result = mom.rolling_sum(frame, '5min')
+        assert_series_equal(result['A'], brute_force(np.sum))
+
+        self.assertRaises(ValueError, mom.rolling_sum, values, '5min')
+        self.assertRaises(ValueError, mom.rolling_sum, series, '1M')
+        self.assertRaises(ValueError, mom.rolling_sum, series[::-1], '5min')
+
+        # a leading NaT keeps the index monotonic
+        nat_index = DatetimeIndex([NaT, '2000-01-01', '2000-01-02'])
+        self.assertRaises(ValueError, mom.rolling_sum,
+                          Series([1., 2., 3.], index=nat_index), '1D')
+        result = algos.roll_window_start(nat_index.asi8, 86400 * 10**9)
+        self.assert_(np.array_equal(result, [0, 1, 2]))
+        self.assertRaises(ValueError, mom.rolling_sum, series, '5min',
+                          center=True)
+        self.assertRaises(NotImplementedError, mom.rolling_median, series,
+                          '5min')
+
+    def test_2d_kernels(self):
+        values = randn(300, 6)
+        values[20:40, 1] = np.NaN
+        values[::7, 3] = np.NaN
+        values[:, 5] = np.NaN
+        index = bdate_range(datetime(2009, 1, 1), periods=300)
+
+        for order in ['C', 'F']:
+            frame = DataFrame(np.array(values, order=order), index=index)
+
+            for func in [mom.rolling_sum, mom.rolling_mean, mom.rolling_max,
+                         mom.rolling_min, mom.rolling_std, mom.rolling_var]:
+                for minp in [None, 3]:
+                    expected = frame.apply(lambda x: func(x, 10, minp))
+                    assert_frame_equal(func(frame, 10, minp), expected)
+
+            func = functools.partial(mom.rolling_var, ddof=0)
+            expected = frame.apply(lambda x: func(x, 10))
+            assert_frame_equal(func(frame, 10), expected)
+
+            expected = frame.apply(mom.expanding_mean)
+            assert_frame_equal(mom.expanding_mean(frame), expected)
+
+            expected = frame.apply(lambda x: mom.ewma(x, com=5,
+                                                      min_periods=4))
+            assert_frame_equal(mom.ewma(frame, com=5, min_periods=4),
+                               expected)
+
+        empty = DataFrame(columns=['A', 'B'], dtype=float)
+        assert_frame_equal(mom.ewma(empty, com=5, min_periods=4), empty)
+
+        # enough values to split the columns across threads
+        frame = DataFrame(randn(5000, 40))
+        assert_frame_equal(mom.rolling_mean(frame, 50, nthreads=4),
+                           mom.rolling_mean(frame, 50))
+        assert_frame_equal(mom.expanding_max(frame, nthreads=4),
+                           mom.expanding_max(frame))
+
+        # functions without a 2D kernel cannot use threads
+        self.assertRaises(ValueError, mom.rolling_median, frame, 50,
+                          nthreads=4)
+        self.assertRaises(ValueError, mom.expanding_skew, frame, nthreads=4)
+        self.assert_('nthreads' in mom.rolling_mean.__doc__)
+        self.assert_('nthreads' not in mom.rolling_median.__doc__)
+        self.assert_('nthreads' not in mom.rolling_cov.__doc__)
+
     def test_fperr_robustness(self):
         # TODO: remove this once python 2.5 out of picture
         if PY3:
@@ -76,7 +76,11 @@ class TestValueCounts(unittest.TestCase):
 
         result = algos.value_counts(factor)
         expected = algos.value_counts(np.asarray(factor))
-        tm.assert_series_equal(result, expected)
+
+        # the codes are counted, so equal counts come out in level order
+        # rather than in the (hash) order of the object values
+        self.assert_((np.diff(result.values) <= 0).all())
+        tm.assert_series_equal(result.sort_index(), expected.sort_index())
 
     def test_value_counts_bins(self):
         s = [1, 2, 3, 4]
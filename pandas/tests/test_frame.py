@@ -5695,6 +5695,62 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
                     'three,3,6\n')
         self.assertEqual(buf.getvalue(), expected)
 
+    def test_to_csv_native_types(self):
+        # numeric and datetime blocks are formatted without csv.writer
+        df = DataFrame({'A': [1.5, np.nan, 0.1, -np.inf],
+                        'B': [1, 2, -3, 4],
+                        'C': [True, False, True, False],
+                        'D': [Timestamp('20130101'), Timestamp('20130101 09:30:01'),
+                              Timestamp('20130101 00:00:00.000001'), pd.NaT]},
+                       index=['a', 'b,c', 'd"e', 'f'])
+        df['E'] = df['A'].astype('float32')
+
+        buf = StringIO()
+        df.to_csv(buf, na_rep='NA,')
+        expected = (',A,B,C,D,E\n'
+                    'a,1.5,1,True,2013-01-01 00:00:00,1.5\n'
+                    '"b,c","NA,",2,False,2013-01-01 09:30:01,"NA,"\n'
+                    '"d""e",0.1,-3,True,2013-01-01 00:00:00.000001,'
+                    '0.10000000149011612\n'
+                    'f,-inf,4,False,"NA,",-inf\n')
+        self.assertEqual(buf.getvalue(), expected)
+
+        buf = StringIO()
+        df.to_csv(buf, float_format='%.3f', index=False, sep=';')
+        expected = ('A;B;C;D;E\n'
+                    '1.500;1;True;2013-01-01 00:00:00;1.500\n'
+                    ';2;False;2013-01-01 09:30:01;\n'
+                    '0.100;-3;True;2013-01-01 00:00:00.000001;0.100\n'
+                    '-inf;4;False;;-inf\n')
+        self.assertEqual(buf.getvalue(), expected)
+
+        # the same output as the object (csv.writer) path
+        df = DataFrame({'A': np.random.randn(1000) * 1e6,
+                        'B': np.arange(1000),
+                        'C': np.arange(1000) % 3 == 0})
+        df.ix[::7, 'A'] = np.nan
+        for kwargs in [dict(), dict(index=False), dict(na_rep='x')]:
+            buf = StringIO()
+            df.to_csv(buf, chunksize=77, **kwargs)
+            expected = StringIO()
+            df.astype(object).to_csv(expected, chunksize=77, **kwargs)
+            self.assertEqual(buf.getvalue(), expected.getvalue())
+
+    def test_to_csv_parallel(self):
+        df = DataFrame({'A': np.random.randn(1000),
+                        'B': np.arange(1000),
+                        'C': ['foo', 'bar,baz'] * 500},
+                       index=date_range('20130101', periods=1000, freq='H'))
+        df.ix[::7, 'A'] = np.nan
+
+        for frame in [df, df[['A', 'B']]]:
+            expected = StringIO()
+            frame.to_csv(expected, chunksize=77)
+
+            buf = StringIO()
+            frame.to_csv(buf, chunksize=77, nprocs=2)
+            self.assertEqual(buf.getvalue(), expected.getvalue())
+
     def test_info(self):
         io = StringIO()
         self.frame.info(buf=io)
@@ -5714,7 +5770,7 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         df = DataFrame(np.random.randn(5, 101))
         df.info(buf=io)
         rs = io.getvalue()
-        self.assert_(len(rs.splitlines()) == 4)
+        self.assert_(len(rs.splitlines()) == 5)
 
         io = StringIO()
         df.info(buf=io, max_cols=101)
@@ -5736,6 +5792,85 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
                           columns=['a', 'a', 'b', 'b'])
         frame.info(buf=io)
 
+    def test_info_memory_usage(self):
+        df = DataFrame({'a': np.arange(10), 'b': ['x'] * 10})
+
+        buf = StringIO()
+        df.info(buf=buf)
+        last = buf.getvalue().splitlines()[-1]
+        self.assert_(last.startswith('memory usage: '))
+        self.assert_('+' in last)
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage='deep')
+        last = buf.getvalue().splitlines()[-1]
+        self.assert_(last.startswith('memory usage: '))
+        self.assert_('+' not in last)
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=False)
+        self.assert_('memory usage' not in buf.getvalue())
+
+    def test_memory_usage(self):
+        n = 10
+        df = DataFrame({'a': np.arange(n, dtype='int64'), 'b': ['x'] * n,
+                        'c': np.random.randn(n)})
+        objsize = np.dtype(object).itemsize
+
+        result = df.memory_usage(index=False)
+        expected = Series([8 * n, objsize * n, 8 * n], index=['a', 'b', 'c'])
+        assert_series_equal(result, expected)
+        self.assertEqual(sum(df._data.memory_usage()), result.sum())
+
+        deep = df.memory_usage(index=False, deep=True)
+        self.assert_(deep['b'] > result['b'])
+        self.assertEqual(deep['a'], result['a'])
+        self.assertEqual(sum(df._data.memory_usage(deep=True)), deep.sum())
+
+        result = df.memory_usage()
+        self.assertEqual(result.index[0], 'Index')
+        self.assertEqual(result['Index'], df.index.nbytes)
+
+        self.assertEqual(df['a'].memory_usage(index=False), 8 * n)
+        self.assertEqual(df['a'].memory_usage(), 8 * n + df.index.nbytes)
+
+        panel = tm.makePanel()
+        self.assertEqual(panel.memory_usage(index=False), panel.values.nbytes)
+
+    def test_compact(self):
+        n = 100
+        df = DataFrame({'a': np.arange(n, dtype='int64'),
+                        'b': np.arange(n, dtype='int64') * 1000,
+                        'c': np.arange(n) / 4.,
+                        'd': np.random.randn(n),
+                        'e': ['x', 'y'] * (n // 2),
+                        'f': [str(i) for i in range(n)]})
+
+        buf = StringIO()
+        result = df.compact(verbose=True, buf=buf)
+        self.assert_(buf.getvalue().startswith('compacted from'))
+        self.assert_(result.memory_usage().sum() < df.memory_usage().sum())
+
+        dtypes = result.dtypes
+        self.assertEqual(dtypes['a'], np.int8)
+        self.assertEqual(dtypes['b'], np.int32)
+        self.assertEqual(dtypes['c'], np.float32)
+        self.assertEqual(dtypes['d'], np.float64)
+        self.assertEqual(dtypes['f'], np.object_)
+        self.assert_(any(b.is_categorical for b in result._data.blocks))
+        assert_frame_equal(result.astype(object), df.astype(object),
+                           check_dtype=False)
+
+        # a tolerance allows float32 for floats it cannot hold exactly
+        result = df.compact(float_tolerance=1e-6, max_categories=None)
+        self.assertEqual(result.dtypes['d'], np.float32)
+        self.assertEqual(result.dtypes['e'], np.object_)
+
+        s = df['b'].compact()
+        self.assertEqual(s.dtype, np.int32)
+        self.assertEqual(s.name, 'b')
+        assert_almost_equal(s.values, df['b'].values)
+
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
         result = self.mixed_frame.dtypes
@@ -10525,6 +10660,114 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         for letter in range(ord('A'), ord('Z')):
             self.frame[chr(letter)] = chr(letter)
 
+    def test_consolidation_policy(self):
+        import pandas.core.config as cf
+        import pandas.core.internals as internals
+
+        def _build():
+            df = DataFrame({'a': np.arange(5.)})
+            for i in range(110):
+                df['c%d' % i] = float(i)
+            return df
+
+        # eager consolidates once there are more than 100 blocks
+        self.assert_(len(_build()._data.blocks) < 100)
+
+        with cf.option_context('mode.consolidation', 'lazy'):
+            df = _build()
+            self.assertEqual(len(df._data.blocks), 111)
+
+            internals.get_consolidation_stats(df, reset=True)
+            self.assert_(not df._is_mixed_type)
+            self.assertEqual(len(df._data.blocks), 1)
+            stats = internals.get_consolidation_stats(df)
+            self.assertEqual(stats['consolidations'], 1)
+            self.assertEqual(stats['blocks_merged'], 110)
+            self.assertEqual(stats['bytes_copied'], 111 * 5 * 8)
+
+        with cf.option_context('mode.consolidation', 'never'):
+            df = _build()
+            df._consolidate_inplace()
+            self.assertEqual(len(df._data.blocks), 111)
+            assert_series_equal(df.sum(), _build().sum())
+
+            # explicit consolidation still happens
+            df.consolidate(inplace=True)
+            self.assertEqual(len(df._data.blocks), 1)
+
+    def test_copy_on_write(self):
+        import pandas.core.config as cf
+
+        expected = DataFrame({'A': np.arange(5.), 'B': np.arange(5.)})
+        with cf.option_context('mode.copy_on_write', True):
+            df = expected.copy()
+
+            # the values are shared until either frame is modified
+            copied = df.copy()
+            self.assert_(copied._data.blocks[0].values is
+                         df._data.blocks[0].values)
+
+            copied['A'] = 1.
+            assert_frame_equal(df, expected)
+            self.assertEqual(copied['A'].tolist(), [1.] * 5)
+
+            copied = df.copy()
+            copied.ix[0, 'B'] = 10.
+            copied.fillna(0, inplace=True)
+            assert_frame_equal(df, expected)
+            self.assertEqual(copied.ix[0, 'B'], 10.)
+
+            copied = df.copy()
+            df.ix[1, 'A'] = -1.
+            self.assertEqual(df.ix[1, 'A'], -1.)
+            assert_frame_equal(copied, expected)
+
+            s = copied['A'].copy()
+            s[0] = 100.
+            self.assertEqual(s[0], 100.)
+            self.assertEqual(copied['A'][0], 0.)
+
+            # direct writes into shared values are refused
+            self.assertRaises(ValueError, copied.values.__setitem__, 0, 5.)
+
+            # a column taken before the copy does not write into the copy
+            df = expected.copy()
+            s = df['A']
+            copied = df.copy()
+            s[0] = 100.
+            self.assertEqual(s[0], 100.)
+            assert_frame_equal(copied, expected)
+            assert_frame_equal(df, expected)
+
+    def test_assign_many(self):
+        frame = self.frame.copy()
+        expected = self.frame.copy()
+
+        n = len(frame)
+        values = OrderedDict([('E', np.arange(n)),
+                              ('A', 1.),
+                              ('F', frame['B'] * 2),
+                              ('G', 'foo'),
+                              ('H', np.arange(n) * 2)])
+        for k, v in compat.iteritems(values):
+            expected[k] = v
+
+        frame.assign_many(values)
+        assert_frame_equal(frame, expected)
+
+        # a single new block for each dtype
+        self.assertEqual(len(frame._data.blocks), 4)
+        self.assertEqual(len(expected._data.blocks), 5)
+
+        # a frame without an index gets its columns set one at a time
+        frame = DataFrame()
+        frame.assign_many(OrderedDict([('a', Series([1, 2, 3])),
+                                       ('b', 1.5)]))
+        expected = DataFrame()
+        expected['a'] = Series([1, 2, 3])
+        expected['b'] = 1.5
+        assert_frame_equal(frame, expected)
+
     def test_as_matrix_consolidate(self):
         self.frame['E'] = 7.
         self.assert_(not self.frame._data.is_consolidated())
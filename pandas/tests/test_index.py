@@ -630,6 +630,55 @@ class TestIndex(unittest.TestCase):
                 joined = res.join(res, how=kind)
                 self.assert_(res is joined)
 
+    def test_join_indexes_cached(self):
+        from pandas.core.index import _join_indexes, _join_cache
+        left = Index(['a', 'b', 'c'])
+        right = Index(['b', 'c', 'd'])
+
+        result = _join_indexes(left, right)
+        self.assert_(result[0].equals(Index(['a', 'b', 'c', 'd'])))
+        self.assert_(_join_indexes(left, right) is result)
+        self.assertFalse(result[1].flags.writeable)
+        self.assertFalse(result[2].flags.writeable)
+        self.assert_(_join_indexes(left, right, how='inner') is not result)
+
+        # equal indexes
+        self.assertEqual(_join_indexes(left, Index(['a', 'b', 'c'])),
+                         (None, None, None))
+
+        # renaming an index invalidates its joins
+        right.name = 'foo'
+        self.assert_(_join_indexes(left, right) is not result)
+
+        # the cache does not keep the indexes alive
+        import gc
+        import weakref
+        _join_cache.clear()
+        right = Index(['b', 'c', 'd', 'e'])
+        _join_indexes(left, right)
+        self.assertEqual(len(_join_cache), 1)
+        ref = weakref.ref(right)
+        del right
+        gc.collect()
+        self.assert_(ref() is None)
+        self.assertEqual(len(_join_cache), 0)
+
+        # nor does a join that is one of the inputs
+        right = Index(['a', 'b'])
+        result = _join_indexes(left, right, how='left')
+        self.assert_(result[0] is left)
+        self.assert_(_join_indexes(left, right, how='left')[0] is left)
+        ref = weakref.ref(left)
+        del left, result
+        gc.collect()
+        self.assert_(ref() is None)
+        self.assertEqual(len(_join_cache), 0)
+
+        left = Index(['a', 'b', 'c'])
+        _join_indexes(left, right)
+        _join_cache.clear()
+        self.assertEqual(len(_join_cache), 0)
+
 
 class TestInt64Index(unittest.TestCase):
     _multiprocess_can_split_ = True
@@ -727,6 +776,22 @@ class TestInt64Index(unittest.TestCase):
         expected = np.array([0, -1, 1, -1, 2, -1, 3, -1, 4, -1])
         self.assert_(np.array_equal(indexer, expected))
 
+    def test_get_indexer_monotonic_merge(self):
+        # both sorted: merged, no hash table is built
+        index = Int64Index([0, 2, 4, 6, 8])
+        target = Int64Index([-1, 0, 0, 3, 4, 8, 9])
+        indexer = index.get_indexer(target)
+        self.assert_(np.array_equal(indexer, [-1, 0, 0, -1, 2, 4, -1]))
+        self.assert_(index._engine.mapping is None)
+
+        indexer = index.get_indexer(target[::-1])
+        self.assert_(np.array_equal(indexer, [-1, 4, 2, -1, 0, 0, -1]))
+        self.assert_(index._engine.mapping is not None)
+
+        index = Int64Index([4, 0, 2])
+        indexer = index.get_indexer(target)
+        self.assert_(np.array_equal(indexer, [-1, 1, 1, -1, 0, -1, -1]))
+
     def test_get_indexer_pad(self):
         target = Int64Index(np.arange(10))
         indexer = self.index.get_indexer(target, method='pad')
@@ -1278,6 +1343,40 @@ class TestMultiIndex(unittest.TestCase):
         result = self.index.append([])
         self.assert_(result.equals(self.index))
 
+    def test_codes_ops_do_not_create_tuples(self):
+        first = MultiIndex(levels=[['b', 'a'], [2, 1]],
+                           labels=[[0, 0, 1, 1, -1], [0, 1, 0, -1, 0]])
+        second = MultiIndex(levels=[['c', 'b'], [1, 3]],
+                            labels=[[1, 1, 0, -1], [0, 1, 0, 0]])
+
+        appended = first.append(second)
+        union = first.union(second)
+        intersection = first.intersection(second)
+        diff = first.diff(second)
+        isin = first.isin(second)
+        self.assert_(first.equals(first[:]))
+        self.assert_(not first.equals(first[::-1]))
+        argsort = first.argsort()
+        for idx in [first, second, appended, union, intersection, diff]:
+            self.assert_(idx._tuples is None)
+
+        # (the nulls are not the same objects)
+        assert_almost_equal(list(appended), list(first) + list(second))
+        assert_almost_equal(list(union), [(np.nan, 1), (np.nan, 2),
+                                          ('a', np.nan), ('a', 2), ('b', 1),
+                                          ('b', 2), ('b', 3), ('c', 1)])
+        self.assertEqual(list(intersection), [('b', 1)])
+        self.assertEqual([list(lev) for lev in intersection.levels],
+                         [['b'], [1]])
+        self.assertEqual(list(second.intersection(first)), [('b', 1)])
+        assert_almost_equal(list(diff), [(np.nan, 2), ('a', np.nan), ('a', 2),
+                                         ('b', 2)])
+        self.assert_(np.array_equal(isin, [False, True, False, False, False]))
+        self.assert_(np.array_equal(first.isin([('a', 2), ('x', 1)]),
+                                    [False, False, True, False, False]))
+        self.assert_(np.array_equal(argsort, [4, 3, 2, 1, 0]))
+        assert_almost_equal(list(first.unique()), list(first))
+
     def test_get_level_values(self):
         result = self.index.get_level_values(0)
         expected = ['foo', 'foo', 'bar', 'baz', 'qux', 'qux']
@@ -1624,6 +1723,39 @@ class TestMultiIndex(unittest.TestCase):
                            " uniquely valued Index objects",
                            idx1.get_indexer, idx2)
 
+    def test_get_indexer_level_labels(self):
+        # levels differ between the indexes, and nulls
+        idx1 = MultiIndex(levels=[['a', 'b', 'c'], [1, 2]],
+                          labels=[[0, 0, 1, 2, -1], [0, 1, 1, -1, 0]])
+        idx2 = MultiIndex(levels=[['b', 'c', 'd'], [2, 3]],
+                          labels=[[0, 1, 2, -1, 0], [0, -1, 0, 1, 1]])
+        result = idx1.get_indexer(idx2)
+        assert_almost_equal(result, [2, 3, -1, -1, -1])
+        self.assert_(idx1.get_loc(('c', np.nan)) == 3)
+        self.assert_(('a', 2) in idx1)
+        self.assert_(('a', 3) not in idx1)
+
+        # the packed labels would overflow int64
+        n = 300
+        levels = [lrange(n)] * 8
+        labels = [np.arange(n), np.arange(n)[::-1]] + [np.arange(n)] * 6
+        index = MultiIndex(levels=levels, labels=labels)
+        self.assert_(index.is_unique)
+        self.assert_(index.get_loc(tuple([5, n - 6] + [5] * 6)) == 5)
+        self.assertRaises(KeyError, index.get_loc, tuple([5] * 8))
+        result = index.get_indexer(index[::-1])
+        self.assert_((result == np.arange(n)[::-1]).all())
+        target = MultiIndex(levels=[lrange(n)[::-1]] + levels[1:],
+                            labels=[n - 1 - labels[0]] + labels[1:])
+        result = index.get_indexer(target)
+        self.assert_((result == np.arange(n)).all())
+
+        self.assert_(index.is_monotonic)
+        self.assert_(not self.index.is_monotonic)
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1)])
+        self.assert_(index.is_monotonic)
+        self.assert_(not index[::-1].is_monotonic)
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
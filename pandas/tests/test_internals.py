@@ -9,10 +9,11 @@ from pandas.sparse.array import SparseArray
 from pandas.core.internals import *
 import pandas.core.internals as internals
 import pandas.util.testing as tm
+import pandas.compat as compat
 
 from pandas.util.testing import (
     assert_almost_equal, assert_frame_equal, randn)
-from pandas.compat import zip, u
+from pandas.compat import zip, u, StringIO
 
 
 def assert_block_equal(left, right):
@@ -519,6 +520,23 @@ class TestBlockManager(unittest.TestCase):
         self.assertEquals(cons.nblocks, 1)
         self.assert_(cons.blocks[0].items.equals(cons.items))
 
+    def test_append_items(self):
+        mgr = self.mgr.copy()
+        mgr.append_items(['x', 'y', 'z'], [randn(N), np.arange(N), randn(N)])
+
+        # one new block per dtype
+        self.assertEquals(mgr.nblocks, self.mgr.nblocks + 2)
+        self.assert_(mgr.items.equals(self.mgr.items.append(
+            Index(['x', 'y', 'z']))))
+        assert_almost_equal(mgr.get('y'), np.arange(N))
+        assert_almost_equal(mgr.get('a'), self.mgr.get('a'))
+
+        cons = mgr.consolidate()
+        assert_almost_equal(cons.get('x'), mgr.get('x'))
+        assert_almost_equal(cons.get('c'), mgr.get('c'))
+
+        self.assertRaises(ValueError, mgr.append_items, ['a'], [randn(N)])
+
     def test_reindex_index(self):
         pass
 
@@ -588,6 +606,155 @@ class TestBlockManager(unittest.TestCase):
         except KeyError:
             pass  # this is the expected exception
 
+    def test_packed_strings(self):
+        import pandas.core.config as cf
+        from pandas.core.algorithms import factorize
+
+        values = [u('foo'), u('bar'), np.nan, u('f\u00e9e'), u('foo')]
+        expected = np.array(values, dtype=object)
+        csv_data = {'b': [u('x,y'), u('"q"'), np.nan, u(''), u('z')],
+                    'c': np.arange(5)}
+        with cf.option_context('mode.pack_strings', True):
+            df = DataFrame({'a': values, 'c': np.arange(5)})
+            s = Series(values)
+            packed_csv = DataFrame(csv_data)
+        self.assertFalse(isinstance(Series(values)._data._block,
+                                    StringBlock))
+
+        blk = [b for b in df._data.blocks if 'a' in b.items][0]
+        self.assert_(isinstance(blk, StringBlock))
+        self.assert_(blk.is_packed)
+        self.assertEqual(blk.shape, (1, 5))
+        assert_almost_equal(df['a'].values, expected)
+        assert_almost_equal(s.values, expected)
+        self.assert_(isinstance(s._data._block, StringBlock))
+
+        # copies share the packed buffers
+        blk2 = [b for b in df.copy()._data.blocks if 'a' in b.items][0]
+        self.assert_(blk2.packed_values[0] is blk.packed_values[0])
+
+        # the values are created once and cannot be written to, as writes
+        # would not reach the packed strings
+        self.assert_(blk.values is blk.values)
+        self.assertFalse(blk.values.flags.writeable)
+
+        def _write():
+            blk.values[0, 0] = u('changed')
+        self.assertRaises((RuntimeError, ValueError), _write)
+        self.assertEqual(df['a'][0], u('foo'))
+
+        # None and NaN are kept apart
+        with cf.option_context('mode.pack_strings', True):
+            with_none = Series([u('a'), None, np.nan])
+        self.assert_(isinstance(with_none._data._block, StringBlock))
+        self.assert_(with_none.values[1] is None)
+        self.assert_(np.isnan(with_none.values[2]))
+
+        labels, uniques = factorize(s)
+        assert_almost_equal(labels, [0, 1, -1, 2, 0])
+        assert_almost_equal(uniques, expected[[0, 1, 3]])
+        self.assertEqual(s.value_counts()[u('foo')], 2)
+
+        assert_almost_equal(s.str.len(), [3, 3, np.nan, 3, 3])
+        assert_almost_equal(s.str.startswith(u('f')),
+                            [True, False, np.nan, True, True])
+        assert_almost_equal(s.str.contains(u('oo'), na=False),
+                            [True, False, False, False, True])
+        assert_almost_equal(s == u('foo'), [True, False, False, False, True])
+        assert_almost_equal(s != u('foo'), [False, True, True, True, False])
+
+        # the csv is identical to that of the object column
+        buf, expected_buf = StringIO(), StringIO()
+        packed_csv.to_csv(buf)
+        DataFrame(csv_data).to_csv(expected_buf)
+        self.assertEqual(buf.getvalue(), expected_buf.getvalue())
+
+        # modifying in place unpacks the strings
+        s[1] = u('baz')
+        self.assertFalse(s._data._block.is_packed)
+        self.assertEqual(s[1], u('baz'))
+        self.assertEqual(s[3], u('f\u00e9e'))
+
+        # strings that cannot be encoded as UTF-8 are not packed
+        if compat.PY3:
+            values = np.array([u('foo'), u('\ud800')], dtype=object)
+            s = Series(values)
+            self.assertFalse(s._data._block.is_packed)
+            assert_almost_equal(s.values, values)
+
+    def test_categorical_block(self):
+        from pandas import Categorical, merge
+        from pandas.core.internals import _packed_categorical
+
+        values = np.array(['b', 'a', np.nan, 'c', 'a', 'b', 'a'],
+                          dtype=object)
+        cat = Categorical.from_array(values)
+        df = DataFrame({'key': cat, 'val': np.arange(7)})
+        expected = DataFrame({'key': values, 'val': np.arange(7)})
+
+        blocks = [b for b in df._data.blocks if b.is_categorical]
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0]._codes.dtype, np.int8)
+        self.assertEqual(internals._codes_dtype(200), np.int16)
+        self.assertEqual(internals._codes_dtype(2 ** 20), np.int32)
+
+        s = df['key']
+        factor = _packed_categorical(s)
+        self.assertTrue(factor.levels.equals(cat.levels))
+        assert_almost_equal(s.values, values)
+
+        # row selections keep the codes
+        self.assertTrue(_packed_categorical(s[1:4]) is not None)
+        self.assertTrue(_packed_categorical(
+            df.take([5, 0, 1])['key']) is not None)
+        self.assertTrue(_packed_categorical(
+            s.reindex([5, 7, 0])) is not None)
+        assert_almost_equal(s.reindex([5, 7, 0]).values, ['b', np.nan, 'b'])
+
+        # groupby, value_counts, merge and sort agree with the object column
+        assert_frame_equal(df.groupby('key').sum(),
+                           expected.groupby('key').sum())
+        tm.assert_series_equal(s.value_counts(),
+                               expected['key'].value_counts())
+        right = DataFrame({'key': Categorical.from_array(['c', 'a', 'd']),
+                           'other': [1, 2, 3]})
+        result = merge(df, right, on='key', sort=True)
+        exp_right = DataFrame({'key': ['c', 'a', 'd'], 'other': [1, 2, 3]})
+        exp_result = merge(expected, exp_right, on='key', sort=True)
+        assert_almost_equal(result['val'].values, exp_result['val'].values)
+        assert_almost_equal(result['other'].values,
+                            exp_result['other'].values)
+        assert_almost_equal(s.order().values, expected['key'].order().values)
+        df2 = DataFrame({'key': Categorical.from_array(['b', 'a', 'c', 'a']),
+                         'val': np.arange(4)})
+        assert_almost_equal(df2.sort_index(by='key')['val'].values,
+                            [1, 3, 0, 2])
+
+        # setting a column, and modifying in place
+        df['key2'] = cat
+        self.assertTrue(_packed_categorical(df['key2']) is not None)
+        s2 = Series(cat)
+        s2[0] = 'c'
+        self.assertFalse(s2._data._block.is_packed)
+        self.assertEqual(s2[0], 'c')
+        self.assertEqual(s[0], 'b')
+
+        # the values are created once, and stand in for the codes
+        s3 = Series(cat)
+        self.assertTrue(s3.values is s3.values)
+        def f():
+            s3.values[0] = 'c'
+        self.assertRaises(ValueError, f)
+        self.assertEqual(s3[0], 'b')
+
+        # a categorical of numbers is numeric
+        df3 = DataFrame({'a': np.arange(3.),
+                         'b': Categorical.from_array([1, 2, 1])})
+        block = [b for b in df3._data.blocks if b.is_categorical][0]
+        self.assertTrue(block.is_numeric)
+        self.assertFalse(block.is_object)
+        self.assertEqual(df3.values.dtype, np.float64)
+
 if __name__ == '__main__':
     # unittest.main()
     import nose
@@ -15,7 +15,8 @@ from pandas.core.index import (Index, MultiIndex, _get_combined_index,
                                _ensure_index, _get_consensus_names,
                                _all_indexes_same)
 from pandas.core.internals import (IntBlock, BoolBlock, BlockManager,
-                                   make_block, _consolidate)
+                                   make_block, _consolidate,
+                                   _packed_categorical)
 from pandas.util.decorators import cache_readonly, Appender, Substitution
 from pandas.core.common import PandasError, ABCSeries
 import pandas.core.common as com
@@ -258,9 +259,10 @@ class _MergeOperation(object):
                                     sort=self.sort)
         else:
             (left_indexer,
-             right_indexer) = _get_join_indexers(self.left_join_keys,
-                                                 self.right_join_keys,
-                                                 sort=self.sort, how=self.how)
+             right_indexer) = _get_join_indexers(
+                 self.left_join_keys, self.right_join_keys, sort=self.sort,
+                 how=self.how, left_factors=self.left_key_factors,
+                 right_factors=self.right_key_factors)
 
             if self.right_index:
                 join_index = self.left.index.take(left_indexer)
@@ -360,6 +362,16 @@ class _MergeOperation(object):
             else:
                 left_keys = [self.left.index.values]
 
+        # the categorical key columns are joined on their codes
+        self.left_key_factors = [None] * len(left_keys)
+        self.right_key_factors = [None] * len(right_keys)
+        if _any(self.left_on):
+            self.left_key_factors = [_key_factor(left, k)
+                                     for k in self.left_on]
+        if _any(self.right_on):
+            self.right_key_factors = [_key_factor(right, k)
+                                      for k in self.right_on]
+
         if left_drop:
             self.left = self.left.drop(left_drop, axis=1)
 
@@ -417,11 +429,15 @@ class _MergeOperation(object):
             raise AssertionError()
 
 
-def _get_join_indexers(left_keys, right_keys, sort=False, how='inner'):
+def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
+                       left_factors=None, right_factors=None):
     """
 
     Parameters
     ----------
+    left_factors, right_factors : lists of Categorical or None, optional
+        The Categoricals of the keys which are categorical; the keys that
+        are categorical on both sides are factorized from their codes
 
     Returns
     -------
@@ -430,12 +446,21 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner'):
     if not ((len(left_keys) == len(right_keys))):
         raise AssertionError()
 
+    if left_factors is None:
+        left_factors = [None] * len(left_keys)
+    if right_factors is None:
+        right_factors = [None] * len(right_keys)
+
     left_labels = []
     right_labels = []
     group_sizes = []
 
-    for lk, rk in zip(left_keys, right_keys):
-        llab, rlab, count = _factorize_keys(lk, rk, sort=sort)
+    for lk, rk, lf, rf in zip(left_keys, right_keys, left_factors,
+                              right_factors):
+        if lf is not None and rf is not None:
+            llab, rlab, count = _factorize_categorical_keys(lf, rf, sort=sort)
+        else:
+            llab, rlab, count = _factorize_keys(lk, rk, sort=sort)
 
         left_labels.append(llab)
         right_labels.append(rlab)
@@ -596,7 +621,37 @@ def _factorize_keys(lk, rk, sort=True):
         uniques = rizer.uniques.to_array()
         llab, rlab = _sort_labels(uniques, llab, rlab)
 
-    # NA group
+    return _na_group_labels(llab, rlab, count)
+
+
+def _factorize_categorical_keys(lk, rk, sort=True):
+    """
+    _factorize_keys for two Categoricals: the labels are the codes of the
+    left levels, those of the right levels missing on the left are appended
+    to them
+    """
+    llab = np.array(lk.labels, dtype=np.int64)
+    rlab = np.array(rk.labels, dtype=np.int64)
+
+    if lk.levels.equals(rk.levels):
+        uniques = lk.levels
+    else:
+        indexer = com._ensure_int64(lk.levels.get_indexer(rk.levels))
+        missing = indexer == -1
+        indexer[missing] = len(lk.levels) + np.arange(missing.sum())
+        rlab = np.where(rlab == -1, -1, indexer.take(rlab))
+        uniques = lk.levels.append(rk.levels[missing])
+
+    count = len(uniques)
+
+    if sort:
+        llab, rlab = _sort_labels(uniques.values, llab, rlab)
+
+    return _na_group_labels(llab, rlab, count)
+
+
+def _na_group_labels(llab, rlab, count):
+    """ put the nulls (label -1) of the keys into a group of their own """
     lmask = llab == -1
     lany = lmask.any()
     rmask = rlab == -1
@@ -612,6 +667,16 @@ def _factorize_keys(lk, rk, sort=True):
     return llab, rlab, count
 
 
+def _key_factor(obj, key):
+    """ the Categorical of a categorical merge key (column), or None """
+    if not isinstance(key, (np.ndarray, ABCSeries)):
+        try:
+            key = obj[key]
+        except (KeyError, TypeError):
+            return None
+    return _packed_categorical(key)
+
+
 def _sort_labels(uniques, left, right):
     if not isinstance(uniques, np.ndarray):
         # tuplesafe
@@ -17,6 +17,7 @@ from pandas.tseries.frequencies import (
 from pandas.tseries.offsets import DateOffset, generate_range, Tick, CDay
 from pandas.tseries.tools import parse_time_string, normalize_date
 from pandas.util.decorators import cache_readonly
+from pandas.util.misc import LRUCache
 import pandas.core.common as com
 import pandas.tseries.offsets as offsets
 import pandas.tseries.tools as tools
@@ -492,25 +493,25 @@ class DatetimeIndex(Int64Index):
         return tslib.ints_to_pydatetime(self.asi8, self.tz)
 
     def __unicode__(self):
-        from pandas.core.format import _format_datetime64
-        values = self.values
-
         freq = None
         if self.offset is not None:
             freq = self.offset.freqstr
 
+        # only the first and last stamps are shown, in local time
+        stamps = self.asi8
+        if len(stamps) > 2:
+            stamps = stamps.take([0, -1])
+        if self.tz is not None:
+            stamps = tslib.tz_convert(stamps, _utc(), self.tz)
+        formatted = tslib.format_array_from_datetime(stamps)
+
         summary = str(self.__class__)
         if len(self) == 1:
-            first = _format_datetime64(values[0], tz=self.tz)
-            summary += '\n[%s]' % first
+            summary += '\n[%s]' % formatted[0]
         elif len(self) == 2:
-            first = _format_datetime64(values[0], tz=self.tz)
-            last = _format_datetime64(values[-1], tz=self.tz)
-            summary += '\n[%s, %s]' % (first, last)
+            summary += '\n[%s, %s]' % tuple(formatted)
         elif len(self) > 2:
-            first = _format_datetime64(values[0], tz=self.tz)
-            last = _format_datetime64(values[-1], tz=self.tz)
-            summary += '\n[%s, ..., %s]' % (first, last)
+            summary += '\n[%s, ..., %s]' % tuple(formatted)
 
         tagline = '\nLength: %d, Freq: %s, Timezone: %s'
         summary += tagline % (len(self), freq, self.tz)
@@ -578,7 +579,14 @@ class DatetimeIndex(Int64Index):
             new_values = self.to_series() + delta
             result = DatetimeIndex(new_values, tz=self.tz, freq='infer')
         else:
-            new_values = self.astype('O') + delta
+            new_values = None
+            if self.tz is None and isinstance(delta, offsets.DateOffset):
+                try:
+                    new_values = delta.apply_index(self.asi8).view(_NS_DTYPE)
+                except NotImplementedError:
+                    pass
+            if new_values is None:
+                new_values = self.astype('O') + delta
             result = DatetimeIndex(new_values, tz=self.tz, freq='infer')
         return result
 
@@ -593,23 +601,42 @@ class DatetimeIndex(Int64Index):
         return header + self._format_native_types(**kwargs)
 
     def _format_native_types(self, na_rep=u('NaT'), **kwargs):
-        data = list(self)
+        # tz formatter
+        if self.tz is not None:
+            return [u('%s') % x for x in self]
 
-        # tz formatter or time formatter
-        zero_time = time(0, 0)
-        for d in data:
-            if d.time() != zero_time or d.tzinfo is not None:
-                return [u('%s') % x for x in data]
+        values = self.asi8
+        mask = values == tslib.iNaT
 
-        values = np.array(data,dtype=object)
-        mask = isnull(self.values)
-        values[mask] = na_rep
+        # dates only, or the full time
+        date_format = None
+        if (values[-mask] % offsets._DAY_NANOS == 0).all():
+            date_format = '%Y-%m-%d'
 
-        imask = -mask
-        values[imask] = np.array([u('%d-%.2d-%.2d') % (
-                                  dt.year, dt.month, dt.day)
-                                  for dt in values[imask] ])
-        return values.tolist()
+        return tslib.format_array_from_datetime(values, date_format,
+                                                na_rep=na_rep).tolist()
+
+    def strftime(self, date_format):
+        """
+        Format each stamp (in local time if the index is tz-aware) with the
+        strftime format date_format, NaT as 'NaT'
+
+        Returns
+        -------
+        formatted : ndarray of strings
+        """
+        values = self.asi8
+        if self.tz is not None:
+            values = self._local_timestamps()
+            values[self.asi8 == tslib.iNaT] = tslib.iNaT
+
+        result = tslib.format_array_from_datetime(values, date_format)
+        if result is None:
+            # a directive the array formatter does not know
+            result = np.array([u('NaT') if x is tslib.NaT
+                               else x.strftime(date_format) for x in self],
+                              dtype=object)
+        return result
 
     def isin(self, values):
         """
@@ -1673,6 +1700,10 @@ def _generate_regular_range(start, end, periods, offset):
         data = np.arange(b, e, stride, dtype=np.int64)
         data = DatetimeIndex._simple_new(data, None, tz=tz)
     else:
+        values = _generate_offset_range(start, end, periods, offset)
+        if values is not None:
+            return DatetimeIndex._simple_new(values, None)
+
         if isinstance(start, Timestamp):
             start = start.to_pydatetime()
 
@@ -1689,6 +1720,102 @@ def _generate_regular_range(start, end, periods, offset):
     return data
 
 
+# offsets whose ranges can be built with apply_index
+_vectorized_range_offsets = frozenset([
+    offsets.BusinessDay, offsets.MonthEnd, offsets.MonthBegin,
+    offsets.BusinessMonthEnd, offsets.BusinessMonthBegin,
+    offsets.QuarterEnd, offsets.QuarterBegin, offsets.BQuarterEnd,
+    offsets.BQuarterBegin, offsets.Week])
+
+# recently generated offset ranges, keyed by (offset, time of day of the
+# first stamp)
+_range_cache = LRUCache(maxsize=64)
+
+
+def _offset_past_end(value, offset, end):
+    # scalar offsets fall back to datetime arithmetic, which raises rather
+    # than wraps once the result leaves the datetime range
+    try:
+        return Timestamp(value) + offset > end
+    except (OverflowError, ValueError):
+        return True
+
+
+def _generate_offset_range(start, end, periods, offset):
+    """
+    The int64 stamps of generate_range(start, end, periods, offset), built
+    with offset.apply_index and sliced from a cached superset when one
+    covers them. Returns None if the offset cannot be applied vectorized
+    """
+    if offset.n <= 0 or type(offset) not in _vectorized_range_offsets:
+        return None
+    if isinstance(offset, offsets.BusinessDay) and offset.offset:
+        return None
+    if ((start is not None and start.tzinfo is not None) or
+            (end is not None and end.tzinfo is not None)):
+        return None
+
+    # resolve the first and last stamps the same way generate_range does
+    if start is not None:
+        start = Timestamp(start)
+        if not offset.onOffset(start):
+            start = Timestamp(offset.rollforward(start))
+
+    if end is not None:
+        end = Timestamp(end)
+        if not offset.onOffset(end):
+            end = Timestamp(offset.rollback(end))
+
+    if periods is not None and periods <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if end is None:
+        end = Timestamp(start + (periods - 1) * offset)
+    elif start is None:
+        start = Timestamp(end - (periods - 1) * offset)
+
+    if end < start:
+        return np.empty(0, dtype=np.int64)
+
+    key = (offset, start.value % offsets._DAY_NANOS)
+    cached = _range_cache.get(key)
+    if cached is not None and cached[-1] >= end.value:
+        i = cached.searchsorted(start.value)
+        if i < len(cached) and cached[i] == start.value:
+            j = cached.searchsorted(end.value, side='right')
+            return cached[i:j].copy()
+
+    # each pass offsets everything generated so far by its length, which
+    # doubles the range with one vectorized apply. Only the prefix whose
+    # offset stamps stay within end is shifted, so the int64 arithmetic of
+    # apply_index can neither overshoot end nor overflow past Timestamp.max
+    values = np.array([start.value], dtype=np.int64)
+    while True:
+        n = len(values)
+        step = offset * n
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _offset_past_end(values[mid], step, end):
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo > 0:
+            values = np.concatenate([values, step.apply_index(values[:lo])])
+        if lo < n:
+            break
+    values = values[:values.searchsorted(end.value, side='right')]
+
+    # the cached stamps are shared by all of the ranges sliced from them,
+    # so the ranges get copies and the cache cannot be written through
+    if cached is None or len(values) > len(cached):
+        cached = values.copy()
+        cached.setflags(write=False)
+        _range_cache[key] = cached
+
+    return values
+
+
 def date_range(start=None, end=None, periods=None, freq='D', tz=None,
                normalize=False, name=None):
     """
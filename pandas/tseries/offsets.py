@@ -91,6 +91,14 @@ class DateOffset(object):
         else:
             return other + timedelta(self.n)
 
+    def apply_index(self, i8):
+        """
+        Vectorized apply: offset the naive int64 nanosecond stamps of a
+        DatetimeIndex, returning the new stamps. Raises NotImplementedError
+        for offsets that can only be applied elementwise
+        """
+        raise NotImplementedError
+
     def isAnchored(self):
         return (self.n == 1)
 
@@ -357,6 +365,17 @@ class BusinessDay(CacheableOffset, DateOffset):
             raise TypeError('Only know how to combine business day with '
                             'datetime or timedelta!')
 
+    def apply_index(self, i8):
+        result = tslib.shift_bdays(i8, self.n)
+
+        if self.normalize:
+            result = tslib.date_normalize(result)
+
+        if self.offset:
+            result = _add_nanos(result, _delta_to_nanoseconds(self.offset))
+
+        return result
+
     @classmethod
     def onOffset(cls, dt):
         return dt.weekday() < 5
@@ -472,6 +491,9 @@ class CustomBusinessDay(BusinessDay):
 
         return result
 
+    def apply_index(self, i8):
+        raise NotImplementedError
+
     def onOffset(self, dt):
         day64 = self._to_dt64(dt).astype('datetime64[D]')
         return np.is_busday(day64, busdaycal=self.busdaycalendar)
@@ -492,6 +514,13 @@ class MonthEnd(CacheableOffset, DateOffset):
         other = other + relativedelta(months=n, day=31)
         return other
 
+    def apply_index(self, i8):
+        i8 = tslib.date_normalize(i8)
+        before = (tslib.get_date_field(i8, 'D') !=
+                  tslib.get_date_field(i8, 'dim'))
+        months = _roll_months(self.n, before=before)
+        return tslib.shift_months(i8, months, 'end')
+
     @classmethod
     def onOffset(cls, dt):
         days_in_month = tslib.monthrange(dt.year, dt.month)[1]
@@ -514,6 +543,11 @@ class MonthBegin(CacheableOffset, DateOffset):
         other = other + relativedelta(months=n, day=1)
         return other
 
+    def apply_index(self, i8):
+        after = tslib.get_date_field(i8, 'D') > 1
+        months = _roll_months(self.n, after=after)
+        return tslib.shift_months(i8, months, 'start')
+
     @classmethod
     def onOffset(cls, dt):
         return dt.day == 1
@@ -548,6 +582,13 @@ class BusinessMonthEnd(CacheableOffset, DateOffset):
             other = other - BDay()
         return other
 
+    def apply_index(self, i8):
+        i8 = tslib.date_normalize(i8)
+        day = tslib.get_date_field(i8, 'D')
+        last = tslib.get_date_field(i8, 'lbd')
+        months = _roll_months(self.n, before=day < last, after=day > last)
+        return tslib.shift_months(i8, months, 'business_end')
+
     @property
     def rule_code(self):
         return 'BM'
@@ -575,6 +616,13 @@ class BusinessMonthBegin(CacheableOffset, DateOffset):
         result = datetime(other.year, other.month, first)
         return result
 
+    def apply_index(self, i8):
+        i8 = tslib.date_normalize(i8)
+        day = tslib.get_date_field(i8, 'D')
+        first = tslib.get_date_field(i8, 'fbd')
+        months = _roll_months(self.n, before=day < first, after=day > first)
+        return tslib.shift_months(i8, months, 'business_start')
+
     @classmethod
     def onOffset(cls, dt):
         first_weekday, _ = tslib.monthrange(dt.year, dt.month)
@@ -635,6 +683,16 @@ class Week(CacheableOffset, DateOffset):
                 other = other - self._inc
         return other
 
+    def apply_index(self, i8):
+        if self.weekday is None:
+            days = 7 * self.n
+        else:
+            dow = tslib.get_date_field(i8, 'dow').astype(np.int64)
+            days = (self.weekday - dow) % 7 + 7 * self.n
+            if self.n > 0:
+                days -= 7 * (dow != self.weekday)
+        return _add_nanos(i8, days * _DAY_NANOS)
+
     def onOffset(self, dt):
         return dt.weekday() == self.weekday
 
@@ -770,6 +828,15 @@ class BQuarterEnd(CacheableOffset, DateOffset):
 
         return other
 
+    def apply_index(self, i8):
+        day = tslib.get_date_field(i8, 'D')
+        last = tslib.get_date_field(i8, 'lbd')
+        months_to_go = _months_to_quarter_end(i8, self.startingMonth)
+        on_end_month = months_to_go == 0
+        n = _roll_months(self.n, before=~(on_end_month & (day >= last)),
+                         after=on_end_month & (day > last))
+        return tslib.shift_months(i8, months_to_go + 3 * n, 'business_end')
+
     def onOffset(self, dt):
         modMonth = (dt.month - self.startingMonth) % 3
         return BMonthEnd().onOffset(dt) and modMonth == 0
@@ -837,6 +904,16 @@ class BQuarterBegin(CacheableOffset, DateOffset):
                           other.microsecond)
         return result
 
+    def apply_index(self, i8):
+        day = tslib.get_date_field(i8, 'D')
+        first = tslib.get_date_field(i8, 'fbd')
+        months_since = _months_since_quarter_start(i8, self.startingMonth,
+                                                   self.n)
+        on_start_month = months_since == 0
+        n = _roll_months(self.n, before=on_start_month & (day < first),
+                         after=on_start_month & (day > first))
+        return tslib.shift_months(i8, 3 * n - months_since, 'business_start')
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.startingMonth]
@@ -877,6 +954,14 @@ class QuarterEnd(CacheableOffset, DateOffset):
 
         return other
 
+    def apply_index(self, i8):
+        day = tslib.get_date_field(i8, 'D')
+        days_in_month = tslib.get_date_field(i8, 'dim')
+        months_to_go = _months_to_quarter_end(i8, self.startingMonth)
+        n = _roll_months(self.n,
+                         before=~((months_to_go == 0) & (day >= days_in_month)))
+        return tslib.shift_months(i8, months_to_go + 3 * n, 'end')
+
     def onOffset(self, dt):
         modMonth = (dt.month - self.startingMonth) % 3
         return MonthEnd().onOffset(dt) and modMonth == 0
@@ -918,6 +1003,16 @@ class QuarterBegin(CacheableOffset, DateOffset):
         other = other + relativedelta(months=3 * n - monthsSince, day=1)
         return other
 
+    def apply_index(self, i8):
+        day = tslib.get_date_field(i8, 'D')
+        months_since = _months_since_quarter_start(i8, self.startingMonth,
+                                                   self.n)
+        n = np.repeat(np.int64(self.n), len(i8))
+        if self.n < 0:
+            # after start, so come back an extra period as if rolled forward
+            n[(months_since == 0) & (day > 1)] += 1
+        return tslib.shift_months(i8, 3 * n - months_since, 'start')
+
     @property
     def rule_code(self):
         suffix = '-%s' % _month_dict[self.startingMonth]
@@ -1290,6 +1385,45 @@ BMonthBegin = BusinessMonthBegin
 CDay = CustomBusinessDay
 
 
+_DAY_NANOS = 24 * 60 * 60 * 1000000000
+
+
+def _add_nanos(i8, nanos):
+    """ add nanoseconds to int64 stamps, leaving NaT alone """
+    result = i8 + nanos
+    result[i8 == tslib.iNaT] = tslib.iNaT
+    return result
+
+
+def _roll_months(n, before=None, after=None):
+    """
+    Vectorized form of the roll adjustment in the month based apply methods:
+    one period less where n > 0 and the stamp is before the anchor of its
+    period, one more where n <= 0 and it is after the anchor
+    """
+    size = len(before) if before is not None else len(after)
+    result = np.repeat(np.int64(n), size)
+    if n > 0 and before is not None:
+        result[before] -= 1
+    elif n <= 0 and after is not None:
+        result[after] += 1
+    return result
+
+
+def _months_to_quarter_end(i8, startingMonth):
+    month = tslib.get_date_field(i8, 'M').astype(np.int64)
+    return (startingMonth - month) % 3
+
+
+def _months_since_quarter_start(i8, startingMonth, n):
+    month = tslib.get_date_field(i8, 'M').astype(np.int64)
+    result = (month - startingMonth) % 3
+    if n <= 0:
+        # make sure to roll forward, so negate
+        result[result != 0] -= 3
+    return result
+
+
 def _get_firstbday(wkday):
     """
     wkday is the result of monthrange(year, month)
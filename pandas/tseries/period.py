@@ -487,6 +487,11 @@ def _period_index_cmp(opname):
             if not (other.freq == self.freq):
                 raise AssertionError()
             return getattr(self.values, opname)(other.values)
+        elif (isinstance(other, np.ndarray) and
+              com.is_datetime64_dtype(other)):
+            base, mult = _gfc(self.freq)
+            ordinals = tslib.dt64arr_to_periodarr(other.view('i8'), base)
+            result = getattr(self.values, opname)(ordinals)
         else:
             other = Period(other, freq=self.freq)
             func = getattr(self.values, opname)
@@ -867,7 +872,8 @@ class PeriodIndex(Int64Index):
         if n == 0:
             return self
 
-        return PeriodIndex(data=self.values + n, freq=self.freq)
+        return PeriodIndex(ordinal=self.values + n, freq=self.freq,
+                           name=self.name)
 
     def __add__(self, other):
         return PeriodIndex(ordinal=self.values + other, freq=self.freq)
@@ -1061,14 +1067,21 @@ class PeriodIndex(Int64Index):
         return header + self._format_native_types(**kwargs)
 
     def _format_native_types(self, na_rep=u('NaT'), **kwargs):
+        base, mult = _gfc(self.freq)
+        values = tslib.period_format_array(self.values, base, na_rep=na_rep)
+        return values.tolist()
 
-        values = np.array(list(self),dtype=object)
-        mask = isnull(self.values)
-        values[mask] = na_rep
+    def strftime(self, date_format):
+        """
+        Format each period with date_format, which takes the same directives
+        as Period.strftime
 
-        imask = -mask
-        values[imask] = np.array([u('%s') % dt for dt in values[imask]])
-        return values.tolist()
+        Returns
+        -------
+        formatted : ndarray of strings
+        """
+        base, mult = _gfc(self.freq)
+        return tslib.period_format_array(self.values, base, date_format)
 
     def __array_finalize__(self, obj):
         if not self.ndim:  # pragma: no cover
@@ -111,6 +111,60 @@ class TestDateRange(unittest.TestCase):
         self.assertEquals(len(rng), 50)
         self.assertEquals(rng[0], datetime(2010, 9, 1, 5))
 
+    def test_offset_range_matches_generate_range(self):
+        freqs = ['B', 'M', 'MS', 'BM', 'BMS', 'Q', 'QS', 'BQ', 'BQS',
+                 'W', 'W-WED', '3M', '2B']
+        for freq in freqs:
+            offset = datetools.to_offset(freq)
+            for start in [datetime(2007, 3, 17), datetime(2008, 2, 29, 9),
+                          datetime(1940, 1, 1)]:
+                rng = date_range(start, periods=35, freq=freq)
+                expected = list(generate_range(start, periods=35,
+                                               offset=offset))
+                self.assert_(rng.equals(DatetimeIndex(expected)))
+
+                end = datetime(2009, 12, 31)
+                rng = date_range(start, end, freq=freq)
+                expected = list(generate_range(start, end, offset=offset))
+                self.assert_(rng.equals(DatetimeIndex(expected)))
+
+                rng = date_range(end=end, periods=10, freq=freq)
+                expected = list(generate_range(end=end, periods=10,
+                                               offset=offset))
+                self.assert_(rng.equals(DatetimeIndex(expected)))
+
+    def test_offset_range_near_bounds(self):
+        # doubling past end must not overflow the int64 stamps
+        rng = date_range('2000-01-31', '2200-12-31', freq='M')
+        self.assertEquals(len(rng), 2412)
+        self.assert_(rng.is_monotonic)
+        self.assertEquals(rng[-1], Timestamp('2200-12-31'))
+
+        rng = date_range('2262-01-02', '2262-04-11', freq='B')
+        self.assertEquals(rng[0], Timestamp('2262-01-02'))
+        self.assertEquals(rng[-1], Timestamp('2262-04-11'))
+        self.assertEquals(len(rng), 72)
+        self.assert_((rng.dayofweek < 5).all())
+
+    def test_offset_range_cache(self):
+        from pandas.tseries.index import _range_cache
+        _range_cache.clear()
+
+        rng = date_range('1940-01-01 09:30', '1945-01-01', freq='BM')
+        sub = date_range('1941-03-05 09:30', '1943-06-30', freq='BM')
+        self.assertEquals(_range_cache.hits, 1)
+        mask = ((rng >= Timestamp('1941-03-05')) &
+                (rng <= Timestamp('1943-06-30')))
+        self.assert_(sub.equals(rng[mask]))
+
+        # the ranges do not share the cached stamps
+        a = date_range('2000-01-31', periods=24, freq='M')
+        b = date_range('2000-03-31', periods=5, freq='M')
+        a.values[2] = 0
+        self.assertEquals(b[0], Timestamp('2000-03-31'))
+        c = date_range('2000-03-31', periods=5, freq='M')
+        self.assertEquals(c[0], Timestamp('2000-03-31'))
+
     def test_timezone_comparaison_bug(self):
         start = Timestamp('20130220 10:00', tz='US/Eastern')
         try:
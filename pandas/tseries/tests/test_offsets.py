@@ -21,7 +21,7 @@ from pandas.tseries.index import _to_m8, DatetimeIndex, _daterange_cache
 from pandas.tseries.tools import parse_time_string
 import pandas.tseries.offsets as offsets
 
-from pandas.tslib import monthrange
+from pandas.tslib import monthrange, iNaT
 from pandas.lib import Timestamp
 from pandas.util.testing import assertRaisesRegexp
 import pandas.util.testing as tm
@@ -1727,6 +1727,31 @@ def test_quarterly_dont_normalize():
         assert(result.time() == date.time())
 
 
+def test_apply_index_matches_apply():
+    rng = DatetimeIndex(start=datetime(2007, 12, 25, 9, 30), periods=200,
+                        freq='37H')
+    stamps = rng.append(DatetimeIndex([datetime(2008, 2, 29),
+                                       datetime(2008, 3, 31),
+                                       datetime(2008, 6, 30),
+                                       datetime(2008, 8, 29)]))
+
+    offsets = [BDay, BMonthBegin, BMonthEnd, MonthBegin, MonthEnd,
+               BQuarterBegin, BQuarterEnd, QuarterBegin, QuarterEnd,
+               lambda n: Week(n), lambda n: Week(n, weekday=2)]
+
+    for klass in offsets:
+        for n in [-13, -5, -1, 0, 1, 2, 7, 13]:
+            offset = klass(n)
+            result = offset.apply_index(stamps.asi8)
+            expected = [Timestamp(offset.apply(d)).value for d in stamps]
+            assert np.array_equal(result, expected)
+
+            assert (stamps + offset).equals(DatetimeIndex(result))
+
+    result = MonthEnd().apply_index(np.array([iNaT], dtype=np.int64))
+    assert result[0] == iNaT
+
+
 class TestOffsetAliases(unittest.TestCase):
 
     def setUp(self):
@@ -18,11 +18,12 @@ from pandas.tseries.period import Period, PeriodIndex, period_range
 from pandas.tseries.index import DatetimeIndex, date_range, Index
 from pandas.tseries.tools import to_datetime
 import pandas.tseries.period as pmod
+import pandas.tslib as tslib
 
 import pandas.core.datetools as datetools
 import pandas as pd
 import numpy as np
-from pandas.compat import range, lrange, lmap, map, zip
+from pandas.compat import range, lrange, lmap, map, zip, u
 randn = np.random.randn
 
 from pandas import Series, TimeSeries, DataFrame
@@ -1175,6 +1176,15 @@ class TestPeriodIndex(TestCase):
         exp = idx.values < idx.values[10]
         self.assert_(np.array_equal(result, exp))
 
+    def test_comp_datetime64(self):
+        idx = period_range('2007-01-01', periods=20, freq='D')
+        stamps = date_range('2007-01-05 12:00', periods=20, freq='12H')
+
+        result = idx >= stamps.values
+        exp = np.array([p >= Period(x, freq='D')
+                        for p, x in zip(idx, stamps)])
+        self.assert_(np.array_equal(result, exp))
+
     def test_getitem_ndim2(self):
         idx = period_range('2007-01', periods=3, freq='M')
 
@@ -1564,6 +1574,27 @@ class TestPeriodIndex(TestCase):
         assert_equal(len(pi1), len(pi2))
         assert_equal(pi1.shift(-1).values, pi2.values)
 
+    def test_asfreq_arr_matches_scalar(self):
+        from pandas.tseries.frequencies import get_freq
+        pi = PeriodIndex(freq='D', start='1/1/1990', end='12/31/2010')
+
+        for freq in ['D', 'B', 'W-WED', 'M', 'Q-NOV', 'A-JUN', 'H']:
+            values = pi.asfreq(freq, 'S').values[::37]
+            base1 = get_freq(freq)
+            for target in ['A', 'Q-MAR', 'M', 'W', 'B', 'D', 'H', 'S']:
+                base2 = get_freq(target)
+                for end in [False, True]:
+                    result = tslib.period_asfreq_arr(values, base1, base2,
+                                                     end)
+                    expected = [tslib.period_asfreq(x, base1, base2, end)
+                                for x in values]
+                    self.assert_(np.array_equal(result, expected))
+
+        stamps = pi.asfreq('H', 'E').to_timestamp()
+        expected = DatetimeIndex([p.to_timestamp() for p in
+                                  pi.asfreq('H', 'E')])
+        self.assert_(stamps.equals(expected))
+
     def test_asfreq(self):
         pi1 = PeriodIndex(freq='A', start='1/1/2001', end='1/1/2001')
         pi2 = PeriodIndex(freq='Q', start='1/1/2001', end='1/1/2001')
@@ -2168,6 +2199,17 @@ class TestPeriodRepresentation(unittest.TestCase):
         period = Period(ordinal=-1, freq='W')
         repr(period)
 
+    def test_format_array(self):
+        for freq in ['A', 'Q', 'M', 'W-THU', 'D', 'B', 'H', 'T', 'S']:
+            rng = PeriodIndex(start='1969-12-01', periods=10, freq=freq)
+            expected = [u('%s') % p for p in rng]
+            self.assertEquals(rng.format(), expected)
+
+        rng = PeriodIndex(start='2000-01-01', periods=10, freq='D')
+        for fmt in ['%Y-%m-%d %H', '%F-Q%q %b', '%d/%m/%y']:
+            expected = [p.strftime(fmt) for p in rng]
+            self.assertEquals(list(rng.strftime(fmt)), expected)
+
 
 class TestComparisons(unittest.TestCase):
     def setUp(self):
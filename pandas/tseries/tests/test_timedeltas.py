@@ -163,6 +163,35 @@ class TestTimedeltas(unittest.TestCase):
         expected = to_timedelta([0,10],unit='s')
         tm.assert_series_equal(result, expected)
 
+    def test_to_timedelta_string_array(self):
+        _skip_if_numpy_not_friendly()
+
+        strings = ['1 days 06:05:01.00003', '15.5us', '', 'nat', '-1s',
+                   '1days, 06:00:01.01', '00:00:01', '10', '1D']
+        arr = np.array(strings * 3, dtype=object)
+
+        result = to_timedelta(arr, box=False)
+        expected = np.array([ ct(s) for s in strings * 3 ])
+        tm.assert_almost_equal(result.view('i8'), expected.view('i8'))
+
+        result = to_timedelta(np.array(['10', '1'], dtype=object), unit='s',
+                              box=False)
+        expected = np.array([10, 1], dtype='m8[s]').astype('m8[ns]')
+        tm.assert_almost_equal(result.view('i8'), expected.view('i8'))
+
+        self.assertRaises(ValueError, to_timedelta,
+                          np.array(['1s', '1foo'], dtype=object))
+
+        # nulls do not send the strings to the per element path
+        arr = np.array(['1s', np.nan, None, tslib.NaT, '2s'], dtype=object)
+        result = tslib.array_strings_to_timedelta64(arr)
+        self.assert_(result is not None)
+        expected = np.array([10**9] + [tslib.iNaT] * 3 + [2 * 10**9],
+                            dtype=np.int64)
+        tm.assert_almost_equal(result, expected)
+        result = to_timedelta(arr, box=False)
+        tm.assert_almost_equal(result.view('i8'), expected)
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
@@ -858,6 +858,46 @@ class TestTimeSeries(unittest.TestCase):
         result = to_datetime(s,format='%Y%m%d')
         assert_series_equal(result, expected)
 
+    def test_to_datetime_infer_datetime_format(self):
+        from pandas.tseries.tools import _guess_datetime_format
+
+        for values, fmt in [(['2011-01-03', '2011-02-04'], '%Y-%m-%d'),
+                            (['2011-01-03 10:00:15'], '%Y-%m-%d %H:%M:%S'),
+                            (['01/03/2011', '12/31/2011'], '%m/%d/%Y'),
+                            (['13/01/2011', '31/12/2011'], '%d/%m/%Y'),
+                            (['20110103'], '%Y%m%d'),
+                            (['2011-01-03', 'foo'], None),
+                            ([np.nan, None], None)]:
+            values = np.array(values, dtype=object)
+            self.assertEqual(_guess_datetime_format(values), fmt)
+
+        s = Series(['01/03/2011 10:00:00', np.nan] * 10 +
+                   ['12/31/2011 00:00:05'])
+        for values in [s, s.values, s.tolist()]:
+            result = to_datetime(values, infer_datetime_format=True)
+            expected = to_datetime(values)
+            self.assert_(np.array_equal(np.asarray(result),
+                                        np.asarray(expected)))
+
+        # a value not in the guessed format falls back to parsing each
+        s = Series(['2011-01-03', '2011-01-04', 'Jan 5 2011'])
+        result = to_datetime(s, infer_datetime_format=True)
+        assert_series_equal(result, to_datetime(s))
+
+    def test_to_datetime_cache(self):
+        s = Series(['2011-01-03', np.nan, '2011-01-04'] * 5)
+        expected = to_datetime(s)
+        assert_series_equal(to_datetime(s, cache=True), expected)
+        self.assert_(to_datetime(s.values, cache=True).equals(
+            to_datetime(s.values)))
+        self.assert_(to_datetime([np.nan] * 3, cache=True).equals(
+            to_datetime([np.nan] * 3)))
+
+        # unparseable values are returned as is
+        s = Series(['foo', 'bar', 'foo'])
+        assert_series_equal(to_datetime(s, cache=True), s)
+        self.assertRaises(ValueError, to_datetime, s, errors='raise',
+                          cache=True)
 
     def test_to_datetime_format_microsecond(self):
         val = '01-Apr-2011 00:00:01.978'
@@ -1095,6 +1135,60 @@ class TestTimeSeries(unittest.TestCase):
         ts = Series(1, index=rng)
         repr(ts)
 
+    def test_format_array(self):
+        rng = date_range('1/1/1850', periods=10, freq='7H')
+        stamps = rng.append(DatetimeIndex([NaT,
+                                           Timestamp('2000-01-01 00:00:00.1'),
+                                           Timestamp(946684800000000001)]))
+
+        # iterating the index drops the nanoseconds
+        expected = [Timestamp(x)._repr_base if x != iNaT else 'NaT'
+                    for x in stamps.asi8]
+        self.assertEquals(stamps.format(), expected)
+
+        dates = DatetimeIndex([datetime(1850, 1, 1), NaT,
+                               datetime(2000, 3, 4)])
+        expected = ['%d-%.2d-%.2d' % (x.year, x.month, x.day)
+                    if x is not NaT else 'NaT' for x in dates]
+        self.assertEquals(dates.format(), expected)
+
+        # (datetime.strftime requires years from 1900 on python 2)
+        rng2 = date_range('1/1/2000', periods=10, freq='7H')
+        for fmt in ['%Y-%m-%d', '%d/%m/%y %H:%M:%S.%f', '100%% %Y', '%b %Y']:
+            expected = [x.strftime(fmt) for x in rng2]
+            self.assertEquals(list(rng2.strftime(fmt)), expected)
+
+        self.assertEquals(stamps.strftime('%Y')[10], 'NaT')
+
+        df = DataFrame({'a': stamps})
+        expected = ['NA' if x == iNaT else Timestamp(x)._repr_base
+                    for x in stamps.asi8]
+        result = df._data.blocks[0].to_native_types(na_rep='NA')[0]
+        self.assertEquals(result, expected)
+
+    def test_field_kernels_nthreads(self):
+        rng = date_range('1/1/1990', periods=200000, freq='17T')
+        stamps = rng.asi8.copy()
+        stamps[::1000] = iNaT
+
+        for field in ['Y', 'M', 'D', 'h', 'm', 's', 'us', 'ns', 'doy',
+                      'dow', 'woy', 'q', 'dim']:
+            expected = tslib.get_date_field(stamps, field)
+            result = tslib.get_date_field(stamps, field, nthreads=4)
+            self.assert_(np.array_equal(result, expected))
+
+        expected = tslib.build_field_sarray(stamps)
+        result = tslib.build_field_sarray(stamps, nthreads=4)
+        self.assert_(np.array_equal(result, expected))
+        self.assertEquals(result['Y'][1], 1990)
+        self.assertEquals(result['m'][1], 17)
+
+        expected = tslib.date_normalize(stamps)
+        result = tslib.date_normalize(stamps, nthreads=4)
+        self.assert_(np.array_equal(result, expected))
+        self.assertEquals(result[0], iNaT)
+        self.assertEquals(result[1], Timestamp('1990-01-01').value)
+
     def test_repeat(self):
         rng = date_range('1/1/2000', '1/1/2001')
 
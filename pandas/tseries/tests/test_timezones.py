@@ -24,6 +24,8 @@ from pandas.util.testing import assert_series_equal, assert_almost_equal, assert
 import pandas.util.testing as tm
 
 import pandas.lib as lib
+import pandas.tslib as tslib
+from pandas.tslib import iNaT
 import pandas.core.datetools as dt
 from numpy.random import rand
 from pandas.util.testing import assert_frame_equal
@@ -164,6 +166,42 @@ class TestTimeZoneSupport(unittest.TestCase):
         self.assertRaises(
             pytz.NonExistentTimeError, dti.tz_localize, 'US/Eastern')
 
+    def test_transition_table_localize_convert(self):
+        tz = pytz.timezone('US/Eastern')
+        rng = date_range('1/1/2005', '1/1/2008', freq='37T').to_pydatetime()
+
+        utc = np.array([Timestamp(tz.localize(x)).value for x in rng
+                        if not self._is_dst_edge(tz, x)], dtype=np.int64)
+        naive = np.array([Timestamp(x).value for x in rng
+                          if not self._is_dst_edge(tz, x)], dtype=np.int64)
+
+        # unsorted values and NaT
+        indexer = np.random.permutation(len(naive))
+        naive = np.append(naive[indexer], iNaT)
+        utc = np.append(utc[indexer], iNaT)
+
+        result = tslib.tz_localize_to_utc(naive, tz)
+        self.assert_(np.array_equal(result, utc))
+        result = tslib.tz_convert(utc, pytz.utc, tz)
+        self.assert_(np.array_equal(result, naive))
+
+        # the localized instances of a zone share its compiled table
+        stamp = tz.localize(datetime(2005, 7, 1))
+        self.assert_(tslib._get_dst_info(stamp.tzinfo) is
+                     tslib._get_dst_info(tz))
+
+        fixed = pytz.FixedOffset(-300)
+        result = tslib.tz_localize_to_utc(naive, fixed)
+        expected = np.where(naive == iNaT, iNaT, naive + 5 * 3600 * 10**9)
+        self.assert_(np.array_equal(result, expected))
+
+    def _is_dst_edge(self, tz, dt):
+        try:
+            tz.localize(dt, is_dst=None)
+        except (pytz.AmbiguousTimeError, pytz.NonExistentTimeError):
+            return True
+        return False
+
     def test_tz_localize_empty_series(self):
         # #2248
 
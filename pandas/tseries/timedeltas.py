@@ -2,7 +2,6 @@
 timedelta support tools
 """
 
-import re
 from datetime import timedelta
 
 import numpy as np
@@ -43,7 +42,14 @@ def to_timedelta(arg, box=True, unit='ns'):
                 return Series(arg,dtype='m8[ns]')
             return arg
 
-        value = np.array([ _coerce_scalar_to_timedelta_type(r, unit=unit) for r in arg ])
+        value = None
+        if arg.dtype == np.object_:
+            # strings are parsed in one pass, once per distinct value
+            value = tslib.array_strings_to_timedelta64(arg, unit=unit)
+        if value is None:
+            value = np.array([ _coerce_scalar_to_timedelta_type(r, unit=unit) for r in arg ])
+        else:
+            value = value.view('m8[ns]')
         if box:
             from pandas import Series
             value = Series(value,dtype='m8[ns]')
@@ -60,14 +66,6 @@ def to_timedelta(arg, box=True, unit='ns'):
 
     return _convert_listlike([ arg ], box=False)[0]
 
-_short_search = re.compile(
-    "^\s*(?P<neg>-?)\s*(?P<value>\d*\.?\d*)\s*(?P<unit>d|s|ms|us|ns)?\s*$",re.IGNORECASE)
-_full_search = re.compile(
-    "^\s*(?P<neg>-?)\s*(?P<days>\d+)?\s*(days|d)?,?\s*(?P<time>\d{2}:\d{2}:\d{2})?(?P<frac>\.\d+)?\s*$",re.IGNORECASE)
-_nat_search = re.compile(
-    "^\s*(nat|nan)\s*$",re.IGNORECASE)
-_whitespace = re.compile('^\s*$')
-
 def _coerce_scalar_to_timedelta_type(r, unit='ns'):
     # kludgy here until we have a timedelta scalar
     # handle the numpy < 1.7 case
@@ -78,8 +76,7 @@ def _coerce_scalar_to_timedelta_type(r, unit='ns'):
         return np.timedelta64(v)
 
     if isinstance(r, compat.string_types):
-        converter = _get_string_converter(r, unit=unit)
-        r = converter()
+        r = tslib.parse_timedelta_string(r, unit)
         r = conv(r)
     elif r == tslib.iNaT:
         return r
@@ -104,66 +101,6 @@ def _coerce_scalar_to_timedelta_type(r, unit='ns'):
         raise AssertionError("Invalid type for timedelta scalar: %s" % type(r))
     return r.astype('timedelta64[ns]')
 
-def _get_string_converter(r, unit='ns'):
-    """ return a string converter for r to process the timedelta format """
-
-    # treat as a nan
-    if _whitespace.search(r):
-        def convert(r=None, unit=None):
-            return tslib.iNaT
-        return convert
-
-    m = _short_search.search(r)
-    if m:
-        def convert(r=None, unit=unit, m=m):
-            if r is not None:
-                m = _short_search.search(r)
-
-            gd = m.groupdict()
-
-            r = float(gd['value'])
-            u = gd.get('unit')
-            if u is not None:
-                unit = u.lower()
-            if gd['neg']:
-                r *= -1
-            return tslib.cast_from_unit(r, unit)
-        return convert
-
-    m = _full_search.search(r)
-    if m:
-        def convert(r=None, unit=None, m=m):
-            if r is not None:
-                m = _full_search.search(r)
-
-            gd = m.groupdict()
-
-            # convert to seconds
-            value = float(gd['days'] or 0) * 86400
-
-            time = gd['time']
-            if time:
-                (hh,mm,ss) = time.split(':')
-                value += float(hh)*3600 + float(mm)*60 + float(ss)
-
-            frac = gd['frac']
-            if frac:
-                value += float(frac)
-
-            if gd['neg']:
-                value *= -1
-            return tslib.cast_from_unit(value, 's')
-        return convert
-
-    m = _nat_search.search(r)
-    if m:
-        def convert(r=None, unit=None, m=m):
-            return tslib.iNaT
-        return convert
-
-    # no converter
-    raise ValueError("cannot create timedelta string converter")
-
 def _possibly_cast_to_timedelta(value, coerce=True):
     """ try to cast to timedelta64, if already a timedeltalike, then make
         sure that we are [ns] (as numpy 1.6.2 is very buggy in this regards,
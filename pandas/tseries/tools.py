@@ -6,6 +6,7 @@ import numpy as np
 
 import pandas.lib as lib
 import pandas.tslib as tslib
+import pandas.hashtable as _hash
 import pandas.core.common as com
 from pandas.compat import StringIO, callable
 import pandas.compat as compat
@@ -50,8 +51,88 @@ def _maybe_get_tz(tz):
     return tz
 
 
+# the formats tried by _guess_datetime_format, in order
+_guess_formats = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f',
+                  '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S',
+                  '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M', '%Y%m%d',
+                  '%Y/%m/%d', '%Y/%m/%d %H:%M:%S', '%Y/%m/%d %H:%M',
+                  '%m/%d/%Y', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M',
+                  '%d/%m/%Y', '%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M',
+                  '%m-%d-%Y', '%d-%m-%Y', '%d.%m.%Y', '%d.%m.%Y %H:%M:%S',
+                  '%d %b %Y', '%b %d %Y', '%d %B %Y', '%B %d %Y',
+                  '%d-%b-%Y', '%Y%m%d %H:%M:%S', '%Y%m%d%H%M%S']
+
+# the number of values checked against a guessed format
+_guess_sample_size = 20
+
+
+def _guess_datetime_format(values, dayfirst=False):
+    """
+    Guess the strptime format of the strings in values (an object array),
+    checking it against a sample of the non-null values: each must parse
+    with the format to the datetime dateutil gives. Returns None when no
+    format fits them all (or they are not all strings)
+    """
+    sample = values[com.notnull(values)][:_guess_sample_size]
+    if len(sample) == 0:
+        return None
+
+    for val in sample:
+        if not isinstance(val, compat.string_types):
+            return None
+
+    try:
+        expected = [parse(val, dayfirst=dayfirst) for val in sample]
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+    for fmt in _guess_formats:
+        try:
+            if all(datetime.strptime(val, fmt) == exp
+                   for val, exp in zip(sample, expected)):
+                return fmt
+        except ValueError:
+            pass
+    return None
+
+
+def _parse_with_format(arg, format):
+    """ parse the strings of the object array arg, all in format """
+    result = None
+
+    # shortcut formatting here
+    if format == '%Y%m%d':
+        try:
+            result = _attempt_YYYYMMDD(arg)
+        except:
+            raise ValueError("cannot convert the input to '%Y%m%d' date format")
+
+    # fallback
+    if result is None:
+        result = tslib.array_strptime(arg, format)
+    return result
+
+
+def _parse_strict(arg, format):
+    """
+    Parse the strings of the object array arg (with nulls becoming NaT) in
+    format, or None if one does not match it
+    """
+    mask = com.notnull(arg)
+    try:
+        if mask.all():
+            return _parse_with_format(arg, format)
+        result = np.empty(len(arg), dtype='M8[ns]')
+        result.view('i8')[~mask] = tslib.iNaT
+        result[mask] = _parse_with_format(arg[mask], format)
+        return result
+    except (ValueError, TypeError):
+        return None
+
+
 def to_datetime(arg, errors='ignore', dayfirst=False, utc=None, box=True,
-                format=None, coerce=False, unit='ns'):
+                format=None, coerce=False, unit='ns',
+                infer_datetime_format=False, cache=False):
     """
     Convert argument to datetime
 
@@ -74,6 +155,13 @@ def to_datetime(arg, errors='ignore', dayfirst=False, utc=None, box=True,
     coerce : force errors to NaT (False by default)
     unit : unit of the arg (D,s,ms,us,ns) denote the unit in epoch
         (e.g. a unix timestamp), which is an integer/float number
+    infer_datetime_format : boolean, default False
+        If no format is given, guess it from a sample of the strings and,
+        if one fits, parse them all with it (falling back to parsing each
+        string on its own if some do not match)
+    cache : boolean, default False
+        Parse each distinct value only once and broadcast the results,
+        faster when values repeat (e.g. many rows of few dates)
 
     Returns
     -------
@@ -83,7 +171,7 @@ def to_datetime(arg, errors='ignore', dayfirst=False, utc=None, box=True,
     from pandas.core.series import Series
     from pandas.tseries.index import DatetimeIndex
 
-    def _convert_listlike(arg, box):
+    def _convert_listlike(arg, box, cache=cache):
 
         if isinstance(arg, (list,tuple)):
             arg = np.array(arg, dtype='O')
@@ -99,21 +187,35 @@ def to_datetime(arg, errors='ignore', dayfirst=False, utc=None, box=True,
             return arg
 
         arg = com._ensure_object(arg)
+
+        if cache:
+            # parse the distinct values, and take the results
+            table = _hash.PyObjectHashTable(len(arg))
+            uniques = _hash.ObjectVector()
+            labels = table.get_labels(arg, uniques, 0, -1)
+            uniques = uniques.to_array()
+            if len(uniques) < len(arg):
+                parsed = _convert_listlike(uniques, box=False, cache=False)
+                if (com.is_datetime64_dtype(parsed) and
+                        getattr(parsed, 'tz', None) is None):
+                    result = com.take_1d(np.asarray(parsed).view('i8'),
+                                         labels, fill_value=tslib.iNaT)
+                    result = result.view('M8[ns]')
+                    if box:
+                        result = DatetimeIndex(result,
+                                               tz='utc' if utc else None)
+                    return result
+
         try:
+            result = None
             if format is not None:
-                result = None
-
-                # shortcut formatting here
-                if format == '%Y%m%d':
-                    try:
-                        result = _attempt_YYYYMMDD(arg)
-                    except:
-                        raise ValueError("cannot convert the input to '%Y%m%d' date format")
-
-                # fallback
-                if result is None:
-                    result = tslib.array_strptime(arg, format)
-            else:
+                result = _parse_with_format(arg, format)
+            elif infer_datetime_format:
+                guessed = _guess_datetime_format(arg, dayfirst=dayfirst)
+                if guessed is not None:
+                    result = _parse_strict(arg, guessed)
+
+            if result is None:
                 result = tslib.array_to_datetime(arg, raise_=errors == 'raise',
                                                  utc=utc, dayfirst=dayfirst,
                                                  coerce=coerce, unit=unit)
@@ -18,6 +18,7 @@ cdef extern from "Python.h":
 
 
 from libc.stdlib cimport free
+from libc.stdio cimport sprintf
 
 from util cimport is_integer_object, is_datetime64_object
 cimport util
@@ -29,6 +30,7 @@ cimport cython
 from datetime import timedelta, datetime
 from datetime import time as datetime_time
 from pandas.compat import parse_date
+from pandas.util.misc import LRUCache
 
 cdef extern from "Python.h":
     int PySlice_Check(object)
@@ -997,6 +999,190 @@ def array_to_timedelta64(ndarray[object] values, coerce=True):
 
     return result
 
+#----------------------------------------------------------------------
+# timedelta string parsing
+
+cdef inline bint _is_space(char c):
+    return (c == c' ' or c == c'\t' or c == c'\n' or c == c'\r' or
+            c == c'\f' or c == c'\v')
+
+cdef inline bint _is_digit(char c):
+    return c >= c'0' and c <= c'9'
+
+cdef inline Py_ssize_t _skip_spaces(char *buf, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_space(buf[i]):
+        i += 1
+    return i
+
+cdef inline Py_ssize_t _skip_digits(char *buf, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_digit(buf[i]):
+        i += 1
+    return i
+
+cdef inline bint _match_word(char *buf, Py_ssize_t i, Py_ssize_t n,
+                             char *word, Py_ssize_t length):
+    """ case insensitive match of the lowercase ascii word at buf[i] """
+    cdef Py_ssize_t k
+    if i + length > n:
+        return False
+    for k in range(length):
+        if (buf[i + k] | 0x20) != word[k]:
+            return False
+    return True
+
+cdef inline int _two_digits(char *buf, Py_ssize_t i):
+    return (buf[i] - c'0') * 10 + (buf[i + 1] - c'0')
+
+cdef inline bint _is_clock(char *buf, Py_ssize_t i, Py_ssize_t n):
+    """ hh:mm:ss at buf[i] """
+    return (i + 8 <= n and
+            _is_digit(buf[i]) and _is_digit(buf[i + 1]) and
+            buf[i + 2] == c':' and
+            _is_digit(buf[i + 3]) and _is_digit(buf[i + 4]) and
+            buf[i + 5] == c':' and
+            _is_digit(buf[i + 6]) and _is_digit(buf[i + 7]))
+
+
+cpdef int64_t parse_timedelta_string(object ts, object unit='ns') except? -1:
+    """
+    Convert a timedelta string to nanoseconds, iNaT for a blank string,
+    'nat' or 'nan'. Accepts the short format '[-]number[d|s|ms|us|ns]',
+    where a number without a unit is taken in unit, and the full format
+    '[-][days[days|d][,]][hh:mm:ss][.frac]'
+    """
+    cdef:
+        bytes data
+        char *buf
+        Py_ssize_t i, j, n, first, start, end
+        Py_ssize_t days_start, days_end
+        Py_ssize_t clock_start = -1, frac_start = -1, frac_end = -1
+        bint neg
+        double value
+
+    if isinstance(ts, unicode):
+        data = (<unicode> ts).encode('utf-8')
+    else:
+        data = ts
+    buf = data
+    n = len(data)
+
+    first = _skip_spaces(buf, 0, n)
+    if first == n:
+        return iNaT
+
+    i = first
+    neg = buf[i] == c'-'
+    if neg:
+        i = _skip_spaces(buf, i + 1, n)
+    start = i
+
+    # short format
+    end = _skip_digits(buf, start, n)
+    if end < n and buf[end] == c'.':
+        end = _skip_digits(buf, end + 1, n)
+    j = _skip_spaces(buf, end, n)
+
+    short_unit = unit
+    if _match_word(buf, j, n, b'ms', 2):
+        short_unit = 'ms'
+        j += 2
+    elif _match_word(buf, j, n, b'us', 2):
+        short_unit = 'us'
+        j += 2
+    elif _match_word(buf, j, n, b'ns', 2):
+        short_unit = 'ns'
+        j += 2
+    elif _match_word(buf, j, n, b'd', 1):
+        short_unit = 'd'
+        j += 1
+    elif _match_word(buf, j, n, b's', 1):
+        short_unit = 's'
+        j += 1
+
+    if _skip_spaces(buf, j, n) == n:
+        number = float(data[start:end])
+        if neg:
+            number *= -1
+        return cast_from_unit(number, short_unit)
+
+    # full format
+    days_start = start
+    days_end = _skip_digits(buf, start, n)
+    if days_end < n and buf[days_end] == c':':
+        # the last two digits are the hours
+        days_end -= 2
+        if days_end < days_start:
+            raise ValueError("cannot parse timedelta string [%s]" % ts)
+        j = days_end
+    else:
+        j = _skip_spaces(buf, days_end, n)
+        if _match_word(buf, j, n, b'days', 4):
+            j += 4
+        elif _match_word(buf, j, n, b'd', 1):
+            j += 1
+        if j < n and buf[j] == c',':
+            j += 1
+        j = _skip_spaces(buf, j, n)
+
+    if _is_clock(buf, j, n):
+        clock_start = j
+        j += 8
+    if j + 1 < n and buf[j] == c'.' and _is_digit(buf[j + 1]):
+        frac_start = j
+        j = frac_end = _skip_digits(buf, j + 1, n)
+
+    if _skip_spaces(buf, j, n) == n:
+        value = 0
+        if days_end > days_start:
+            value = float(data[days_start:days_end]) * 86400
+        if clock_start >= 0:
+            value += (_two_digits(buf, clock_start) * 3600. +
+                      _two_digits(buf, clock_start + 3) * 60. +
+                      _two_digits(buf, clock_start + 6))
+        if frac_start >= 0:
+            value += float(data[frac_start:frac_end])
+        if neg:
+            value *= -1
+        return cast_from_unit(value, 's')
+
+    # nat
+    j = first
+    if _match_word(buf, j, n, b'nat', 3) or _match_word(buf, j, n, b'nan', 3):
+        if _skip_spaces(buf, j + 3, n) == n:
+            return iNaT
+
+    raise ValueError("cannot parse timedelta string [%s]" % ts)
+
+
+def array_strings_to_timedelta64(ndarray[object] values, object unit='ns'):
+    """
+    Parse an array of timedelta strings to nanoseconds, parsing each
+    distinct string once; nulls become iNaT. Returns None if values holds
+    anything other than strings and nulls
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+        dict seen = {}
+        object val, parsed
+
+    for i in range(n):
+        val = values[i]
+        if not isinstance(val, basestring):
+            if util._checknull(val) or val is NaT:
+                result[i] = iNaT
+                continue
+            return None
+
+        parsed = seen.get(val)
+        if parsed is None:
+            parsed = parse_timedelta_string(val, unit)
+            seen[val] = parsed
+        result[i] = parsed
+
+    return result
+
+
 def repr_timedelta64(object value):
    """ provide repr for timedelta64 """
 
@@ -1369,9 +1555,9 @@ except:
 
 def tz_convert(ndarray[int64_t] vals, object tz1, object tz2):
     cdef:
-        ndarray[int64_t] utc_dates, result, trans, deltas
-        Py_ssize_t i, pos, n = len(vals)
-        int64_t v, offset
+        ndarray[int64_t] utc_dates, result
+        Py_ssize_t i, n = len(vals)
+        int64_t v
         pandas_datetimestruct dts
 
     if not have_pytz:
@@ -1380,8 +1566,8 @@ def tz_convert(ndarray[int64_t] vals, object tz1, object tz2):
     # Convert to UTC
 
     if _get_zone(tz1) != 'UTC':
-        utc_dates = np.empty(n, dtype=np.int64)
         if _is_tzlocal(tz1):
+            utc_dates = np.empty(n, dtype=np.int64)
             for i in range(n):
                 v = vals[i]
                 pandas_datetime_to_datetimestruct(v, PANDAS_FR_ns, &dts)
@@ -1391,27 +1577,15 @@ def tz_convert(ndarray[int64_t] vals, object tz1, object tz2):
                          * 1000000000)
                 utc_dates[i] = v - delta
         else:
-            deltas = _get_deltas(tz1)
-            trans = _get_transitions(tz1)
-            pos = trans.searchsorted(vals[0]) - 1
-            if pos < 0:
-                raise ValueError('First time before start of DST info')
-
-            offset = deltas[pos]
-            for i in range(n):
-                v = vals[i]
-                if v >= [pos + 1]:
-                    pos += 1
-                    offset = deltas[pos]
-                utc_dates[i] = v - offset
+            utc_dates = _shift_by_utcoffsets(vals, tz1, -1)
     else:
         utc_dates = vals
 
     if _get_zone(tz2) == 'UTC':
         return utc_dates
 
-    result = np.empty(n, dtype=np.int64)
     if _is_tzlocal(tz2):
+        result = np.empty(n, dtype=np.int64)
         for i in range(n):
             v = utc_dates[i]
             pandas_datetime_to_datetimestruct(v, PANDAS_FR_ns, &dts)
@@ -1419,31 +1593,68 @@ def tz_convert(ndarray[int64_t] vals, object tz1, object tz2):
                           dts.min, dts.sec, dts.us, tz2)
             delta = int(total_seconds(_get_utcoffset(tz2, dt))) * 1000000000
             result[i] = v + delta
-            return result
+        return result
 
     # Convert UTC to other timezone
-    trans = _get_transitions(tz2)
-    deltas = _get_deltas(tz2)
-    pos = trans.searchsorted(utc_dates[0])
-    if pos == 0:
+    return _shift_by_utcoffsets(utc_dates, tz2, 1)
+
+
+cdef ndarray _shift_by_utcoffsets(ndarray[int64_t] vals, object tz, int sign):
+    """
+    vals plus sign times the utc offset of tz in effect at each of them,
+    found with a single searchsorted on the transition table. NaT is left
+    alone and the values need not be sorted
+    """
+    cdef:
+        ndarray[int64_t] trans, deltas, pos, result
+        Py_ssize_t bad, n = len(vals)
+        int64_t *vdata
+        int64_t *pdata = NULL
+        int64_t *ddata
+        int64_t *rdata
+
+    trans, deltas = _get_dst_info(tz)[:2]
+
+    vals = np.ascontiguousarray(vals)
+    result = np.empty(n, dtype=np.int64)
+
+    # a fixed offset needs no lookup at all
+    if len(trans) > 1:
+        pos = _ensure_int64(trans.searchsorted(vals, side='right') - 1)
+        pdata = <int64_t*> pos.data
+
+    vdata = <int64_t*> vals.data
+    ddata = <int64_t*> deltas.data
+    rdata = <int64_t*> result.data
+    with nogil:
+        bad = _shift_by_positions(vdata, pdata, n, ddata, sign, rdata)
+    if bad >= 0:
         raise ValueError('First time before start of DST info')
-    elif pos == len(trans):
-        return utc_dates + deltas[-1]
 
-    # TODO: this assumed sortedness :/
-    pos -= 1
+    return result
 
-    offset = deltas[pos]
-    cdef Py_ssize_t trans_len = len(trans)
+
+cdef Py_ssize_t _shift_by_positions(int64_t *vals, int64_t *pos, Py_ssize_t n,
+                                    int64_t *deltas, int64_t sign,
+                                    int64_t *out) nogil:
+    """
+    out = vals + sign * deltas[pos] (deltas[0] when pos is NULL), returning
+    the position of the first value before the start of the table, or -1
+    """
+    cdef:
+        Py_ssize_t i, k = 0
 
     for i in range(n):
-        v = utc_dates[i]
-        if (pos + 1) < trans_len and v >= trans[pos + 1]:
-            pos += 1
-            offset = deltas[pos]
-        result[i] = v + offset
+        if vals[i] == NPY_NAT:
+            out[i] = NPY_NAT
+            continue
+        if pos != NULL:
+            k = pos[i]
+            if k < 0:
+                return i
+        out[i] = vals[i] + sign * deltas[k]
 
-    return result
+    return -1
 
 def tz_convert_single(int64_t val, object tz1, object tz2):
     cdef:
@@ -1492,53 +1703,88 @@ def tz_convert_single(int64_t val, object tz1, object tz2):
     return utc_date + offset
 
 
-trans_cache = {}
-utc_offset_cache = {}
+# compiled transition tables, keyed by zone name for pytz zones (whose
+# localized instances all share one table) and by the tzinfo otherwise
+dst_cache = LRUCache(maxsize=128)
 
-def _get_transitions(tz):
+cdef object _tz_cache_key(object tz):
     """
-    Get UTC times of DST transitions
+    The key of tz in dst_cache, None if it can not be cached
     """
+    if hasattr(tz, '_utc_transition_times') and getattr(tz, 'zone', None):
+        return tz.zone
+
     try:
         # tzoffset not hashable in Python 3
         hash(tz)
     except TypeError:
-        return np.array([NPY_NAT + 1], dtype=np.int64)
+        return None
+    return tz
 
-    if tz not in trans_cache:
-        if hasattr(tz, '_utc_transition_times'):
-            arr = np.array(tz._utc_transition_times, dtype='M8[ns]')
-            arr = arr.view('i8')
-            try:
-                if tz._utc_transition_times[0].year == 1:
-                    arr[0] = NPY_NAT + 1
-            except Exception:
-                pass
-        else:
-            arr = np.array([NPY_NAT + 1], dtype=np.int64)
-        trans_cache[tz] = arr
-    return trans_cache[tz]
-
-def _get_deltas(tz):
+def _get_dst_info(tz):
     """
-    Get UTC offsets in microseconds corresponding to DST transitions
+    Get the transition table of tz, a tuple of int64 arrays: the UTC times
+    of the DST transitions, the UTC offsets in nanoseconds from each of
+    them on, and the [start, end) bounds in local wall time of each offset
     """
-    try:
-        # tzoffset not hashable in Python 3
-        hash(tz)
-    except TypeError:
+    key = _tz_cache_key(tz)
+    if key is None:
+        return _compile_dst_info(tz)
+
+    info = dst_cache.get(key)
+    if info is None:
+        info = _compile_dst_info(tz)
+        dst_cache[key] = info
+    return info
+
+cdef tuple _compile_dst_info(object tz):
+    cdef:
+        ndarray[int64_t] trans, deltas, starts, ends
+        Py_ssize_t n
+
+    if hasattr(tz, '_utc_transition_times'):
+        trans = np.array(tz._utc_transition_times, dtype='M8[ns]').view('i8')
+        try:
+            if tz._utc_transition_times[0].year == 1:
+                trans[0] = NPY_NAT + 1
+        except Exception:
+            pass
+        deltas = _unbox_utcoffsets(tz._transition_info)
+    else:
+        # static tzinfo
+        trans = np.array([NPY_NAT + 1], dtype=np.int64)
         num = int(total_seconds(_get_utcoffset(tz, None))) * 1000000000
-        return np.array([num], dtype=np.int64)
+        deltas = np.array([num], dtype=np.int64)
+
+    # offset k is the one of the wall times in [trans[k] + deltas[k],
+    # trans[k + 1] + deltas[k]); the first offset extends to the past and
+    # the last one to the future. A wall time in two of these is ambiguous
+    # and one in none of them does not exist
+    n = len(trans)
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    starts[0] = NPY_NAT + 1
+    starts[1:] = trans[1:] + deltas[1:]
+    ends[:n - 1] = trans[1:] + deltas[:n - 1]
+    ends[n - 1] = _INT64_MAX
+
+    # guard the searchsorted against zones shifting by more than the time
+    # between two transitions
+    starts = np.maximum.accumulate(starts)
+
+    return trans, deltas, starts, ends
 
-    if tz not in utc_offset_cache:
-        if hasattr(tz, '_utc_transition_times'):
-            utc_offset_cache[tz] = _unbox_utcoffsets(tz._transition_info)
-        else:
-            # static tzinfo
-            num = int(total_seconds(_get_utcoffset(tz, None))) * 1000000000
-            utc_offset_cache[tz] = np.array([num], dtype=np.int64)
+def _get_transitions(tz):
+    """
+    Get UTC times of DST transitions
+    """
+    return _get_dst_info(tz)[0]
 
-    return utc_offset_cache[tz]
+def _get_deltas(tz):
+    """
+    Get UTC offsets in nanoseconds corresponding to DST transitions
+    """
+    return _get_dst_info(tz)[1]
 
 cdef double total_seconds(object td): # Python 2.6 compat
     return ((td.microseconds + (td.seconds + td.days * 24 * 3600) * 10**6) //
@@ -1573,11 +1819,16 @@ def tz_localize_to_utc(ndarray[int64_t] vals, object tz):
     localized : DatetimeIndex
     """
     cdef:
-        ndarray[int64_t] trans, deltas, idx_shifted
-        Py_ssize_t i, idx, pos, ntrans, n = len(vals)
-        int64_t *tdata
-        int64_t v, left, right
-        ndarray[int64_t] result, result_a, result_b
+        ndarray[int64_t] deltas, starts, ends, pos
+        Py_ssize_t i, bad, n = len(vals)
+        int64_t *vdata
+        int64_t *pdata = NULL
+        int64_t *ddata
+        int64_t *edata
+        int64_t *rdata
+        int64_t v
+        bint ambiguous = False
+        ndarray[int64_t] result
         pandas_datetimestruct dts
 
     # Vectorized version of DstTzInfo.localize
@@ -1600,59 +1851,66 @@ def tz_localize_to_utc(ndarray[int64_t] vals, object tz):
             result[i] = v - delta
         return result
 
-    trans = _get_transitions(tz)  # transition dates
-    deltas = _get_deltas(tz)      # utc offsets
+    _, deltas, starts, ends = _get_dst_info(tz)
+
+    vals = np.ascontiguousarray(vals)
+
+    # the last offset whose wall times start at or before each value; a
+    # fixed offset needs no lookup at all
+    if len(starts) > 1:
+        pos = _ensure_int64(starts.searchsorted(vals, side='right') - 1)
+        pdata = <int64_t*> pos.data
+
+    vdata = <int64_t*> vals.data
+    ddata = <int64_t*> deltas.data
+    edata = <int64_t*> ends.data
+    rdata = <int64_t*> result.data
+    with nogil:
+        bad = _localize_by_table(vdata, pdata, n, ddata, edata, rdata,
+                                 &ambiguous)
+    if bad >= 0:
+        stamp = Timestamp(vals[bad])
+        if ambiguous:
+            raise pytz.AmbiguousTimeError(stamp)
+        raise pytz.NonExistentTimeError(stamp)
 
-    tdata = <int64_t*> trans.data
-    ntrans = len(trans)
+    return result
 
-    result_a = np.empty(n, dtype=np.int64)
-    result_b = np.empty(n, dtype=np.int64)
-    result_a.fill(NPY_NAT)
-    result_b.fill(NPY_NAT)
 
-    # left side
-    idx_shifted = _ensure_int64(
-        np.maximum(0, trans.searchsorted(vals - DAY_NS, side='right') - 1))
+cdef Py_ssize_t _localize_by_table(int64_t *vals, int64_t *pos, Py_ssize_t n,
+                                   int64_t *deltas, int64_t *ends,
+                                   int64_t *out, bint *ambiguous) nogil:
+    """
+    The utc stamps of the wall times vals, given the offset pos (0 when
+    NULL) starting at or before each of them. Returns the position of the
+    first ambiguous or non-existent time, or -1
+    """
+    cdef:
+        Py_ssize_t i, k = 0
+        int64_t v
 
     for i in range(n):
-        v = vals[i] - deltas[idx_shifted[i]]
-        pos = bisect_right_i8(tdata, v, ntrans) - 1
+        v = vals[i]
+        if v == NPY_NAT:
+            out[i] = NPY_NAT
+            continue
 
-        # timestamp falls to the left side of the DST transition
-        if v + deltas[pos] == vals[i]:
-            result_a[i] = v
+        if pos != NULL:
+            k = pos[i]
 
-    # right side
-    idx_shifted = _ensure_int64(
-        np.maximum(0, trans.searchsorted(vals + DAY_NS, side='right') - 1))
+            # in the gap of a spring forward transition
+            if k < 0 or v >= ends[k]:
+                ambiguous[0] = False
+                return i
 
-    for i in range(n):
-        v = vals[i] - deltas[idx_shifted[i]]
-        pos = bisect_right_i8(tdata, v, ntrans) - 1
+            # still covered by the previous offset as well
+            if k > 0 and v < ends[k - 1]:
+                ambiguous[0] = True
+                return i
 
-        # timestamp falls to the right side of the DST transition
-        if v + deltas[pos] == vals[i]:
-            result_b[i] = v
+        out[i] = v - deltas[k]
 
-    for i in range(n):
-        left = result_a[i]
-        right = result_b[i]
-        if left != NPY_NAT and right != NPY_NAT:
-            if left == right:
-                result[i] = left
-            else:
-                stamp = Timestamp(vals[i])
-                raise pytz.AmbiguousTimeError(stamp)
-        elif left != NPY_NAT:
-            result[i] = left
-        elif right != NPY_NAT:
-            result[i] = right
-        else:
-            stamp = Timestamp(vals[i])
-            raise pytz.NonExistentTimeError(stamp)
-
-    return result
+    return -1
 
 cdef _ensure_int64(object arr):
     if util.is_array(arr):
@@ -1664,41 +1922,16 @@ cdef _ensure_int64(object arr):
         return np.array(arr, dtype=np.int64)
 
 
-cdef inline bisect_right_i8(int64_t *data, int64_t val, Py_ssize_t n):
-    cdef Py_ssize_t pivot, left = 0, right = n
-
-    # edge cases
-    if val > data[n - 1]:
-        return n
-
-    if val < data[0]:
-        return 0
-
-    while left < right:
-        pivot = left + (right - left) // 2
-
-        if data[pivot] <= val:
-            left = pivot + 1
-        else:
-            right = pivot
-
-    return left
-
-
 # Accessors
 #----------------------------------------------------------------------
 
-def build_field_sarray(ndarray[int64_t] dtindex):
+def build_field_sarray(ndarray[int64_t] dtindex, int nthreads=1):
     '''
     Datetime as int64 representation to a structured array of fields
     '''
     cdef:
-        Py_ssize_t i, count = 0
-        int isleap
-        pandas_datetimestruct dts
-        ndarray[int32_t] years, months, days, hours, minutes, seconds, mus
-
-    count = len(dtindex)
+        ndarray[int64_t] values
+        ndarray[int32_t, ndim=2] fields
 
     sa_dtype = [('Y', 'i4'), # year
                 ('M', 'i4'), # month
@@ -1708,27 +1941,33 @@ def build_field_sarray(ndarray[int64_t] dtindex):
                 ('s', 'i4'), # second
                 ('u', 'i4')] # microsecond
 
-    out = np.empty(count, dtype=sa_dtype)
+    # one row of the seven fields per stamp, which is the memory layout of
+    # the structured array
+    values = np.ascontiguousarray(dtindex)
+    fields = np.empty((len(values), 7), dtype=np.int32)
+    _run_chunked(_field_sarray_chunk, len(values), nthreads, (values, fields))
 
-    years = out['Y']
-    months = out['M']
-    days = out['D']
-    hours = out['h']
-    minutes = out['m']
-    seconds = out['s']
-    mus = out['u']
+    return fields.view(sa_dtype).reshape(len(values))
 
-    for i in range(count):
-        pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-        years[i] = dts.year
-        months[i] = dts.month
-        days[i] = dts.day
-        hours[i] = dts.hour
-        minutes[i] = dts.min
-        seconds[i] = dts.sec
-        mus[i] = dts.us
 
-    return out
+def _field_sarray_chunk(ndarray values, ndarray fields,
+                        Py_ssize_t start, Py_ssize_t end):
+    cdef:
+        Py_ssize_t i
+        int64_t *stamps = <int64_t*> values.data
+        int32_t *out = <int32_t*> fields.data
+        pandas_datetimestruct dts
+
+    with nogil:
+        for i in range(start, end):
+            pandas_datetime_to_datetimestruct(stamps[i], PANDAS_FR_ns, &dts)
+            out[7 * i] = dts.year
+            out[7 * i + 1] = dts.month
+            out[7 * i + 2] = dts.day
+            out[7 * i + 3] = dts.hour
+            out[7 * i + 4] = dts.min
+            out[7 * i + 5] = dts.sec
+            out[7 * i + 6] = dts.us
 
 def get_time_micros(ndarray[int64_t] dtindex):
     '''
@@ -1748,119 +1987,84 @@ def get_time_micros(ndarray[int64_t] dtindex):
 
     return micros
 
+# codes of the fields get_date_field can extract
+cdef dict _date_field_codes = {
+    'Y': 0, 'M': 1, 'D': 2, 'h': 3, 'm': 4, 's': 5, 'us': 6, 'ns': 7,
+    'doy': 8, 'dow': 9, 'woy': 10, 'q': 11, 'dim': 12, 'fbd': 13, 'lbd': 14}
+
 @cython.wraparound(False)
-def get_date_field(ndarray[int64_t] dtindex, object field):
+def get_date_field(ndarray[int64_t] dtindex, object field, int nthreads=1):
     '''
     Given a int64-based datetime index, extract the year, month, etc.,
-    field and return an array of these values.
+    field and return an array of these values. The extraction runs without
+    the GIL; with nthreads > 1 a large array is split between that many
+    threads.
     '''
     cdef:
-        _TSObject ts
-        Py_ssize_t i, count = 0
+        ndarray[int64_t] values
         ndarray[int32_t] out
-        ndarray[int32_t, ndim=2] _month_offset
-        int isleap, isleap_prev
-        pandas_datetimestruct dts
-        int mo_off, doy, dow, woy
 
-    _month_offset = np.array(
-        [[ 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365 ],
-         [ 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366 ]],
-         dtype=np.int32 )
+    if field not in _date_field_codes:
+        raise ValueError("Field %s not supported" % field)
 
-    count = len(dtindex)
-    out = np.empty(count, dtype='i4')
+    values = np.ascontiguousarray(dtindex)
+    out = np.empty(len(values), dtype='i4')
+    _run_chunked(_date_field_chunk, len(values), nthreads,
+                 (values, out, _date_field_codes[field]))
+    return out
 
-    if field == 'Y':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
 
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            out[i] = dts.year
-        return out
+def _date_field_chunk(ndarray values, ndarray out, int code,
+                      Py_ssize_t start, Py_ssize_t end):
+    cdef:
+        int64_t *stamps = <int64_t*> values.data
+        int32_t *fields = <int32_t*> out.data
 
-    elif field == 'M':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
+    with nogil:
+        _date_field(stamps, fields, code, start, end)
 
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            out[i] = dts.month
-        return out
 
-    elif field == 'D':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
+@cython.cdivision(True)
+cdef void _date_field(int64_t *dtindex, int32_t *out, int code,
+                      Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef:
+        Py_ssize_t i
+        int isleap, isleap_prev
+        pandas_datetimestruct dts
+        int doy, dow, woy
 
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            out[i] = dts.day
-        return out
+    for i in range(start, end):
+        if dtindex[i] == NPY_NAT:
+            out[i] = -1
+            continue
 
-    elif field == 'h':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
+        pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
 
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        if code == 0:
+            out[i] = dts.year
+        elif code == 1:
+            out[i] = dts.month
+        elif code == 2:
+            out[i] = dts.day
+        elif code == 3:
             out[i] = dts.hour
-        return out
-
-    elif field == 'm':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        elif code == 4:
             out[i] = dts.min
-        return out
-
-    elif field == 's':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        elif code == 5:
             out[i] = dts.sec
-        return out
-
-    elif field == 'us':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        elif code == 6:
             out[i] = dts.us
-        return out
-    elif field == 'ns':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        elif code == 7:
             out[i] = dts.ps / 1000
-        return out
-    elif field == 'doy':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            isleap = is_leapyear(dts.year)
-            out[i] = _month_offset[isleap, dts.month-1] + dts.day
-        return out
-
-    elif field == 'dow':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            ts = convert_to_tsobject(dtindex[i], None, None)
-            out[i] = ts_dayofweek(ts)
-        return out
-
-    elif field == 'woy':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
-
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            ts = convert_to_tsobject(dtindex[i], None, None)
+        elif code == 8:
+            out[i] = _day_of_year(&dts)
+        elif code == 9:
+            out[i] = dayofweek(dts.year, dts.month, dts.day)
+        elif code == 10:
             isleap = is_leapyear(dts.year)
             isleap_prev = is_leapyear(dts.year - 1)
-            mo_off = _month_offset[isleap, dts.month - 1]
-            doy = mo_off + dts.day
-            dow = ts_dayofweek(ts)
+            doy = _day_of_year(&dts)
+            dow = dayofweek(dts.year, dts.month, dts.day)
 
             #estimate
             woy = (doy - 1) - dow + 3
@@ -1878,18 +2082,62 @@ def get_date_field(ndarray[int64_t] dtindex, object field):
                     woy = 1
 
             out[i] = woy
-        return out
+        elif code == 11:
+            out[i] = (dts.month - 1) / 3 + 1
+        elif code == 12:
+            out[i] = days_per_month_table[is_leapyear(dts.year)][dts.month - 1]
+        elif code == 13:
+            out[i] = _first_bday(dts.year, dts.month)
+        else:
+            out[i] = _last_bday(dts.year, dts.month)
 
-    elif field == 'q':
-        for i in range(count):
-            if dtindex[i] == NPY_NAT: out[i] = -1; continue
 
-            pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
-            out[i] = dts.month
-            out[i] = ((out[i] - 1) / 3) + 1
-        return out
+cdef inline int _day_of_year(pandas_datetimestruct *dts) nogil:
+    cdef:
+        int k, isleap = is_leapyear(dts.year)
+        int doy = dts.day
+
+    for k in range(dts.month - 1):
+        doy += days_per_month_table[isleap][k]
+    return doy
+
 
-    raise ValueError("Field %s not supported" % field)
+# chunks smaller than this are not worth handing to a thread
+cdef Py_ssize_t _min_thread_chunk = 1 << 16
+
+def _run_chunked(object kernel, Py_ssize_t n, int nthreads, tuple args,
+                 Py_ssize_t size=-1):
+    """
+    Call kernel(*args, start, end) over the range [0, n), split into
+    nthreads chunks run on a thread pool when the number of values the
+    kernel processes (size, n by default) is large enough. The kernels
+    release the GIL, so the chunks run in parallel
+    """
+    cdef Py_ssize_t step
+
+    if size < 0:
+        size = n
+    nthreads = min(nthreads, n, size // _min_thread_chunk)
+    if nthreads <= 1:
+        kernel(*(args + (0, n)))
+        return
+
+    from multiprocessing.pool import ThreadPool
+
+    step = (n + nthreads - 1) // nthreads
+    jobs = [(kernel, args, start, min(start + step, n))
+            for start in range(0, n, step)]
+
+    pool = ThreadPool(nthreads)
+    try:
+        pool.map(_run_chunk, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+def _run_chunk(job):
+    kernel, args, start, end = job
+    kernel(*(args + (start, end)))
 
 
 cdef inline int m8_weekday(int64_t val):
@@ -1897,14 +2145,14 @@ cdef inline int m8_weekday(int64_t val):
     return ts_dayofweek(ts)
 
 cdef int64_t DAY_NS = 86400000000000LL
+cdef int64_t _INT64_MAX = 9223372036854775807LL
 
 
-def date_normalize(ndarray[int64_t] stamps, tz=None):
+def date_normalize(ndarray[int64_t] stamps, tz=None, int nthreads=1):
     cdef:
-        Py_ssize_t i, n = len(stamps)
-        pandas_datetimestruct dts
+        Py_ssize_t n = len(stamps)
         _TSObject tso
-        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] result
 
     if tz is not None:
         tso = _TSObject()
@@ -1912,15 +2160,29 @@ def date_normalize(ndarray[int64_t] stamps, tz=None):
             tz = pytz.timezone(tz)
         result = _normalize_local(stamps, tz)
     else:
-        for i in range(n):
-            if stamps[i] == NPY_NAT:
-                result[i] = NPY_NAT
-                continue
-            pandas_datetime_to_datetimestruct(stamps[i], PANDAS_FR_ns, &dts)
-            result[i] = _normalized_stamp(&dts)
+        stamps = np.ascontiguousarray(stamps)
+        result = np.empty(n, dtype=np.int64)
+        _run_chunked(_normalize_chunk, n, nthreads, (stamps, result))
 
     return result
 
+
+def _normalize_chunk(ndarray stamps, ndarray result,
+                     Py_ssize_t start, Py_ssize_t end):
+    cdef:
+        Py_ssize_t i
+        int64_t *values = <int64_t*> stamps.data
+        int64_t *out = <int64_t*> result.data
+        pandas_datetimestruct dts
+
+    with nogil:
+        for i in range(start, end):
+            if values[i] == NPY_NAT:
+                out[i] = NPY_NAT
+                continue
+            pandas_datetime_to_datetimestruct(values[i], PANDAS_FR_ns, &dts)
+            out[i] = _normalized_stamp(&dts)
+
 cdef _normalize_local(ndarray[int64_t] stamps, object tz):
     cdef:
         Py_ssize_t n = len(stamps)
@@ -1977,7 +2239,7 @@ cdef _normalize_local(ndarray[int64_t] stamps, object tz):
 
     return result
 
-cdef inline int64_t _normalized_stamp(pandas_datetimestruct *dts):
+cdef inline int64_t _normalized_stamp(pandas_datetimestruct *dts) nogil:
     dts.hour = 0
     dts.min = 0
     dts.sec = 0
@@ -2028,6 +2290,249 @@ def dates_normalized(ndarray[int64_t] stamps, tz=None):
 
     return True
 
+
+#----------------------------------------------------------------------
+# Vectorized offsets
+
+cdef inline int _first_bday(int64_t year, int month) nogil:
+    """ day of the first weekday of the month """
+    cdef int wkday = dayofweek(year, month, 1)
+    if wkday == 5:
+        return 3
+    elif wkday == 6:
+        return 2
+    return 1
+
+cdef inline int _last_bday(int64_t year, int month) nogil:
+    """ day of the last weekday of the month """
+    cdef:
+        int days = days_per_month_table[is_leapyear(year)][month - 1]
+        int wkday = dayofweek(year, month, days)
+    if wkday > 4:
+        return days - (wkday - 4)
+    return days
+
+
+def shift_months(ndarray[int64_t] dtindex, ndarray[int64_t] months,
+                 object day=None):
+    """
+    Shift each stamp by the matching number of months, keeping the time of
+    day. day is None to keep the day of month (clipped to the end of the
+    target month), or one of 'start', 'end', 'business_start' and
+    'business_end' to anchor the result in the target month
+    """
+    cdef:
+        Py_ssize_t i, n = len(dtindex)
+        pandas_datetimestruct dts
+        int64_t total
+        int mode, dim
+        ndarray[int64_t] out = np.empty(n, dtype=np.int64)
+
+    if len(months) != n:
+        raise ValueError('months must be the same length as dtindex')
+
+    if day is None:
+        mode = 0
+    elif day == 'start':
+        mode = 1
+    elif day == 'end':
+        mode = 2
+    elif day == 'business_start':
+        mode = 3
+    elif day == 'business_end':
+        mode = 4
+    else:
+        raise ValueError('Invalid day anchor: %s' % day)
+
+    for i in range(n):
+        if dtindex[i] == NPY_NAT:
+            out[i] = NPY_NAT
+            continue
+
+        pandas_datetime_to_datetimestruct(dtindex[i], PANDAS_FR_ns, &dts)
+        total = dts.year * 12 + dts.month - 1 + months[i]
+        dts.year = total // 12
+        dts.month = total % 12 + 1
+
+        if mode == 0:
+            dim = days_per_month_table[is_leapyear(dts.year)][dts.month - 1]
+            if dts.day > dim:
+                dts.day = dim
+        elif mode == 1:
+            dts.day = 1
+        elif mode == 2:
+            dts.day = days_per_month_table[is_leapyear(dts.year)][dts.month - 1]
+        elif mode == 3:
+            dts.day = _first_bday(dts.year, dts.month)
+        else:
+            dts.day = _last_bday(dts.year, dts.month)
+
+        out[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    return out
+
+
+def shift_bdays(ndarray[int64_t] dtindex, int64_t n):
+    """
+    Shift each stamp by n business days, keeping the time of day. A stamp
+    on a weekend counts as its following Monday, as in BusinessDay.apply
+    """
+    cdef:
+        Py_ssize_t i, count = len(dtindex)
+        int64_t val, k, q, shift, step, wkday
+        ndarray[int64_t] out = np.empty(count, dtype=np.int64)
+
+    for i in range(count):
+        val = dtindex[i]
+        if val == NPY_NAT:
+            out[i] = NPY_NAT
+            continue
+
+        # 1970-01-01 was a Thursday
+        wkday = (val // DAY_NS + 3) % 7
+        k = n
+        shift = 0
+
+        if k == 0 and wkday > 4:
+            k = 1
+
+        if k > 5 or k < -5:
+            q = k // 5
+            shift = 7 * q
+            if k < 0 and wkday > 4:
+                k += 1
+            k -= 5 * q
+
+        while k != 0:
+            step = 1 if k > 0 else -1
+            shift += step
+            wkday = (wkday + step) % 7
+            if wkday < 5:
+                k -= step
+
+        out[i] = val + shift * DAY_NS
+
+    return out
+
+#----------------------------------------------------------------------
+# Array formatting
+
+# strftime directives filled in by format_array_from_datetime, with the
+# %-format of their value
+cdef dict _array_strftime_fields = {
+    'Y': '%d', 'y': '%.2d', 'm': '%.2d', 'd': '%.2d',
+    'H': '%.2d', 'M': '%.2d', 'S': '%.2d', 'f': '%.6d'}
+
+
+cdef object _compile_strftime(object format):
+    """
+    Translate a strftime format into a %-template and the fields it is
+    filled with, or None if it uses other directives
+    """
+    cdef:
+        Py_ssize_t i = 0, n = len(format)
+        list template = [], fields = []
+
+    while i < n:
+        c = format[i]
+        if c == '%':
+            if i + 1 == n:
+                return None
+            d = format[i + 1]
+            if d == '%':
+                template.append('%%')
+            elif d in _array_strftime_fields:
+                template.append(_array_strftime_fields[d])
+                fields.append(d)
+            else:
+                return None
+            i += 2
+        else:
+            template.append(c)
+            i += 1
+
+    return ''.join(template), fields
+
+
+cdef inline object _dts_field(pandas_datetimestruct *dts, object field):
+    if field == 'Y':
+        return dts.year
+    elif field == 'y':
+        return dts.year % 100
+    elif field == 'm':
+        return dts.month
+    elif field == 'd':
+        return dts.day
+    elif field == 'H':
+        return dts.hour
+    elif field == 'M':
+        return dts.min
+    elif field == 'S':
+        return dts.sec
+    return dts.us
+
+
+def format_array_from_datetime(ndarray[int64_t] values, object format=None,
+                               object na_rep='NaT'):
+    """
+    Format datetime64[ns] stamps as strings without boxing them, NaT as
+    na_rep. format None gives 'YYYY-MM-DD HH:MM:SS' with the fraction of
+    a second if there is one (as Timestamp._repr_base), otherwise it is a
+    strftime format. Returns None for a format using directives other than
+    %Y %y %m %d %H %M %S %f
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        pandas_datetimestruct dts
+        char buf[64]
+        int mode
+        object compiled, template
+        list fields
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    if format is None:
+        mode = 0
+    elif format == '%Y-%m-%d':
+        mode = 1
+    else:
+        compiled = _compile_strftime(format)
+        if compiled is None:
+            return None
+        template, fields = compiled
+        mode = 2
+
+    for i in range(n):
+        if values[i] == NPY_NAT:
+            result[i] = na_rep
+            continue
+
+        pandas_datetime_to_datetimestruct(values[i], PANDAS_FR_ns, &dts)
+
+        if mode == 0:
+            if dts.ps != 0:
+                sprintf(buf, "%d-%.2d-%.2d %.2d:%.2d:%.2d.%.9d",
+                        <int> dts.year, dts.month, dts.day, dts.hour,
+                        dts.min, dts.sec, <int> (dts.us * 1000 + dts.ps / 1000))
+            elif dts.us != 0:
+                sprintf(buf, "%d-%.2d-%.2d %.2d:%.2d:%.2d.%.6d",
+                        <int> dts.year, dts.month, dts.day, dts.hour,
+                        dts.min, dts.sec, <int> dts.us)
+            else:
+                sprintf(buf, "%d-%.2d-%.2d %.2d:%.2d:%.2d",
+                        <int> dts.year, dts.month, dts.day, dts.hour,
+                        dts.min, dts.sec)
+            result[i] = util.char_to_string(buf)
+        elif mode == 1:
+            sprintf(buf, "%d-%.2d-%.2d", <int> dts.year, dts.month, dts.day)
+            result[i] = util.char_to_string(buf)
+        else:
+            result[i] = template % tuple([_dts_field(&dts, f)
+                                          for f in fields])
+
+    return result
+
+
+#----------------------------------------------------------------------
 # Some general helper functions
 #----------------------------------------------------------------------
 
@@ -2159,7 +2664,16 @@ cdef extern from "period.h":
 
     ctypedef int64_t (*freq_conv_func)(int64_t, char, asfreq_info*)
 
+    ctypedef struct asfreq_plan:
+        freq_conv_func func
+        asfreq_info af_info
+        char relation
+
     int64_t asfreq(int64_t dtordinal, int freq1, int freq2, char relation) except INT32_MIN
+    void get_asfreq_plan(int fromFreq, int toFreq, char relation,
+                         asfreq_plan *plan)
+    Py_ssize_t asfreq_array(int64_t *ordinals, int64_t *out, Py_ssize_t n,
+                            asfreq_plan *plan) nogil
     freq_conv_func get_asfreq_func(int fromFreq, int toFreq)
     void get_asfreq_info(int fromFreq, int toFreq, asfreq_info *af_info)
 
@@ -2242,6 +2756,10 @@ def periodarr_to_dt64arr(ndarray[int64_t] periodarr, int freq):
         ndarray[int64_t] out
         Py_ssize_t i, l
 
+    # daily and intraday ordinals count whole units from the epoch
+    if freq in _period_unit_nanos:
+        return periodarr * _period_unit_nanos[freq]
+
     l = len(periodarr)
 
     out = np.empty(l, dtype='i8')
@@ -2251,6 +2769,13 @@ def periodarr_to_dt64arr(ndarray[int64_t] periodarr, int freq):
 
     return out
 
+_period_unit_nanos = {
+    6000: 86400000000000, # FR_DAY
+    7000: 3600000000000,  # FR_HR
+    8000: 60000000000,    # FR_MIN
+    9000: 1000000000,     # FR_SEC
+}
+
 cdef char START = 'S'
 cdef char END = 'E'
 
@@ -2280,28 +2805,39 @@ def period_asfreq_arr(ndarray[int64_t] arr, int freq1, int freq2, bint end):
     """
     cdef:
         ndarray[int64_t] result
-        Py_ssize_t i, n
-        freq_conv_func func
-        asfreq_info finfo
-        int64_t val, ordinal
+        Py_ssize_t bad, n
+        asfreq_plan plan
+        int64_t val, converted
+        int64_t *adata
+        int64_t *rdata
         char relation
 
     n = len(arr)
     result = np.empty(n, dtype=np.int64)
-
-    func = get_asfreq_func(freq1, freq2)
-    get_asfreq_info(freq1, freq2, &finfo)
+    if n == 0:
+        return result
 
     if end:
         relation = END
     else:
         relation = START
 
-    for i in range(n):
-        val = func(arr[i], relation, &finfo)
-        if val == INT32_MIN:
+    get_asfreq_plan(freq1, freq2, relation, &plan)
+
+    # the C routines only report errors (years out of range) through the
+    # Python error state; conversion is monotonic, so once the extremes
+    # convert with the GIL held the rest can do without it
+    for val in (arr.min(), arr.max()):
+        if asfreq_array(&val, &converted, 1, &plan) >= 0:
             raise ValueError("Unable to convert to desired frequency.")
-        result[i] = val
+
+    arr = np.ascontiguousarray(arr)
+    adata = <int64_t*> arr.data
+    rdata = <int64_t*> result.data
+    with nogil:
+        bad = asfreq_array(adata, rdata, n, &plan)
+    if bad >= 0:
+        raise ValueError("Unable to convert to desired frequency.")
 
     return result
 
@@ -2330,37 +2866,70 @@ cpdef int64_t period_ordinal_to_dt64(int64_t ordinal, int freq):
     return pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
 
 def period_format(int64_t value, int freq, object fmt=None):
-    cdef:
-        int freq_group
-
     if fmt is None:
-        freq_group = (freq // 1000) * 1000
-        if freq_group == 1000: # FR_ANN
-            fmt = b'%Y'
-        elif freq_group == 2000: # FR_QTR
-            fmt = b'%FQ%q'
-        elif freq_group == 3000: # FR_MTH
-            fmt = b'%Y-%m'
-        elif freq_group == 4000: # WK
+        if (freq // 1000) * 1000 == 4000: # WK
             left = period_asfreq(value, freq, 6000, 0)
             right = period_asfreq(value, freq, 6000, 1)
             return '%s/%s' % (period_format(left, 6000),
                               period_format(right, 6000))
-        elif (freq_group == 5000 # BUS
-              or freq_group == 6000): # DAY
-            fmt = b'%Y-%m-%d'
-        elif freq_group == 7000: # HR
-            fmt = b'%Y-%m-%d %H:00'
-        elif freq_group == 8000: # MIN
-            fmt = b'%Y-%m-%d %H:%M'
-        elif freq_group == 9000: # SEC
-            fmt = b'%Y-%m-%d %H:%M:%S'
-        else:
-            raise ValueError('Unknown freq: %d' % freq)
+        fmt = _period_default_format(freq)
 
     return _period_strftime(value, freq, fmt)
 
 
+def period_format_array(ndarray[int64_t] values, int freq, object fmt=None,
+                        object na_rep='NaT'):
+    """
+    Format an array of period ordinals, iNaT as na_rep. The format is
+    prepared once for the whole array rather than once per value
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[object] result = np.empty(n, dtype=object)
+        list found_pat
+
+    if fmt is None:
+        if (freq // 1000) * 1000 == 4000: # WK
+            for i in range(n):
+                if values[i] == NPY_NAT:
+                    result[i] = na_rep
+                else:
+                    result[i] = period_format(values[i], freq)
+            return result
+        fmt = _period_default_format(freq)
+
+    fmt, found_pat = _prepare_period_format(fmt)
+    for i in range(n):
+        if values[i] == NPY_NAT:
+            result[i] = na_rep
+        else:
+            result[i] = _format_period(values[i], freq, fmt, found_pat)
+
+    return result
+
+
+cdef object _period_default_format(int freq):
+    cdef int freq_group = (freq // 1000) * 1000
+
+    if freq_group == 1000: # FR_ANN
+        return b'%Y'
+    elif freq_group == 2000: # FR_QTR
+        return b'%FQ%q'
+    elif freq_group == 3000: # FR_MTH
+        return b'%Y-%m'
+    elif (freq_group == 5000 # BUS
+          or freq_group == 6000): # DAY
+        return b'%Y-%m-%d'
+    elif freq_group == 7000: # HR
+        return b'%Y-%m-%d %H:00'
+    elif freq_group == 8000: # MIN
+        return b'%Y-%m-%d %H:%M'
+    elif freq_group == 9000: # SEC
+        return b'%Y-%m-%d %H:%M:%S'
+
+    raise ValueError('Unknown freq: %d' % freq)
+
+
 cdef list extra_fmts = [(b"%q", b"^`AB`^"),
                         (b"%f", b"^`CD`^"),
                         (b"%F", b"^`EF`^")]
@@ -2368,19 +2937,25 @@ cdef list extra_fmts = [(b"%q", b"^`AB`^"),
 cdef list str_extra_fmts = ["^`AB`^", "^`CD`^", "^`EF`^"]
 
 cdef _period_strftime(int64_t value, int freq, object fmt):
-    import sys
+    cdef list found_pat
+
+    fmt, found_pat = _prepare_period_format(fmt)
+    return _format_period(value, freq, fmt, found_pat)
+
+
+cdef object _prepare_period_format(object fmt):
+    """
+    Encode fmt and swap the period-only directives for placeholders,
+    returning the new format and which placeholders it holds
+    """
     cdef:
         Py_ssize_t i
-        date_info dinfo
-        char *formatted
-        object pat, repl, result
+        object pat, repl
         list found_pat = [False] * len(extra_fmts)
-        int year, quarter
 
     if PyUnicode_Check(fmt):
         fmt = fmt.encode('utf-8')
 
-    get_date_info(value, freq, &dinfo)
     for i in range(len(extra_fmts)):
         pat = extra_fmts[i][0]
         repl = extra_fmts[i][1]
@@ -2388,6 +2963,20 @@ cdef _period_strftime(int64_t value, int freq, object fmt):
             fmt = fmt.replace(pat, repl)
             found_pat[i] = True
 
+    return fmt, found_pat
+
+
+cdef object _format_period(int64_t value, int freq, object fmt,
+                           list found_pat):
+    import sys
+    cdef:
+        Py_ssize_t i
+        date_info dinfo
+        char *formatted
+        object repl, result
+        int year, quarter
+
+    get_date_info(value, freq, &dinfo)
     formatted = c_strftime(&dinfo, <char*> fmt)
 
     result = util.char_to_string(formatted)
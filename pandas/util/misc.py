@@ -8,3 +8,56 @@ def is_little_endian():
 def exclusive(*args):
     count = sum([arg is not None for arg in args])
     return count == 1
+
+
+class LRUCache(object):
+    """
+    A bounded mapping that evicts its least recently used entry once more
+    than ``maxsize`` keys are stored
+
+    Parameters
+    ----------
+    maxsize : int, the maximum number of entries to hold
+
+    """
+
+    def __init__(self, maxsize=128):
+        from pandas.compat import OrderedDict
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """ return the value for key (marking it as most recently used),
+        or default if it is not cached """
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data[key] = value
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = value
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key):
+        """ drop the entry for key, if there is one """
+        self._data.pop(key, None)
+
+    def clear(self):
+        """ drop all of the entries and reset the statistics """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
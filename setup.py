@@ -381,7 +381,8 @@ else:
     cmdclass['build_src'] = DummyBuildSrc
     cmdclass['build_ext'] = CheckingBuildExt
 
-lib_depends = ['reduce', 'inference', 'properties']
+lib_depends = ['reduce', 'inference', 'properties', 'writers',
+               'stringarray']
 
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
@@ -416,7 +417,9 @@ libraries = ['m'] if 'win32' not in sys.platform else []
 ext_data = dict(
     lib={'pyxfile': 'lib',
          'pxdfiles': [],
-         'depends': lib_depends},
+         'depends': lib_depends,
+         'sources': ['pandas/src/datetime/np_datetime.c',
+                     'pandas/src/datetime/np_datetime_strings.c']},
     hashtable={'pyxfile': 'hashtable',
                'pxdfiles': ['hashtable']},
     tslib={'pyxfile': 'tslib',